@@ -24,15 +24,7 @@ Key features:
 See DESIGN.md for architecture rationale.
 """
 
-from .providers import (
-    spawn_claude,
-    spawn_codex,
-    spawn_copilot,
-    spawn_grok,
-    spawn_gemini,
-    spawn_mistral,
-    AgentResult
-)
+from .providers import AgentResult
 from .logger import (
     log_spawn_start,
     log_spawn_complete,
@@ -40,6 +32,18 @@ from .logger import (
 )
 from .config import settings
 
+# Agents load on first access (see providers/__init__.py)
+_LAZY_SPAWNS = {"spawn_claude", "spawn_codex", "spawn_copilot", "spawn_grok",
+                "spawn_gemini", "spawn_mistral"}
+
+def __getattr__(name: str):
+    if name in _LAZY_SPAWNS:
+        from . import providers
+        value = getattr(providers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __version__ = "1.8.1"
 __all__ = [
     # CLI Agents
@@ -5,25 +5,98 @@ Singleton class to manage agent state and synchronization.
 Replaces global state and locks with a cleaner encapsulated approach.
 """
 
+import asyncio
+import os
 import threading
-import uuid
-from datetime import datetime, timezone
+import time
+import secrets
 from typing import Dict, Optional, List, Set, Any
-from collections import OrderedDict
+from collections import deque
+from itertools import count, islice
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Upper bound on pool threads unless POWERSPAWN_MAX_WORKERS says otherwise
+DEFAULT_MAX_WORKERS_CAP = 64
+
+# Flatten line breaks/tabs in task previews in one translate pass
+_WHITESPACE_TO_SPACE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+# Agent IDs: random per-process prefix + counter, 8 hex chars as before for
+# the first 65536 spawns, then the counter part just grows, so IDs never
+# repeat within a process. No CSPRNG read per spawn; next() on a count is
+# atomic under the GIL.
+_ID_PREFIX = secrets.token_hex(2)
+_id_counter = count()
+
+
+def _next_agent_id() -> str:
+    return f"{_ID_PREFIX}{next(_id_counter):04x}"
+
+
+def _utc_now_iso() -> str:
+    """UTC timestamp to the second, e.g. 2025-01-01T12:00:00."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+def max_async_spawns() -> int:
+    """Cap on spawns running as tasks on the event loop at once.
+
+    Each one still owns a subprocess or an HTTP connection, so past the cap
+    further spawns queue rather than oversubscribing file descriptors and
+    API rate limits. POWERSPAWN_MAX_CONCURRENCY overrides; the default
+    matches the spawn thread pool (recommended_max_workers). The server's
+    to_thread pool in turn defaults to this cap.
+    """
+    env = os.environ.get("POWERSPAWN_MAX_CONCURRENCY")
+    return max(1, int(env)) if env else recommended_max_workers()
+
+
+def recommended_max_workers() -> int:
+    """Pool size for spawn workers.
+
+    Spawns are I/O-bound (waiting on a CLI subprocess or an HTTP response),
+    so the pool is sized well past the core count: cpu_count * 8, capped at
+    POWERSPAWN_MAX_WORKERS (default 64).
+    """
+    cap = int(os.environ.get("POWERSPAWN_MAX_WORKERS", DEFAULT_MAX_WORKERS_CAP))
+    return max(1, min((os.cpu_count() or 1) * 8, cap))
+
 
 class AgentManager:
     def __init__(self, max_completed: int = 100):
         self._lock = threading.Lock()
         self._running: Dict[str, Dict[str, Any]] = {}
-        self._completed: OrderedDict[str, Dict[str, Any]] = OrderedDict()
-        self._threads: Dict[str, threading.Thread] = {}
-        self._events: Dict[str, threading.Event] = {}  # Events for sync
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        # Completion order; the bounded deque drops the oldest ID for us
+        self._order: deque[str] = deque(maxlen=max_completed)
+        # Running agents also kept as parallel arrays (id / monotonic start /
+        # type) so get_running_list is one zip over dense lists; _idx_of maps
+        # an ID to its slot, and removal swaps the last slot into the hole.
+        self._run_ids: List[str] = []
+        self._run_started: List[float] = []
+        self._run_types: List[str] = []
+        self._idx_of: Dict[str, int] = {}
+        self._futures: Dict[str, Future] = {}
+        # Shared pool for background spawns; threads are created on demand
+        # and reused, instead of one short-lived Thread per agent
+        self._executor = ThreadPoolExecutor(
+            max_workers=recommended_max_workers(),
+            thread_name_prefix="powerspawn-agent",
+        )
+        # Bounds async spawns; asyncio primitives belong to one loop, so the
+        # semaphore is rebuilt if a different loop submits
+        self._async_sem: Optional[asyncio.Semaphore] = None
+        self._async_sem_loop = None
+        self._async_queued = 0
+        # Broadcast on every completion; waiters re-check their own predicate
+        self._cv = threading.Condition(self._lock)
         self._max_completed = max_completed
 
     def register_start(self, agent_type: str, model: str, task: str) -> str:
         """Register a new agent start. Returns agent_id."""
-        agent_id = uuid.uuid4().hex[:8]
-        now_iso = datetime.now(timezone.utc).isoformat().split('.')[0]
+        agent_id = _next_agent_id()
+        now_iso = _utc_now_iso()
         
         with self._lock:
             self._running[agent_id] = {
@@ -31,66 +104,139 @@ class AgentManager:
                 "agent_type": agent_type,
                 "model": model,
                 "started_at": now_iso,
-                "task": task[:100].replace('\n', ' ')
+                "task": task[:100].translate(_WHITESPACE_TO_SPACE),
             }
-            self._events[agent_id] = threading.Event()
+            # Monotonic start for elapsed-time math; started_at is display-only
+            self._idx_of[agent_id] = len(self._run_ids)
+            self._run_ids.append(agent_id)
+            self._run_started.append(time.monotonic())
+            self._run_types.append(agent_type)
             
         return agent_id
+
+    def _remove_running_slot(self, agent_id: str):
+        """Drop an agent from the parallel arrays in O(1) (lock held)."""
+        idx = self._idx_of.pop(agent_id)
+        last = len(self._run_ids) - 1
+        if idx != last:
+            moved = self._run_ids[last]
+            self._run_ids[idx] = moved
+            self._run_started[idx] = self._run_started[last]
+            self._run_types[idx] = self._run_types[last]
+            self._idx_of[moved] = idx
+        self._run_ids.pop()
+        self._run_started.pop()
+        self._run_types.pop()
         
-    def register_thread(self, agent_id: str, thread: threading.Thread):
-        """Associate a background thread with an agent."""
+    def submit_spawn(self, agent_id: str, fn, *args, **kwargs) -> Future:
+        """Run fn(*args, **kwargs) on the shared pool on behalf of an agent."""
+        # Submit under the lock so register_complete (which also takes it)
+        # can't run before the future is recorded
         with self._lock:
-            self._threads[agent_id] = thread
-            
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._futures[agent_id] = future
+        return future
+
+    def submit_spawn_async(self, agent_id: str, coro) -> "asyncio.Task":
+        """Run a coroutine as a task on the running event loop for an agent.
+
+        For spawns with a native async variant: the agent waits on the loop
+        instead of holding a pool thread for the whole run. At most
+        max_async_spawns() run at once; the rest wait their turn.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_sem_loop is not loop:
+            self._async_sem = asyncio.Semaphore(max_async_spawns())
+            self._async_sem_loop = loop
+        sem = self._async_sem
+
+        async def gated():
+            if sem.locked():
+                self._async_queued += 1
+                try:
+                    await sem.acquire()
+                finally:
+                    self._async_queued -= 1
+            else:
+                await sem.acquire()
+            try:
+                return await coro
+            finally:
+                sem.release()
+
+        with self._lock:
+            task = loop.create_task(gated())
+            # Also the strong reference that keeps the task from being GC'd
+            self._futures[agent_id] = task
+        # A spawn cancelled while queued, or before its task's first step
+        # (when gated() never runs at all), never started: close it so it
+        # isn't left "never awaited". A no-op once it has finished.
+        task.add_done_callback(lambda _: coro.close())
+        return task
+
+    def queued_async_count(self) -> int:
+        """Async spawns waiting for a concurrency slot."""
+        return self._async_queued
+
+    def set_max_workers(self, n: int):
+        """Resize the spawn pool.
+
+        New spawns go to a fresh pool of the new size; the old pool is shut
+        down without waiting, so spawns already on it (running or queued)
+        still finish there.
+        """
+        with self._lock:
+            old = self._executor
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, n),
+                thread_name_prefix="powerspawn-agent",
+            )
+        old.shutdown(wait=False)
+
     def register_complete(self, agent_id: str, result_data: Dict[str, Any]):
         """Move agent from running to completed."""
         with self._lock:
-            if agent_id in self._running:
-                # Merge basic info with result data
-                info = self._running.pop(agent_id)
-                # Keep critical start info if not in result
-                if "started_at" not in result_data:
-                    result_data["started_at"] = info["started_at"]
-                if "task" not in result_data:
-                    result_data["task"] = info["task"]
+            info = self._running.pop(agent_id, None)
+            if info is not None:
+                self._remove_running_slot(agent_id)
+                # Merge basic info, keeping critical start info if not in result
+                result_data.setdefault("started_at", info["started_at"])
+                result_data.setdefault("task", info["task"])
             
             # Ensure ID matches
             result_data["agent_id"] = agent_id
-            result_data["completed_at"] = datetime.now(timezone.utc).isoformat().split('.')[0]
+            result_data["completed_at"] = _utc_now_iso()
             
+            if agent_id not in self._completed:
+                # Prune old history: the full deque evicts its head on append
+                evicted = self._order[0] if len(self._order) == self._order.maxlen else None
+                self._order.append(agent_id)
+                if evicted is not None:
+                    self._completed.pop(evicted, None)
             self._completed[agent_id] = result_data
-            
-            # Prune old history
-            while len(self._completed) > self._max_completed:
-                self._completed.popitem(last=False)
                 
-            # Clean up thread ref
-            self._threads.pop(agent_id, None)
+            # Clean up future ref
+            self._futures.pop(agent_id, None)
             
             # Signal completion
-            if agent_id in self._events:
-                self._events[agent_id].set()
-                # Don't delete event yet, waiter might need it
+            self._cv.notify_all()
                 
     def get_running_list(self) -> List[Dict[str, Any]]:
         """Get snapshot of running agents."""
-        now = datetime.now(timezone.utc)
-        results = []
+        # Copy under the lock, format outside it so writers aren't held up
         with self._lock:
-            for aid, info in self._running.items():
-                elapsed = 0
-                try:
-                    start = datetime.fromisoformat(info["started_at"].replace("Z", "+00:00"))
-                    elapsed = int((now - start).total_seconds())
-                except Exception:
-                    pass
-                results.append({"id": aid, "sec": elapsed, "type": info.get("agent_type")})
-        return results
+            snapshot = list(zip(self._run_ids, self._run_started, self._run_types))
+        now = time.monotonic()
+        return [
+            {"id": aid, "sec": int(now - started), "type": agent_type}
+            for aid, started, agent_type in snapshot
+        ]
         
     def get_recent_completed_ids(self, limit: int = 3) -> List[str]:
         with self._lock:
-            keys = list(self._completed.keys())
-            return keys[-limit:]
+            newest = list(islice(reversed(self._order), limit))
+        newest.reverse()
+        return newest
             
     def get_result(self, agent_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
@@ -105,38 +251,57 @@ class AgentManager:
         Efficiently wait for all currently running agents.
         Returns result dict suitable for tool output.
         """
-        # Snapshot current running IDs and their events
+        # Snapshot current running IDs
         with self._lock:
             waiting_ids = list(self._running.keys())
-            events = [self._events[aid] for aid in waiting_ids if aid in self._events]
             
         if not waiting_ids:
             # Nothing running, return recent
             with self._lock:
-                recent = list(self._completed.values())[-5:]
+                recent = [self._completed[aid] for aid in islice(reversed(self._order), 5)]
+            recent.reverse()
             return {
                 "status": "no_agents_running",
                 "recent_results": recent
             }
             
-        # Wait for all events
-        # Note: threading.Event.wait is blocking, but we need to wait for MULTIPLE.
-        # Simple approach: wait for each sequentially with deadline
-        start_time = datetime.now()
-        remaining = timeout
-        
-        for evt in events:
-            if remaining <= 0:
-                break
-            if evt.wait(timeout=remaining):
-                # Recalculate remaining time
-                elapsed = (datetime.now() - start_time).total_seconds()
-                remaining = timeout - elapsed
-            else:
-                # Timeout happened on this event
-                remaining = 0
+        # Single wait on the condition: register_complete notifies on every
+        # completion, so we wake once per finished agent rather than walking
+        # per-agent events. wait_for tracks the deadline on the monotonic clock.
+        with self._cv:
+            self._cv.wait_for(
+                lambda: not any(aid in self._running for aid in waiting_ids),
+                timeout=timeout,
+            )
                 
-        # Collection time
+        return self._collect(waiting_ids)
+
+    async def wait_for_all_async(self, timeout: float = 300) -> Dict[str, Any]:
+        """
+        Async wait_for_all for the MCP server's event loop.
+
+        Awaits the agents' futures/tasks directly, so a waiting tool call
+        doesn't park an executor thread. Falls back to wait_for_all in a
+        thread if some running agent wasn't started via submit_spawn*.
+        """
+        with self._lock:
+            waiting = {aid: self._futures.get(aid) for aid in self._running}
+
+        if not waiting:
+            # Returns immediately with recent results
+            return self.wait_for_all(timeout)
+        if any(f is None for f in waiting.values()):
+            return await asyncio.to_thread(self.wait_for_all, timeout)
+
+        await asyncio.wait(
+            [f if isinstance(f, asyncio.Future) else asyncio.wrap_future(f)
+             for f in waiting.values()],
+            timeout=timeout,
+        )
+        return self._collect(list(waiting))
+
+    def _collect(self, waiting_ids: List[str]) -> Dict[str, Any]:
+        """Build the wait result for the given agent IDs."""
         with self._lock:
             results = []
             still_running = []
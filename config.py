@@ -5,52 +5,79 @@ Centralizes configuration loading from environment variables and files.
 Prioritizes local file (api_keys.json) over environment variables.
 """
 
-import json
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
+from . import fastjson
+
+# Key names checked per provider, in priority order (file, then env)
+PROVIDER_KEY_VARS = {
+    "grok": ("XAI_API_KEY", "GROK_API_KEY", "X_API_KEY"),
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY", "GOOGLE_AI_KEY"),
+    "mistral": ("MISTRAL_API_KEY",),
+}
+
 class Settings:
     def __init__(self):
         self._api_keys = {}
         self._models = {}
+        # Worker threads for the server's asyncio default executor (to_thread);
+        # None = one per async spawn slot (agent_manager.max_async_spawns)
+        pool_size = os.getenv("POWERSPAWN_THREAD_POOL_SIZE")
+        self.thread_pool_size: Optional[int] = max(1, int(pool_size)) if pool_size else None
         self._load_api_keys()
         self._load_models()
+        self._index_models()
 
     def _load_api_keys(self):
         """Load API keys from api_keys.json if it exists."""
         key_file = Path(__file__).parent / "api_keys.json"
-        if key_file.exists():
-            try:
-                with open(key_file, "r") as f:
-                    self._api_keys = json.load(f)
-            except Exception as e:
-                print(f"Warning: Failed to load api_keys.json: {e}")
+        # Open directly rather than exists() + read: one syscall, and the
+        # usual env-var-only setup just takes the FileNotFoundError branch
+        try:
+            self._api_keys = fastjson.loads(key_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Failed to load api_keys.json: {e}")
 
     def _load_models(self):
         """Load model configurations from models.json."""
         model_file = Path(__file__).parent / "models.json"
-        if model_file.exists():
-            try:
-                with open(model_file, "r") as f:
-                    self._models = json.load(f)
-            except Exception as e:
-                print(f"Warning: Failed to load models.json: {e}")
-        else:
+        try:
+            self._models = fastjson.loads(model_file.read_bytes())
+        except FileNotFoundError:
             print("Warning: models.json not found. Using empty model registry.")
+        except Exception as e:
+            print(f"Warning: Failed to load models.json: {e}")
+
+    def _index_models(self):
+        """Freeze per-provider alias maps once so lookups don't re-walk models.json.
+
+        The maps are read-only views, safe to share across spawn threads.
+        """
+        self._aliases: dict[str, MappingProxyType] = {}
+        self._defaults: dict[str, str] = {}
+        for provider, provider_config in self._models.items():
+            key = provider.lower()
+            self._aliases[key] = MappingProxyType(dict(provider_config.get("aliases", {})))
+            if "default" in provider_config:
+                self._defaults[key] = provider_config["default"]
+        # Flat (provider, alias) -> model table: one lookup per resolution
+        self._resolved: dict[tuple[str, str], str] = {
+            (key, alias): model
+            for key, aliases in self._aliases.items()
+            for alias, model in aliases.items()
+        }
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """
         Get API key for a provider.
         Priority: 1. api_keys.json, 2. Env Vars (checking aliases)
         """
-        provider_key_map = {
-            "grok": ["XAI_API_KEY", "GROK_API_KEY", "X_API_KEY"],
-            "gemini": ["GEMINI_API_KEY", "GOOGLE_API_KEY", "GOOGLE_AI_KEY"],
-            "mistral": ["MISTRAL_API_KEY"],
-        }
-        
-        possible_vars = provider_key_map.get(provider.lower(), [])
+        possible_vars = PROVIDER_KEY_VARS.get(provider.lower(), ())
         
         # 1. Check file cache
         for var_name in possible_vars:
@@ -70,18 +97,15 @@ class Settings:
         Resolve a model alias to its full name for a specific provider.
         If model_name is None, returns the default model for that provider.
         """
-        provider_config = self._models.get(provider.lower(), {})
-        
+        key = provider.lower()
         if not model_name:
-            return provider_config.get("default", model_name)
-            
-        aliases = provider_config.get("aliases", {})
-        return aliases.get(model_name, model_name)
+            return self._defaults.get(key, model_name)
+
+        return self._resolved.get((key, model_name), model_name)
     
     def get_model_list(self, provider: str) -> list[str]:
         """Get list of available aliases for a provider."""
-        provider_config = self._models.get(provider.lower(), {})
-        return list(provider_config.get("aliases", {}).keys())
+        return list(self._aliases.get(provider.lower(), ()))
 
 # Singleton instance
 settings = Settings()
@@ -24,6 +24,11 @@ from typing import Optional
 # inject it again for these (it would duplicate a potentially large file).
 NATIVELY_LOADS_AGENTS_MD = frozenset({"codex", "copilot"})
 
+# Default cwd for CLI workers: the directory containing powerspawn/. Computed
+# once; deliberately not resolved, so a symlinked powerspawn/ runs workers in
+# the workspace that links it.
+WORKSPACE_DIR = str(Path(__file__).parent.parent)
+
 
 def _workspace_root() -> Path:
     # powerspawn/context.py -> powerspawn/ -> workspace root
@@ -19,31 +19,59 @@ CLI Agents (spawn_claude, spawn_codex):
   - Have access to the local filesystem
   - Use the CLI tooling (claude, codex)
 
-API Agents (spawn_grok, spawn_gemini, spawn_mistral):
+API Agents (spawn_grok_api, spawn_gemini, spawn_mistral):
   - Text-only responses
   - Cannot access filesystem or execute commands
   - Useful for analysis, drafting, research
   - The coordinator must apply any suggested changes
 """
 
+import asyncio
 import sys
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Run from a checkout: put the directory containing powerspawn/ on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from api_providers import (
-    spawn_grok,
+from powerspawn.config import settings
+from powerspawn.providers import (
+    spawn_grok_api,
     spawn_gemini,
     spawn_mistral,
-    spawn_api,
-    get_available_api_providers,
-    GROK_MODELS,
-    GEMINI_MODELS,
-    MISTRAL_MODELS,
+    spawn_grok_api_async,
+    spawn_grok_api_stream,
+    spawn_gemini_stream,
+    spawn_gemini_async,
+    spawn_mistral_async,
+    spawn_api_batch,
+    spawn_mistral_batch,
 )
 
+# Provider (as in settings.get_api_key) -> sync API spawn
+API_SPAWNERS = {
+    "grok": spawn_grok_api,
+    "gemini": spawn_gemini,
+    "mistral": spawn_mistral,
+}
+
+
+def get_available_api_providers() -> dict[str, bool]:
+    """Which API providers have a key (api_keys.json or environment)."""
+    return {provider: bool(settings.get_api_key(provider)) for provider in API_SPAWNERS}
+
+
+def spawn_api(prompt: str, *, provider: str, **kwargs):
+    """Spawn an API agent on a provider chosen at runtime."""
+    return API_SPAWNERS[provider](prompt, **kwargs)
+
+
+_BAR = "=" * 60
+
+
+def _preview(text: str, limit: int = 300) -> str:
+    """Truncate long responses for display, adding "..." only when cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
 
 # =============================================================================
 # Example 1: Basic Grok Usage
@@ -51,11 +79,11 @@ from api_providers import (
 
 def example_grok_basic():
     """Basic Grok (X.ai) invocation."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 1: Basic Grok (X.ai) invocation")
-    print("=" * 60)
+    print(_BAR)
 
-    result = spawn_grok(
+    result = spawn_grok_api(
         "What are the top 3 considerations when migrating a Python 2 "
         "codebase to Python 3? Be concise.",
         model="grok-4",
@@ -65,7 +93,7 @@ def example_grok_basic():
     print(f"Success: {result.success}")
     if result.success:
         print(f"Model: {result.model}")
-        print(f"Response:\n{result.text[:500]}...")
+        print(f"Response:\n{_preview(result.text, 500)}")
         print(f"Duration: {result.duration_ms}ms")
         if result.usage:
             print(f"Tokens: {result.usage.get('total_tokens', 'N/A')}")
@@ -80,9 +108,9 @@ def example_grok_basic():
 
 def example_gemini_basic():
     """Basic Gemini (Google) invocation."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 2: Basic Gemini (Google) invocation")
-    print("=" * 60)
+    print(_BAR)
 
     result = spawn_gemini(
         "Explain the difference between async/await and threads in Python. "
@@ -94,7 +122,7 @@ def example_gemini_basic():
     print(f"Success: {result.success}")
     if result.success:
         print(f"Model: {result.model}")
-        print(f"Response:\n{result.text[:500]}...")
+        print(f"Response:\n{_preview(result.text, 500)}")
         print(f"Duration: {result.duration_ms}ms")
     else:
         print(f"Error: {result.error}")
@@ -107,9 +135,9 @@ def example_gemini_basic():
 
 def example_mistral_basic():
     """Basic Mistral AI invocation."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 3: Basic Mistral AI invocation")
-    print("=" * 60)
+    print(_BAR)
 
     result = spawn_mistral(
         "What are the key differences between REST and GraphQL APIs? "
@@ -121,7 +149,7 @@ def example_mistral_basic():
     print(f"Success: {result.success}")
     if result.success:
         print(f"Model: {result.model}")
-        print(f"Response:\n{result.text[:500]}...")
+        print(f"Response:\n{_preview(result.text, 500)}")
         print(f"Duration: {result.duration_ms}ms")
     else:
         print(f"Error: {result.error}")
@@ -140,10 +168,13 @@ def example_parallel_spawning():
     - Getting diverse perspectives on a problem
     - Comparing model outputs for quality assessment
     - Redundancy when one provider might fail
+
+    When nobody is waiting on the answers, example_batch_comparison shows
+    the cheaper, slower batch path.
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 4: Parallel spawning - Query all providers")
-    print("=" * 60)
+    print(_BAR)
 
     prompt = "In one paragraph, explain what makes a good code review."
 
@@ -151,46 +182,94 @@ def example_parallel_spawning():
     available = get_available_api_providers()
     print(f"Available providers: {available}")
 
-    # Define spawn tasks for available providers
+    # Define spawn tasks for available providers. The async variants share one
+    # pooled HTTP client, so the calls overlap on a single event loop instead
+    # of blocking a thread each.
     tasks = []
     if available.get("grok"):
-        tasks.append(("Grok", lambda: spawn_grok(prompt, task_summary="Code review advice")))
+        tasks.append(("Grok", lambda: spawn_grok_api_async(prompt, task_summary="Code review advice")))
     if available.get("gemini"):
-        tasks.append(("Gemini", lambda: spawn_gemini(prompt, task_summary="Code review advice")))
+        tasks.append(("Gemini", lambda: spawn_gemini_async(prompt, task_summary="Code review advice")))
     if available.get("mistral"):
-        tasks.append(("Mistral", lambda: spawn_mistral(prompt, task_summary="Code review advice")))
+        tasks.append(("Mistral", lambda: spawn_mistral_async(prompt, task_summary="Code review advice")))
 
     if not tasks:
         print("No API providers configured. Skipping parallel example.")
         print()
         return
 
-    # Execute in parallel using ThreadPoolExecutor
-    results = {}
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        future_to_name = {executor.submit(fn): name for name, fn in tasks}
+    async def run_all():
+        # Create every coroutine first, then await them together
+        return await asyncio.gather(*[fn() for _, fn in tasks], return_exceptions=True)
 
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                result = future.result()
-                results[name] = result
-            except Exception as e:
-                print(f"  {name} failed: {e}")
+    results = {}
+    for (name, _), outcome in zip(tasks, asyncio.run(run_all())):
+        if isinstance(outcome, BaseException):
+            print(f"  {name} failed: {outcome}")
+        else:
+            results[name] = outcome
 
     # Display results
     for name, result in results.items():
         print(f"\n--- {name} ({result.duration_ms}ms) ---")
         if result.success:
-            # Truncate for display
-            text = result.text[:300] + "..." if len(result.text) > 300 else result.text
-            print(text)
+            print(_preview(result.text))
         else:
             print(f"Error: {result.error}")
 
     print()
 
 
+# =============================================================================
+# Example 4b: Batch Comparison - Many Prompts, All Providers
+# =============================================================================
+
+def example_batch_comparison():
+    """
+    Compare providers over several prompts without waiting interactively.
+
+    Mistral's Batch API runs the whole prompt list as one job at a lower
+    price; it can take minutes, so only use it when nobody is waiting.
+    Providers without a batch endpoint here fall back to spawn_api_batch,
+    which sends the prompts concurrently over the pooled connection.
+    """
+    print(_BAR)
+    print("Example 4b: Batch comparison - many prompts, all providers")
+    print(_BAR)
+
+    prompts = [
+        "In one paragraph, explain what makes a good code review.",
+        "In one paragraph, explain when to write an integration test.",
+        "In one paragraph, explain what technical debt is.",
+    ]
+
+    available = get_available_api_providers()
+    results = {}
+    if available.get("mistral"):
+        results["Mistral (batch job)"] = spawn_mistral_batch(
+            prompts, task_summary="Batch comparison"
+        )
+    for name, provider in (("Grok", "grok-api"), ("Gemini", "gemini")):
+        if available.get(name.lower()):
+            results[name] = spawn_api_batch(
+                prompts, provider=provider, task_summary="Batch comparison"
+            )
+
+    if not results:
+        print("No API providers configured. Skipping batch example.")
+        print()
+        return
+
+    for i, prompt in enumerate(prompts):
+        print(f"\n=== {prompt} ===")
+        for name, batch in results.items():
+            result = batch[i]
+            text = _preview(result.text, 200) if result.success else f"Error: {result.error}"
+            print(f"--- {name} ---\n{text}")
+
+    print()
+
+
 # =============================================================================
 # Example 5: Error Handling - Missing API Keys
 # =============================================================================
@@ -202,9 +281,9 @@ def example_error_handling():
     API agents fail gracefully when keys aren't configured.
     Always check result.success before using result.text.
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 5: Error handling for API agents")
-    print("=" * 60)
+    print(_BAR)
 
     # Check available providers first
     available = get_available_api_providers()
@@ -236,9 +315,9 @@ def example_error_handling():
     # Example of safe spawning pattern
     print("\n--- Safe spawning pattern ---")
     if available.get("grok"):
-        result = spawn_grok("Hello!", task_summary="Test")
+        result = spawn_grok_api("Hello!", task_summary="Test")
         if result.success:
-            print(f"Grok responded: {result.text[:100]}...")
+            print(f"Grok responded: {_preview(result.text, 100)}")
         else:
             print(f"Grok error: {result.error}")
     else:
@@ -260,64 +339,53 @@ def example_model_selection():
     - Smaller models: Faster and cheaper for simple tasks
     - Specialized models: Code-focused variants
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 6: Model selection across providers")
-    print("=" * 60)
+    print(_BAR)
 
     print("Available models by provider:")
-    print(f"\nGrok (X.ai):   {list(GROK_MODELS.keys())}")
-    print(f"Gemini:        {list(GEMINI_MODELS.keys())}")
-    print(f"Mistral:       {list(MISTRAL_MODELS.keys())}")
+    print(f"\nGrok (X.ai):   {settings.get_model_list('grok-api')}")
+    print(f"Gemini:        {settings.get_model_list('gemini')}")
+    print(f"Mistral:       {settings.get_model_list('mistral')}")
 
     available = get_available_api_providers()
 
-    # Example: Use code-focused models for code tasks
     code_prompt = "Write a Python function to check if a string is a palindrome."
+    simple_prompt = "What is 2 + 2?"
 
-    print("\n--- Code-focused models ---")
-
+    # (section, label, coroutine): code-focused models for the code task,
+    # fast models for the simple query. All four run at once, so the example
+    # takes max(latency) rather than the sum.
+    calls = []
     if available.get("grok"):
-        result = spawn_grok(
-            code_prompt,
-            model="grok-code-fast",  # Code-optimized model
-            task_summary="Palindrome function",
-        )
-        if result.success:
-            print(f"Grok (grok-code-fast): {result.duration_ms}ms")
-            print(result.text[:200] + "...")
-
+        calls.append(("code", "Grok (grok-code-fast)", spawn_grok_api_async(
+            code_prompt, model="grok-code-fast", task_summary="Palindrome function")))
     if available.get("mistral"):
-        result = spawn_mistral(
-            code_prompt,
-            model="codestral",  # Mistral's code model
-            task_summary="Palindrome function",
-        )
-        if result.success:
-            print(f"\nMistral (codestral): {result.duration_ms}ms")
-            print(result.text[:200] + "...")
-
-    # Example: Use fast models for simple queries
-    simple_prompt = "What is 2 + 2?"
-
-    print("\n--- Fast models for simple queries ---")
-
+        calls.append(("code", "Mistral (codestral)", spawn_mistral_async(
+            code_prompt, model="codestral", task_summary="Palindrome function")))
     if available.get("gemini"):
-        result = spawn_gemini(
-            simple_prompt,
-            model="gemini-2.0-flash",  # Fast model
-            task_summary="Simple math",
-        )
-        if result.success:
-            print(f"Gemini (flash): {result.text.strip()} ({result.duration_ms}ms)")
-
+        calls.append(("simple", "Gemini (flash)", spawn_gemini_async(
+            simple_prompt, model="gemini-2.0-flash", task_summary="Simple math")))
     if available.get("mistral"):
-        result = spawn_mistral(
-            simple_prompt,
-            model="mistral-small",  # Smaller, faster model
-            task_summary="Simple math",
-        )
-        if result.success:
-            print(f"Mistral (small): {result.text.strip()} ({result.duration_ms}ms)")
+        calls.append(("simple", "Mistral (small)", spawn_mistral_async(
+            simple_prompt, model="mistral-small", task_summary="Simple math")))
+
+    async def run_all():
+        return await asyncio.gather(*[coro for _, _, coro in calls])
+
+    results = asyncio.run(run_all()) if calls else []
+
+    headings = {"code": "--- Code-focused models ---", "simple": "--- Fast models for simple queries ---"}
+    for section, heading in headings.items():
+        print(f"\n{heading}")
+        for (kind, label, _), result in zip(calls, results):
+            if kind != section or not result.success:
+                continue
+            if section == "code":
+                print(f"{label}: {result.duration_ms}ms")
+                print(_preview(result.text, 200))
+            else:
+                print(f"{label}: {result.text.strip()} ({result.duration_ms}ms)")
 
     print()
 
@@ -335,9 +403,9 @@ def example_system_prompts():
     - Set response format requirements
     - Constrain behavior
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 7: System prompts for role-based agents")
-    print("=" * 60)
+    print(_BAR)
 
     available = get_available_api_providers()
 
@@ -361,22 +429,26 @@ def login(username, password):
     print(code_to_review)
     print("\n--- Security Review Agent ---")
 
+    # Long answers: stream them so the review starts printing with the first
+    # tokens instead of after the whole response has been generated
+    stream_fn = None
     if available.get("grok"):
-        result = spawn_grok(
-            f"Review this code for security issues:\n{code_to_review}",
-            system_prompt=security_system_prompt,
-            task_summary="Security code review",
-        )
-        if result.success:
-            print(f"Grok Security Review:\n{result.text}")
+        stream_fn, name = spawn_grok_api_stream, "Grok"
     elif available.get("gemini"):
-        result = spawn_gemini(
-            f"Review this code for security issues:\n{code_to_review}",
-            system_prompt=security_system_prompt,
-            task_summary="Security code review",
-        )
-        if result.success:
-            print(f"Gemini Security Review:\n{result.text}")
+        stream_fn, name = spawn_gemini_stream, "Gemini"
+
+    if stream_fn is not None:
+        print(f"{name} Security Review:")
+        try:
+            for delta in stream_fn(
+                f"Review this code for security issues:\n{code_to_review}",
+                system_prompt=security_system_prompt,
+                task_summary="Security code review",
+            ):
+                print(delta, end="", flush=True)
+            print()
+        except Exception as e:
+            print(f"\n{name} error: {e}")
     elif available.get("mistral"):
         result = spawn_mistral(
             f"Review this code for security issues:\n{code_to_review}",
@@ -406,9 +478,9 @@ def example_mixed_orchestration():
 
     This example is conceptual - it shows the pattern without executing.
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 8: Mixed orchestration pattern (conceptual)")
-    print("=" * 60)
+    print(_BAR)
 
     print("""
 MIXED ORCHESTRATION PATTERN
@@ -416,7 +488,7 @@ MIXED ORCHESTRATION PATTERN
 
 Step 1: Use CLI agent to gather code
 --------------------------------------
-from spawner import spawn_claude
+from powerspawn.providers import spawn_claude
 
 result = spawn_claude(
     "Read the authentication module and return its contents",
@@ -427,16 +499,21 @@ code_content = result.text
 
 Step 2: Use API agents for analysis (parallel)
 ----------------------------------------------
-from api_providers import spawn_grok, spawn_gemini, spawn_mistral
+from powerspawn.providers import spawn_grok_api, spawn_gemini, spawn_mistral
 
 # Spawn in parallel for diverse perspectives
 with ThreadPoolExecutor(max_workers=3) as executor:
+    # Phase 1: submit everything. Calling .result() inside this loop would
+    # wait on each provider before submitting the next (N x latency).
     futures = {
-        executor.submit(spawn_grok, f"Review this code: {code_content}"): "Grok",
+        executor.submit(spawn_grok_api, f"Review this code: {code_content}"): "Grok",
         executor.submit(spawn_gemini, f"Review this code: {code_content}"): "Gemini",
         executor.submit(spawn_mistral, f"Review this code: {code_content}"): "Mistral",
     }
-    reviews = {name: future.result() for future, name in futures.items()}
+    # Phase 2: collect, in completion order
+    reviews = {}
+    for fut in as_completed(futures):
+        reviews[futures[fut]] = fut.result()
 
 Step 3: Coordinator synthesizes and applies
 -------------------------------------------
@@ -469,9 +546,9 @@ def example_universal_spawn():
     - Build provider-agnostic orchestration logic
     - Route to fallback providers if primary fails
     """
-    print("=" * 60)
+    print(_BAR)
     print("Example 9: Universal spawn_api function")
-    print("=" * 60)
+    print(_BAR)
 
     available = get_available_api_providers()
 
@@ -530,9 +607,9 @@ def query_with_fallback(prompt: str) -> AgentResult:
 # =============================================================================
 
 if __name__ == "__main__":
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("API Agent Examples for PowerSpawn")
-    print("=" * 60 + "\n")
+    print(_BAR + "\n")
 
     # First, check what's available
     available = get_available_api_providers()
@@ -558,12 +635,13 @@ if __name__ == "__main__":
     # example_gemini_basic()      # Requires GEMINI_API_KEY
     # example_mistral_basic()     # Requires MISTRAL_API_KEY
     # example_parallel_spawning() # Uses all available providers
+    # example_batch_comparison()  # Slow: Mistral batch job; uses available providers
     example_error_handling()      # Always works (shows status)
     example_model_selection()     # Uses available providers
     # example_system_prompts()    # Uses first available provider
     example_mixed_orchestration() # Conceptual - always works
     example_universal_spawn()     # Uses first available provider
 
-    print("=" * 60)
+    print(_BAR)
     print("Examples complete!")
-    print("=" * 60)
+    print(_BAR)
@@ -13,12 +13,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from spawner import spawn_claude, spawn_codex, spawn_codex_stream
 
+_BAR = "=" * 50
+
 
 def example_claude_basic():
     """Basic Claude invocation."""
-    print("=" * 50)
+    print(_BAR)
     print("Example 1: Basic Claude invocation")
-    print("=" * 50)
+    print(_BAR)
 
     result = spawn_claude(
         "List the main directories in this project",
@@ -34,9 +36,9 @@ def example_claude_basic():
 
 def example_claude_structured():
     """Claude with structured output."""
-    print("=" * 50)
+    print(_BAR)
     print("Example 2: Claude with structured output")
-    print("=" * 50)
+    print(_BAR)
 
     result = spawn_claude(
         "Analyze the test files in tests/production/",
@@ -56,9 +58,9 @@ def example_claude_structured():
 
 def example_codex_basic():
     """Basic Codex invocation (waits for completion)."""
-    print("=" * 50)
+    print(_BAR)
     print("Example 3: Basic Codex invocation")
-    print("=" * 50)
+    print(_BAR)
 
     result = spawn_codex(
         "How many TypeScript files are in src/?",
@@ -72,9 +74,9 @@ def example_codex_basic():
 
 def example_codex_streaming():
     """Codex with streaming events."""
-    print("=" * 50)
+    print(_BAR)
     print("Example 4: Codex streaming events")
-    print("=" * 50)
+    print(_BAR)
 
     print("Events:")
     for event in spawn_codex_stream(
@@ -94,9 +96,9 @@ def example_codex_streaming():
 
 def example_error_handling():
     """Demonstrating error handling."""
-    print("=" * 50)
+    print(_BAR)
     print("Example 5: Error handling")
-    print("=" * 50)
+    print(_BAR)
 
     # Try with a very short timeout
     result = spawn_claude(
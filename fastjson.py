@@ -0,0 +1,33 @@
+"""
+JSON helpers with an optional orjson fast path
+
+orjson parses and serializes several times faster than the stdlib json
+module. It is optional: when it isn't installed these helpers fall back to
+json, producing equivalent results for the data PowerSpawn handles.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a JSON str (2-space indent when indent=True)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+        except TypeError:
+            # Types orjson rejects (non-str keys, huge ints, ...): use stdlib
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -0,0 +1,197 @@
+"""
+Exact response cache for the API providers
+
+Deterministic requests (temperature 0) with the same provider, model, system
+prompt and prompt get the same answer, so re-issuing them only costs latency
+and tokens. With POWERSPAWN_CACHE=1, successful responses to such requests
+are kept in memory and on disk (one JSON file per request under
+POWERSPAWN_CACHE_DIR, default ~/.powerspawn/cache) for POWERSPAWN_CACHE_TTL
+seconds, default 3600. At most POWERSPAWN_CACHE_MAX entries (default 1024)
+stay in memory, least recently used dropped first. A hit returns without
+touching the network.
+
+Off by default: a coordinator asking the same question twice may want a
+fresh answer (e.g. web search results change).
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from . import fastjson
+from .config import settings
+from .providers.types import AgentResult
+
+CACHE_ENABLED = os.getenv("POWERSPAWN_CACHE", "0") == "1"
+CACHE_TTL = float(os.getenv("POWERSPAWN_CACHE_TTL", "3600"))
+CACHE_DIR = Path(os.getenv("POWERSPAWN_CACHE_DIR", "~/.powerspawn/cache")).expanduser()
+CACHE_MAX_ENTRIES = int(os.getenv("POWERSPAWN_CACHE_MAX", "1024"))
+
+# Arguments that don't change the answer and are left out of the key
+_IGNORED_KWARGS = frozenset({"task_summary", "timeout"})
+
+# LRU order: least recently used first
+_memory: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_lock = threading.Lock()
+stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(provider: str, model: str, system_prompt: Optional[str], prompt: str, **extra) -> str:
+    """sha256 of the request payload. Raises TypeError for non-JSON arguments."""
+    payload = {"provider": provider, "model": model, "system": system_prompt,
+               "prompt": prompt, **extra}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load(key: str) -> Optional[tuple[float, dict]]:
+    """Read an entry from disk, or None if it is missing or unreadable."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        stamp, fields = fastjson.loads(path.read_bytes())
+        entry = (float(stamp), dict(fields))
+        AgentResult(success=True, cached=True, **entry[1])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, IndexError, KeyError):
+        # Truncated, corrupt or written by an incompatible version: treat as
+        # a miss and drop the file so it isn't re-read on every lookup
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    return entry
+
+
+def _remember(key: str, entry: tuple[float, dict]) -> None:
+    """Insert or refresh ``key`` as most recently used (lock held)."""
+    _memory[key] = entry
+    _memory.move_to_end(key)
+    while len(_memory) > CACHE_MAX_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def get(key: str) -> Optional[AgentResult]:
+    """Return the cached result for ``key``, or None if absent or expired."""
+    now = time.time()
+    with _lock:
+        entry = _memory.get(key)
+    if entry is None:
+        entry = _load(key)
+    if entry is None or now - entry[0] > CACHE_TTL:
+        with _lock:
+            _memory.pop(key, None)
+            stats["misses"] += 1
+        return None
+    with _lock:
+        _remember(key, entry)
+        stats["hits"] += 1
+    return AgentResult(success=True, cached=True, **entry[1])
+
+
+def put(key: str, result: AgentResult) -> None:
+    """Store a successful result. Disk errors are ignored; the memory copy stays."""
+    if not result.success:
+        return
+    fields = {
+        "text": result.text,
+        "structured_output": result.structured_output,
+        "usage": result.usage,
+        "model": result.model,
+        "provider": result.provider,
+    }
+    entry = (time.time(), fields)
+    try:
+        data = fastjson.dumps(entry)
+    except TypeError:
+        # e.g. a msgspec.Struct structured_output: not worth caching
+        return
+    with _lock:
+        expired = [k for k, (stamp, _) in _memory.items() if entry[0] - stamp > CACHE_TTL]
+        for k in expired:
+            del _memory[k]
+        _remember(key, entry)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / f"{key}.json").write_text(data, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def clear() -> None:
+    """Drop the in-memory entries and reset the hit/miss counters."""
+    with _lock:
+        _memory.clear()
+        stats["hits"] = stats["misses"] = 0
+
+
+def cached_spawn(provider: str) -> Callable:
+    """Decorate a sync or async API spawn function with the exact cache.
+
+    Only calls with temperature 0 (or None) are cached, and only when
+    CACHE_ENABLED. Calls with arguments that can't be keyed (callables such
+    as stop_predicate, struct types) bypass the cache. Callers can pass
+    ``cache={"bypass": True}`` to skip the lookup; the fresh result still
+    replaces the cached one. Hits come back with ``cached=True``.
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        default_temperature = signature.parameters["temperature"].default
+        # Advertise the cache option so callers that filter kwargs by
+        # signature (the MCP server) pass it through
+        wrapped_signature = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("cache", inspect.Parameter.KEYWORD_ONLY, default=None),
+        ])
+
+        def lookup(prompt: str, kwargs: dict) -> Optional[tuple[str, bool]]:
+            # Cache options are ours; the spawn function never sees them
+            options = kwargs.pop("cache", None) or {}
+            if not CACHE_ENABLED or kwargs.get("temperature", default_temperature) not in (None, 0):
+                return None
+            model = settings.get_model_alias(provider, kwargs.get("model"))
+            extra = {k: v for k, v in kwargs.items()
+                     if k not in _IGNORED_KWARGS and k not in ("model", "system_prompt")}
+            try:
+                key = cache_key(provider, model, kwargs.get("system_prompt"), prompt, **extra)
+            except TypeError:
+                return None
+            return key, bool(options.get("bypass"))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(prompt: str, **kwargs) -> AgentResult:
+                key, bypass = lookup(prompt, kwargs) or (None, True)
+                # get/put may read and write the cache files: keep them off the loop
+                hit = None if bypass else await asyncio.to_thread(get, key)
+                if hit is not None:
+                    return hit
+                result = await fn(prompt, **kwargs)
+                if key:
+                    await asyncio.to_thread(put, key, result)
+                return result
+            async_wrapper.__signature__ = wrapped_signature
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(prompt: str, **kwargs) -> AgentResult:
+            key, bypass = lookup(prompt, kwargs) or (None, True)
+            hit = None if bypass else get(key)
+            if hit is not None:
+                return hit
+            result = fn(prompt, **kwargs)
+            if key:
+                put(key, result)
+            return result
+        wrapper.__signature__ = wrapped_signature
+        return wrapper
+
+    return decorator
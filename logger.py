@@ -17,14 +17,19 @@ v1.6.0: Merged CONTEXT.md into IAC.md (Inter Agent Context pattern)
 v1.6.1: Added agent_type (CLI/API) to IAC.md logging
 v1.6.2: Increased MAX_IAC_ENTRIES from 15 to 50
 v1.6.3: Increased MAX_IAC_ENTRIES from 50 to 200
+v1.8.2: Entries kept in memory (no re-read per event), optional write coalescing
+v1.8.3: MCP server coalesces writes by default (SERVER_IAC_FLUSH_INTERVAL)
+v1.8.4: Re-read IAC.md before writing when another process changed it
 """
 
+import atexit
+import functools
+import os
 import re
-import uuid
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from dataclasses import dataclass
 
 # Global lock for file operations (thread-safe within process)
@@ -33,6 +38,17 @@ _file_lock = threading.Lock()
 # Maximum number of entries to keep in IAC.md
 MAX_IAC_ENTRIES = 200
 
+# Seconds to coalesce IAC.md writes over (0 = write through on every event).
+# Long-running servers with bursty fan-out can set POWERSPAWN_IAC_FLUSH_MS.
+IAC_FLUSH_INTERVAL = float(os.environ.get("POWERSPAWN_IAC_FLUSH_MS", "0")) / 1000.0
+
+# The MCP server runs every spawn on one event loop, so it coalesces by default
+# and file I/O stays on the writer thread. POWERSPAWN_IAC_FLUSH_MS=0 opts out.
+SERVER_IAC_FLUSH_INTERVAL = float(os.environ.get("POWERSPAWN_IAC_FLUSH_MS", "250")) / 1000.0
+
+# Write early once this many events are buffered, regardless of the interval
+IAC_FLUSH_MAX_PENDING = 50
+
 # IAC.md header template (with active agents placeholder)
 IAC_HEADER_TEMPLATE = """# Inter Agent Context (IAC)
 
@@ -69,32 +85,66 @@ def get_agents_dir() -> Path:
     return get_output_dir()
 
 
+# Spawn IDs are cut from a per-thread buffer of OS randomness, one urandom
+# call per _ID_BATCH IDs instead of one per spawn
+_ID_BATCH = 128
+_id_buffers = threading.local()
+
+
+def _reset_id_buffers():
+    # A forked child must not hand out the parent's remaining IDs
+    global _id_buffers
+    _id_buffers = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_buffers)
+
+
 def generate_spawn_id() -> str:
-    """Generate a short unique ID for a spawn."""
-    return uuid.uuid4().hex[:8]
+    """Generate a short unique ID for a spawn (8 random hex chars)."""
+    state = _id_buffers
+    buf = getattr(state, "buf", b"")
+    pos = getattr(state, "pos", 0)
+    if pos >= len(buf):
+        buf = state.buf = os.urandom(4 * _ID_BATCH)
+        pos = 0
+    state.pos = pos + 4
+    return buf[pos:pos + 4].hex()
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_stamp(epoch_second: int) -> str:
+    # Formatted once per second: a burst of spawns shares the string
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(epoch_second))
 
 
 def now_iso() -> str:
     """Get current timestamp in ISO format (UTC)."""
-    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    return _utc_stamp(int(time.time()))
 
 
 def now_time() -> str:
     """Get current time only (UTC)."""
-    return datetime.utcnow().strftime("%H:%M:%S")
+    return now_iso()[11:]
 
 
 def now_date() -> str:
     """Get current date only (UTC)."""
-    return datetime.utcnow().strftime("%Y-%m-%d")
+    return now_iso()[:10]
 
 
 def sanitize_for_table(text: str, max_len: int = 60) -> str:
     """Sanitize text for markdown table display (remove newlines, truncate)."""
     if not text:
         return ""
-    # Replace newlines with spaces, collapse multiple spaces
-    clean = ' '.join(text.split())
+    # Common case: already one clean line. isprintable() is False for any
+    # whitespace but ' ', so only doubled/edge spaces are left to rule out.
+    if text.isprintable() and "  " not in text and text[0] != " " and text[-1] != " ":
+        clean = text
+    else:
+        # Replace newlines with spaces, collapse multiple spaces
+        clean = ' '.join(text.split())
     if len(clean) > max_len:
         return clean[:max_len-3] + "..."
     return clean
@@ -128,17 +178,37 @@ class AgentLogger:
     - Interaction history (below, newest first)
     """
 
-    def __init__(self):
+    def __init__(self, flush_interval: Optional[float] = None):
         self.agents_dir = get_agents_dir()
         self.iac_path = self.agents_dir / "IAC.md"
         self.active_spawns: dict[str, SpawnRecord] = {}
         self.max_recent_runs = 10
+        # Parsed interaction-history entries, kept in memory between events.
+        # IAC.md is only re-parsed when its (mtime_ns, size) no longer match
+        # what this logger last read or wrote, i.e. another process (a CLI
+        # run next to the server) or a hand edit changed it; the changes
+        # since our last write (_unsynced) are then replayed on top.
+        self._entries: Optional[list[str]] = None
+        self._disk_sig: Optional[tuple[int, int]] = None
+        self._unsynced: list[Callable[[list[str]], None]] = []
+        # Write coalescing: events since the last write. In buffered mode one
+        # background writer thread does the file I/O, woken by _dirty (and
+        # early by _urgent once IAC_FLUSH_MAX_PENDING events pile up).
+        self.flush_interval = IAC_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._pending = 0
+        self._write_lock = threading.Lock()  # serializes snapshot + file write
+        self._dirty = threading.Event()
+        self._urgent = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        if self.flush_interval > 0:
+            atexit.register(self.flush)
 
     def _build_active_agents_table(self) -> str:
         """Build markdown table of active agents."""
         table = "| ID | Agent | Type | Model | Task | Started |\n|-----|-------|------|-------|------|--------|\n"
-        if self.active_spawns:
-            for sid, rec in self.active_spawns.items():
+        active = list(self.active_spawns.items())
+        if active:
+            for sid, rec in active:
                 task_clean = sanitize_for_table(rec.task_summary, 50)
                 table += f"| `{sid}` | {rec.agent} | {rec.agent_type} | {rec.model} | {task_clean} | {rec.started_at} |\n"
         else:
@@ -152,16 +222,6 @@ class AgentLogger:
             active_agents_table=self._build_active_agents_table()
         )
 
-    def _ensure_iac_exists(self):
-        """Ensure IAC.md exists with proper header."""
-        if not self.iac_path.exists():
-            self.iac_path.write_text(self._build_header(), encoding='utf-8')
-
-    def _read_iac(self) -> str:
-        """Read IAC.md content."""
-        self._ensure_iac_exists()
-        return self.iac_path.read_text(encoding='utf-8')
-
     def _parse_iac_entries(self, content: str) -> list[str]:
         """Parse IAC.md content into individual entries.
 
@@ -183,30 +243,115 @@ class AgentLogger:
 
         return entries
 
+    def _disk_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self.iac_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_entries(self):
+        """(Re-)parse IAC.md into the entry list (lock held)."""
+        # Signature first: if the file changes mid-read, the next sync re-reads
+        self._disk_sig = self._disk_signature()
+        if self._disk_sig is None:
+            self._entries = []
+        else:
+            content = self.iac_path.read_text(encoding='utf-8')
+            self._entries = self._parse_iac_entries(content)
+
+    def _load_entries(self) -> list[str]:
+        """Return the in-memory entry list, parsing IAC.md on first use (lock held)."""
+        if self._entries is None:
+            self._read_entries()
+        return self._entries
+
+    def _sync_with_disk(self) -> list[str]:
+        """Pick up changes made to IAC.md by anyone else before overwriting
+        it: re-parse and replay this logger's unwritten changes (lock held)."""
+        entries = self._load_entries()
+        if self._disk_signature() != self._disk_sig:
+            self._read_entries()
+            entries = self._entries
+            for change in self._unsynced:
+                change(entries)
+        self._unsynced.clear()
+        return entries
+
+    def _render_iac(self, entries: list[str]) -> str:
+        """Render IAC.md: header (including active agents) and entries."""
+        return self._build_header() + "".join(entry + "\n\n" for entry in entries)
+
     def _write_iac(self, entries: list[str]):
         """Write IAC.md with header (including active agents) and entries."""
-        content = self._build_header()
-        for entry in entries:
-            content += entry + "\n\n"
-        self.iac_path.write_text(content, encoding='utf-8')
+        self.iac_path.write_text(self._render_iac(entries), encoding='utf-8')
+        self._disk_sig = self._disk_signature()
+
+    def _apply(self, change: Callable[[list[str]], None]):
+        """Apply a change to the entries and schedule the write (lock held)."""
+        change(self._load_entries())
+        self._unsynced.append(change)
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        """Record a change and write it out, or hand it to the writer (lock held).
+
+        With ``flush_interval`` 0 every event is written through. Otherwise
+        the background writer batches events within the interval into one
+        write, or writes sooner once IAC_FLUSH_MAX_PENDING are buffered; the
+        calling spawn never waits on file I/O.
+        """
+        self._pending += 1
+        if self.flush_interval <= 0:
+            self._write_iac(self._sync_with_disk())
+            self._pending = 0
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="powerspawn-iac", daemon=True)
+            self._writer.start()
+        if self._pending >= IAC_FLUSH_MAX_PENDING:
+            self._urgent.set()
+        self._dirty.set()
+
+    def _writer_loop(self):
+        """Background writer: wait for changes, coalesce, write."""
+        while True:
+            self._dirty.wait()
+            self._urgent.wait(self.flush_interval)
+            self._dirty.clear()
+            self._urgent.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the writer alive; the next change retries the write
+                print(f"Warning: Failed to write IAC.md: {e}")
+
+    def flush(self):
+        """Write any buffered IAC.md changes now."""
+        with self._write_lock:
+            # Snapshot under the state lock, do the file I/O outside it so
+            # spawns logging meanwhile aren't blocked on the disk
+            with _file_lock:
+                if not self._pending:
+                    return
+                content = self._render_iac(self._sync_with_disk())
+                self._pending = 0
+            self.iac_path.write_text(content, encoding='utf-8')
+            sig = self._disk_signature()
+            with _file_lock:
+                self._disk_sig = sig
 
     def _prepend_iac(self, new_entry: str):
         """Prepend a new entry to IAC.md, keeping only MAX_IAC_ENTRIES (thread-safe)."""
-        with _file_lock:
-            self._ensure_iac_exists()
-            content = self._read_iac()
-
-            # Parse existing entries
-            entries = self._parse_iac_entries(content)
-
-            # Prepend new entry
-            entries.insert(0, new_entry.strip())
+        new_entry = new_entry.strip()
 
+        def prepend(entries: list[str]):
+            entries.insert(0, new_entry)
             # Limit to MAX_IAC_ENTRIES
-            entries = entries[:MAX_IAC_ENTRIES]
+            del entries[MAX_IAC_ENTRIES:]
 
-            # Write back
-            self._write_iac(entries)
+        with _file_lock:
+            self._apply(prepend)
 
     def _update_iac_entry(
         self,
@@ -218,33 +363,25 @@ class AgentLogger:
         error: Optional[str] = None,
     ):
         """Update an existing IAC entry with completion data (thread-safe)."""
-        with _file_lock:
-            content = self._read_iac()
+        # Build status string for checkbox line
+        if success:
+            new_checkbox = f"- [x] ✅ **Done** ({duration_seconds:.1f}s, ${cost_usd:.4f})"
+        else:
+            new_checkbox = f"- [x] ❌ **Failed**: {error or 'Unknown'} ({duration_seconds:.1f}s)"
 
-            # Build status string for checkbox line
-            if success:
-                new_checkbox = f"- [x] ✅ **Done** ({duration_seconds:.1f}s, ${cost_usd:.4f})"
-            else:
-                new_checkbox = f"- [x] ❌ **Failed**: {error or 'Unknown'} ({duration_seconds:.1f}s)"
-
-            # Find and update the running checkbox line for this spawn
-            import re
-            # Match: - [ ] ⏳ **Running** | `#spawn_id` | rest of line
-            old_pattern = rf"- \[ \] ⏳ \*\*Running\*\* \| `#{spawn_id}` \| ([^\n]+)"
-            new_line = f"{new_checkbox} | `#{spawn_id}` | \\1"
-            content = re.sub(old_pattern, new_line, content)
-
-            # Replace result placeholder with actual result
-            result_placeholder = f"<!-- RESULT_{spawn_id} -->"
-            # Truncate very long results for display but keep essential info
-            display_result = result_text
-            if len(result_text) > 50000:
-                display_result = result_text[:25000] + "\n\n... [truncated] ...\n\n" + result_text[-25000:]
-
-            # Use 4 backticks as fence if result contains triple backticks
-            fence = "````" if "```" in display_result else "```"
-
-            result_block = f"""<details>
+        # Match: - [ ] ⏳ **Running** | `#spawn_id` | rest of line
+        old_pattern = rf"- \[ \] ⏳ \*\*Running\*\* \| `#{spawn_id}` \| ([^\n]+)"
+        new_line = f"{new_checkbox} | `#{spawn_id}` | \\1"
+
+        # Truncate very long results for display but keep essential info
+        display_result = result_text
+        if len(result_text) > 50000:
+            display_result = result_text[:25000] + "\n\n... [truncated] ...\n\n" + result_text[-25000:]
+
+        # Use 4 backticks as fence if result contains triple backticks
+        fence = "````" if "```" in display_result else "```"
+
+        result_block = f"""<details>
 <summary>📤 Output ({len(result_text)} chars)</summary>
 
 {fence}
@@ -252,10 +389,20 @@ class AgentLogger:
 {fence}
 
 </details>"""
-            content = content.replace(result_placeholder, result_block)
+        result_placeholder = f"<!-- RESULT_{spawn_id} -->"
+
+        def complete(entries: list[str]):
+            # Locate this spawn's entry by its result placeholder (newest
+            # first, so running entries are found near the front). If it was
+            # already trimmed (or never logged) only the header is refreshed.
+            for index, content in enumerate(entries):
+                if result_placeholder in content:
+                    content = re.sub(old_pattern, new_line, content)
+                    entries[index] = content.replace(result_placeholder, result_block)
+                    return
 
-            # Write back
-            self.iac_path.write_text(content, encoding='utf-8')
+        with _file_lock:
+            self._apply(complete)
 
     def log_spawn_start(
         self,
@@ -276,8 +423,10 @@ class AgentLogger:
 
         # Create task summary from first line of prompt if not provided
         if not task_summary:
-            first_line = prompt.split('\n')[0][:80]
-            task_summary = first_line + ('...' if len(prompt.split('\n')[0]) > 80 else '')
+            # partition stops at the first newline instead of splitting the
+            # whole (possibly huge) prompt into lines
+            first_line = prompt.partition('\n')[0]
+            task_summary = first_line[:80] + ('...' if len(first_line) > 80 else '')
 
         record = SpawnRecord(
             spawn_id=spawn_id,
@@ -351,23 +500,13 @@ class AgentLogger:
         # Store full result (not truncated)
         record.result_summary = result_text
 
+        # Remove from active spawns first so the single write below also
+        # refreshes the active agents table
+        self.active_spawns.pop(spawn_id, None)
+
         # Update existing entry in IAC.md instead of appending
         self._update_iac_entry(spawn_id, success, result_text, duration_seconds, cost_usd, error)
 
-        # Remove from active spawns
-        if spawn_id in self.active_spawns:
-            del self.active_spawns[spawn_id]
-
-        # Refresh IAC.md header to update active agents table
-        self._refresh_iac_header()
-
-    def _refresh_iac_header(self):
-        """Refresh the IAC.md header (active agents table) without touching entries."""
-        with _file_lock:
-            content = self._read_iac()
-            entries = self._parse_iac_entries(content)
-            self._write_iac(entries)
-
 
 # Global logger instance
 _logger: Optional[AgentLogger] = None
@@ -381,6 +520,23 @@ def get_logger() -> AgentLogger:
     return _logger
 
 
+def configure_logger(flush_interval: Optional[float] = None) -> AgentLogger:
+    """Replace the global logger, e.g. with a buffered one for the server.
+
+    Call before spawning: anything the previous logger still buffers is
+    written out first, then IAC.md is parsed here so the first logged event
+    doesn't read the disk.
+    """
+    global _logger
+    if _logger is not None:
+        _logger.flush()
+    new_logger = AgentLogger(flush_interval)
+    with _file_lock:
+        new_logger._load_entries()
+    _logger = new_logger
+    return new_logger
+
+
 def log_spawn_start(
     agent: str,
     model: str,
@@ -38,13 +38,16 @@ Changelog v1.7.1:
 """
 
 import asyncio
-import json
+import functools
+import inspect
 import sys
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from .agent_manager import agent_manager
+from . import fastjson
+from .agent_manager import agent_manager, max_async_spawns
 from .config import settings
+from .logger import SERVER_IAC_FLUSH_INTERVAL, configure_logger
 from .providers import (
     spawn_claude,
     spawn_codex,
@@ -54,16 +57,53 @@ from .providers import (
     spawn_gemini,
     spawn_gemini_cli,
     spawn_mistral,
-    spawn_cursor
+    spawn_cursor,
+    spawn_claude_async,
+    spawn_codex_async,
+    spawn_copilot_async,
+    spawn_gemini_cli_async,
+    spawn_grok_api_async,
+    spawn_gemini_async,
+    spawn_mistral_async,
 )
+from .providers.common import prewarm_api_clients_async
 
-# Ensure UTF-8 encoding on Windows
+# Ensure UTF-8 encoding on Windows (skipped when the stream is already UTF-8,
+# e.g. PYTHONIOENCODING=utf-8 / -X utf8, to avoid a flush + re-wrap at startup)
 if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    for _stream in (sys.stdout, sys.stderr):
+        if (_stream.encoding or "").lower().replace("-", "") != "utf8":
+            _stream.reconfigure(encoding='utf-8', errors='replace')
 
 SERVER_VERSION = "1.8.1"
 
+# Spawn tool name -> (agent_type, provider function); call_tool dispatches
+# with one dict lookup instead of walking an if/elif chain
+SPAWN_TOOLS = {
+    "spawn_claude": ("claude", spawn_claude),
+    "spawn_codex": ("codex", spawn_codex),
+    "spawn_copilot": ("copilot", spawn_copilot),
+    "spawn_gemini_cli": ("gemini_cli", spawn_gemini_cli),
+    "spawn_cursor": ("cursor", spawn_cursor),
+    "spawn_grok": ("grok", spawn_grok),
+    "spawn_grok_api": ("grok_api", spawn_grok_api),
+    "spawn_gemini": ("gemini", spawn_gemini),
+    "spawn_mistral": ("mistral", spawn_mistral),
+}
+
+# Providers with a native async variant run as tasks on the server's event
+# loop (API calls via async HTTP, CLIs via asyncio subprocesses); the rest
+# (Grok/Cursor CLIs) block a pool thread
+ASYNC_SPAWN_FUNCS = {
+    "claude": spawn_claude_async,
+    "codex": spawn_codex_async,
+    "copilot": spawn_copilot_async,
+    "gemini_cli": spawn_gemini_cli_async,
+    "grok_api": spawn_grok_api_async,
+    "gemini": spawn_gemini_async,
+    "mistral": spawn_mistral_async,
+}
+
 try:
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
@@ -80,8 +120,17 @@ server = Server("agents")
 # TOOL DEFINITIONS
 # =============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
+# Per-call response-cache options for the API tools (see llm_cache.py)
+_CACHE_OPTION_SCHEMA = {
+    "type": "object",
+    "properties": {"bypass": {"type": "boolean", "default": False}},
+    "description": "With POWERSPAWN_CACHE=1, temperature-0 answers are cached; bypass forces a fresh call.",
+}
+
+@functools.cache
+def _tool_list() -> list[Tool]:
+    """Tool definitions, built once: models.json is read at startup, so the
+    enums can't change while the server runs."""
     return [
         Tool(
             name="spawn_claude",
@@ -175,7 +224,9 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "prompt": {"type": "string"},
                     "model": {"type": "string", "enum": settings.get_model_list("grok-api")},
-                    "system_prompt": {"type": "string"}
+                    "system_prompt": {"type": "string"},
+                    "temperature": {"type": "number", "default": 0.7},
+                    "cache": _CACHE_OPTION_SCHEMA
                 }
             }
         ),
@@ -188,7 +239,9 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "prompt": {"type": "string"},
                     "model": {"type": "string", "enum": settings.get_model_list("gemini")},
-                    "system_prompt": {"type": "string"}
+                    "system_prompt": {"type": "string"},
+                    "temperature": {"type": "number", "default": 0.7},
+                    "cache": _CACHE_OPTION_SCHEMA
                 }
             }
         ),
@@ -201,7 +254,9 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "prompt": {"type": "string"},
                     "model": {"type": "string", "enum": settings.get_model_list("mistral")},
-                    "system_prompt": {"type": "string"}
+                    "system_prompt": {"type": "string"},
+                    "temperature": {"type": "number", "default": 0.7},
+                    "cache": _CACHE_OPTION_SCHEMA
                 }
             }
         ),
@@ -231,45 +286,64 @@ async def list_tools() -> list[Tool]:
         )
     ]
 
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _tool_list()
+
 # =============================================================================
 # TOOL HANDLERS
 # =============================================================================
 
+def _reply(payload: Any) -> list[TextContent]:
+    """Tool response: compact JSON (orjson when installed). The client parses
+    it, so indentation would only cost serialization time and tokens."""
+    return [TextContent(type="text", text=fastjson.dumps(payload))]
+
+# Constant reply, encoded once; the MCP layer only reads it
+_NOT_FOUND_REPLY = _reply({
+    "status": "not_found",
+    "message": "No agent found with this ID."
+})
+
+# Replies carrying more agent output than this are serialized on a worker
+# thread, so one huge result doesn't stall other tool calls on the loop
+_OFFLOAD_REPLY_CHARS = 1 << 20
+
+async def _reply_results(payload: Any, results: list[dict]) -> list[TextContent]:
+    """_reply for payloads holding agent results; large ones go off-loop."""
+    size = sum(len(r.get("result") or "") for r in results)
+    if size < _OFFLOAD_REPLY_CHARS:
+        return _reply(payload)
+    return await asyncio.to_thread(_reply, payload)
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     try:
-        if name == "spawn_claude":
-            return await handle_spawn(arguments, "claude", spawn_claude)
-        elif name == "spawn_codex":
-            return await handle_spawn(arguments, "codex", spawn_codex)
-        elif name == "spawn_copilot":
-            return await handle_spawn(arguments, "copilot", spawn_copilot)
-        elif name == "spawn_gemini_cli":
-            return await handle_spawn(arguments, "gemini_cli", spawn_gemini_cli)
-        elif name == "spawn_cursor":
-            return await handle_spawn(arguments, "cursor", spawn_cursor)
-        elif name == "spawn_grok":
-            return await handle_spawn(arguments, "grok", spawn_grok)
-        elif name == "spawn_grok_api":
-            return await handle_spawn(arguments, "grok_api", spawn_grok_api)
-        elif name == "spawn_gemini":
-            return await handle_spawn(arguments, "gemini", spawn_gemini)
-        elif name == "spawn_mistral":
-            return await handle_spawn(arguments, "mistral", spawn_mistral)
-        elif name == "list":
-            return await handle_list()
-        elif name == "result":
-            return await handle_result(arguments)
-        elif name == "wait_for_agents":
-            return await handle_wait_for_agents(arguments)
-        else:
-            return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+        spawn = SPAWN_TOOLS.get(name)
+        if spawn is not None:
+            agent_type, spawn_func = spawn
+            return await handle_spawn(arguments, agent_type, spawn_func)
+        handler = MANAGEMENT_TOOLS.get(name)
+        if handler is None:
+            return _reply({"error": f"Unknown tool: {name}"})
+        return await handler(arguments)
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({
+        return _reply({
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__
-        }, indent=2))]
+        })
+
+@functools.cache
+def _accepted_kwargs(spawn_func) -> frozenset:
+    """Parameter names a spawn function takes, read from its signature once."""
+    return frozenset(inspect.signature(spawn_func).parameters)
+
+def _spawn_kwargs(args: dict, spawn_func) -> dict:
+    """Tool arguments the spawn function accepts; anything else the client
+    sent (extra or legacy fields) is dropped rather than failing the spawn."""
+    accepted = _accepted_kwargs(spawn_func)
+    return {k: v for k, v in args.items() if k in accepted}
 
 async def handle_spawn(args: dict, agent_type: str, spawn_func) -> list[TextContent]:
     """Generic handler for all spawn functions."""
@@ -279,47 +353,70 @@ async def handle_spawn(args: dict, agent_type: str, spawn_func) -> list[TextCont
     # Register intent to start
     agent_id = agent_manager.register_start(agent_type, model or "default", prompt)
     
-    def run_wrapper():
-        try:
-            # Call the specific provider function with passed args
-            # Using **args to pass optional params like system_prompt, timeout etc.
-            result = spawn_func(**args)
-            
-            # Register completion
-            agent_manager.register_complete(agent_id, {
-                "success": result.success,
-                "result": result.text,
-                "cost_usd": result.cost_usd,
-                "error": result.error,
-                "usage": result.usage
-            })
-        except Exception as e:
-            agent_manager.register_complete(agent_id, {
-                "success": False,
-                "result": "",
-                "error": str(e)
-            })
-
-    # Start background thread
-    thread = threading.Thread(target=run_wrapper, daemon=True)
-    agent_manager.register_thread(agent_id, thread)
-    thread.start()
-
-    return [TextContent(type="text", text=json.dumps({
+    def record(result):
+        data = {
+            "success": result.success,
+            "result": result.text,
+            "cost_usd": result.cost_usd,
+            "error": result.error,
+            "usage": result.usage
+        }
+        if result.cached:
+            data["cached"] = True
+        agent_manager.register_complete(agent_id, data)
+
+    def record_error(e: Exception):
+        agent_manager.register_complete(agent_id, {
+            "success": False,
+            "result": "",
+            "error": str(e)
+        })
+
+    async_func = ASYNC_SPAWN_FUNCS.get(agent_type)
+    if async_func is not None:
+        kwargs = _spawn_kwargs(args, async_func)
+
+        async def run_async():
+            try:
+                record(await async_func(**kwargs))
+            except Exception as e:
+                record_error(e)
+
+        agent_manager.submit_spawn_async(agent_id, run_async())
+    else:
+        kwargs = _spawn_kwargs(args, spawn_func)
+
+        def run_wrapper():
+            try:
+                # Call the specific provider function with the accepted args
+                # (optional params like system_prompt, timeout etc.)
+                record(spawn_func(**kwargs))
+            except Exception as e:
+                record_error(e)
+
+        # Run in the background on the shared spawn pool
+        agent_manager.submit_spawn(agent_id, run_wrapper)
+
+    return _reply({
         "agent_id": agent_id,
         "agent_type": agent_type,
         "status": "running",
         "message": f"{agent_type} agent spawned."
-    }, indent=2))]
+    })
 
 async def handle_list() -> list[TextContent]:
     running = agent_manager.get_running_list()
     recent = agent_manager.get_recent_completed_ids()
-    return [TextContent(type="text", text=json.dumps({
+    payload = {
         "running": running,
         "completed_ids": recent,
         "tip": "Use wait_for_agents() to block until done"
-    }))]
+    }
+    queued = agent_manager.queued_async_count()
+    if queued:
+        # Registered but waiting for a POWERSPAWN_MAX_CONCURRENCY slot
+        payload["queued"] = queued
+    return _reply(payload)
 
 async def handle_result(args: dict) -> list[TextContent]:
     agent_id = args["agent_id"]
@@ -327,33 +424,54 @@ async def handle_result(args: dict) -> list[TextContent]:
     # Check completed
     res = agent_manager.get_result(agent_id)
     if res:
-        return [TextContent(type="text", text=json.dumps(res, indent=2, ensure_ascii=False))]
+        return await _reply_results(res, [res])
         
     # Check running
     info = agent_manager.get_running_info(agent_id)
     if info:
-        return [TextContent(type="text", text=json.dumps({
+        return _reply({
             "agent_id": agent_id,
             "status": "running",
             "message": "Agent still running."
-        }, indent=2))]
+        })
         
-    return [TextContent(type="text", text=json.dumps({
-        "status": "not_found",
-        "message": "No agent found with this ID."
-    }))]
+    return _NOT_FOUND_REPLY
 
 async def handle_wait_for_agents(args: dict) -> list[TextContent]:
     timeout = args.get("timeout", 300)
-    # Blocking wait on threads/events
-    result = await asyncio.to_thread(agent_manager.wait_for_all, timeout)
-    return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
+    # Awaits the agents' futures on the loop; no thread parked per waiter
+    result = await agent_manager.wait_for_all_async(timeout)
+    results = (result.get("results") or result.get("completed_results")
+               or result.get("recent_results") or [])
+    return await _reply_results(result, results)
+
+# Management tool name -> handler(arguments)
+MANAGEMENT_TOOLS = {
+    "list": lambda args: handle_list(),
+    "result": handle_result,
+    "wait_for_agents": handle_wait_for_agents,
+}
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
 async def main():
+    # asyncio's default executor is min(32, cpu_count + 4) threads. Async
+    # spawns use it for their capture-file and cache I/O (and large replies
+    # are encoded on it), so give every async spawn slot a thread unless
+    # POWERSPAWN_THREAD_POOL_SIZE says otherwise
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.thread_pool_size or max_async_spawns(),
+                           thread_name_prefix="powerspawn-io")
+    )
+    # Coalesce IAC.md writes on the logger's writer thread so spawns logging
+    # on this loop never wait on the file (and load IAC.md off the loop now)
+    await asyncio.to_thread(configure_logger, SERVER_IAC_FLUSH_INTERVAL)
+    # Import API SDKs, build clients and open connections (sync pool and this
+    # loop's async pool) while the MCP client is still connecting
+    # (referenced until main returns so the task is not garbage-collected)
+    prewarm = asyncio.create_task(prewarm_api_clients_async())
     async with stdio_server() as (read_stream, write_stream):
         init_options = InitializationOptions(
             server_name="agents",
@@ -22,13 +22,21 @@ required to launch the ``.cmd`` / ``.ps1`` CLI shims npm/installer put on PATH:
   that a child could block reading);
 * on timeout the whole PROCESS TREE is killed (``taskkill /T`` on Windows,
   ``killpg`` elsewhere), so a wedged run always returns within ``timeout``.
+
+The ``cmd.exe`` wrapper is only used when it's needed: ``resolve_command``
+execs a CLI that resolves to a real ``.exe`` directly, which saves starting
+a shell per spawn; shims (``.cmd``/``.bat``/``.ps1``) keep the wrapper.
 """
 
+import asyncio
+import contextlib
+import functools
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 IS_WINDOWS = sys.platform == "win32"
 
@@ -48,6 +56,32 @@ def kill_process_tree(pid: int) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=32)
+def _which(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+def resolve_command(cmd, shell: Optional[bool] = None) -> Tuple[Union[list, str], bool]:
+    """Return ``(cmd, shell)`` to launch ``cmd`` with.
+
+    An explicit ``shell`` is kept as given. Otherwise, off Windows argv lists
+    are exec'd directly as before. On Windows a list whose program resolves
+    on PATH to an ``.exe`` is exec'd directly by full path; anything else
+    (npm ``.cmd`` shims, ``.ps1`` installers, a plain string) goes through
+    the shell, which is what finds and runs those.
+    """
+    if shell is not None:
+        return cmd, shell
+    if not IS_WINDOWS:
+        return cmd, False
+    if isinstance(cmd, str):
+        return cmd, True
+    exe = _which(cmd[0])
+    if exe and exe.lower().endswith(".exe"):
+        return [exe, *cmd[1:]], False
+    return cmd, True
+
+
 def _read_text_file(path: str) -> str:
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as fh:
@@ -56,34 +90,29 @@ def _read_text_file(path: str) -> str:
         return ""
 
 
-def run_captured(
-    cmd,
-    *,
-    cwd: Optional[str] = None,
-    timeout: int = 300,
-    stdin_text: Optional[str] = None,
-    shell: Optional[bool] = None,
-) -> Tuple[int, str, str, bool]:
-    """Run ``cmd`` capturing stdout/stderr to temp files.
+def _read_bytes_file(path: str) -> bytes:
+    try:
+        with open(path, "rb") as fh:
+            return fh.read()
+    except OSError:
+        return b""
 
-    Returns ``(returncode, stdout, stderr, timed_out)``. Never blocks longer
-    than ``timeout`` (+ a short kill grace): on timeout the process tree is
-    killed and whatever was captured so far is returned with ``timed_out=True``.
 
-    ``stdin_text`` is delivered to the child's stdin via a temp file; when None,
-    stdin is DEVNULL so a child that reads stdin gets EOF instead of blocking.
-    """
-    if shell is None:
-        shell = IS_WINDOWS
+def _read_output(out_path: str, err_path: str, raw_stdout: bool):
+    stdout = _read_bytes_file(out_path) if raw_stdout else _read_text_file(out_path)
+    return stdout.strip(), _read_text_file(err_path).strip()
 
+
+@contextlib.contextmanager
+def _capture_files(stdin_text: Optional[str]):
+    """Temp files for a captured run: yields (stdin, stdout, stderr, out_path,
+    err_path) and removes everything afterwards."""
     out_fd, out_path = tempfile.mkstemp(prefix="powerspawn-", suffix=".out")
     err_fd, err_path = tempfile.mkstemp(prefix="powerspawn-", suffix=".err")
     os.close(out_fd)
     os.close(err_fd)
     in_path = None
     stdin_handle = None
-    proc = None
-    timed_out = False
 
     try:
         if stdin_text is not None:
@@ -97,26 +126,7 @@ def run_captured(
 
         with open(out_path, "w", encoding="utf-8") as fout, \
                 open(err_path, "w", encoding="utf-8") as ferr:
-            proc = subprocess.Popen(
-                cmd,
-                stdin=stdin_arg,
-                stdout=fout,
-                stderr=ferr,
-                cwd=cwd,
-                shell=shell,
-            )
-            try:
-                proc.wait(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                timed_out = True
-                kill_process_tree(proc.pid)
-                try:
-                    proc.wait(timeout=15)
-                except subprocess.TimeoutExpired:
-                    pass
-
-        returncode = proc.returncode if proc is not None else -1
-        return returncode, _read_text_file(out_path).strip(), _read_text_file(err_path).strip(), timed_out
+            yield stdin_arg, fout, ferr, out_path, err_path
 
     finally:
         if stdin_handle is not None:
@@ -130,3 +140,114 @@ def run_captured(
                     os.unlink(path)
                 except OSError:
                     pass
+
+
+@contextlib.asynccontextmanager
+async def _capture_files_async(stdin_text: Optional[str]):
+    """``_capture_files`` with the temp-file setup and cleanup done in a worker
+    thread, so an async run never touches the disk on the event loop."""
+    files = _capture_files(stdin_text)
+    handles = await asyncio.to_thread(files.__enter__)
+    try:
+        yield handles
+    finally:
+        await asyncio.to_thread(files.__exit__, None, None, None)
+
+
+def run_captured(
+    cmd,
+    *,
+    cwd: Optional[str] = None,
+    timeout: int = 300,
+    stdin_text: Optional[str] = None,
+    shell: Optional[bool] = None,
+    raw_stdout: bool = False,
+) -> Tuple[int, Union[str, bytes], str, bool]:
+    """Run ``cmd`` capturing stdout/stderr to temp files.
+
+    Returns ``(returncode, stdout, stderr, timed_out)``. Never blocks longer
+    than ``timeout`` (+ a short kill grace): on timeout the process tree is
+    killed and whatever was captured so far is returned with ``timed_out=True``.
+
+    ``stdin_text`` is delivered to the child's stdin via a temp file; when None,
+    stdin is DEVNULL so a child that reads stdin gets EOF instead of blocking.
+
+    With ``raw_stdout`` stdout comes back as undecoded bytes, for callers that
+    hand it straight to a JSON parser.
+    """
+    cmd, shell = resolve_command(cmd, shell)
+
+    proc = None
+    timed_out = False
+
+    with _capture_files(stdin_text) as (stdin_arg, fout, ferr, out_path, err_path):
+        proc = subprocess.Popen(
+            cmd,
+            stdin=stdin_arg,
+            stdout=fout,
+            stderr=ferr,
+            cwd=cwd,
+            shell=shell,
+        )
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            kill_process_tree(proc.pid)
+            try:
+                proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                pass
+
+        returncode = proc.returncode if proc is not None else -1
+        return (returncode, *_read_output(out_path, err_path, raw_stdout), timed_out)
+
+
+async def run_captured_async(
+    cmd,
+    *,
+    cwd: Optional[str] = None,
+    timeout: int = 300,
+    stdin_text: Optional[str] = None,
+    shell: Optional[bool] = None,
+    raw_stdout: bool = False,
+) -> Tuple[int, Union[str, bytes], str, bool]:
+    """Async ``run_captured``: same capture and timeout guarantees, but the
+    child is awaited on the event loop instead of blocking a thread.
+
+    Off Windows the child gets its own session, so the process-tree kill on
+    timeout (or on cancellation, which is re-raised) can't reach the caller's
+    process group.
+    """
+    cmd, shell = resolve_command(cmd, shell)
+
+    timed_out = False
+
+    async with _capture_files_async(stdin_text) as (stdin_arg, fout, ferr, out_path, err_path):
+        if shell:
+            proc = await asyncio.create_subprocess_shell(
+                cmd if isinstance(cmd, str) else subprocess.list2cmdline(cmd),
+                stdin=stdin_arg, stdout=fout, stderr=ferr, cwd=cwd,
+                start_new_session=not IS_WINDOWS,
+            )
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=stdin_arg, stdout=fout, stderr=ferr, cwd=cwd,
+                start_new_session=not IS_WINDOWS,
+            )
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await asyncio.to_thread(kill_process_tree, proc.pid)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=15)
+            except asyncio.TimeoutError:
+                pass
+        except asyncio.CancelledError:
+            await asyncio.shield(asyncio.to_thread(kill_process_tree, proc.pid))
+            raise
+
+        returncode = proc.returncode if proc.returncode is not None else -1
+        output = await asyncio.to_thread(_read_output, out_path, err_path, raw_stdout)
+        return (returncode, *output, timed_out)
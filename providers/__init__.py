@@ -1,16 +1,52 @@
 """
 Providers Package
+
+Every provider is loaded on first attribute access (PEP 562): importing the
+package, e.g. for AgentResult, costs nothing beyond the shared types, and a
+caller that only spawns Claude never imports the other providers or the
+API SDKs behind them.
 """
+import importlib
+
 from .types import AgentResult
-from .claude import spawn_claude
-from .codex import spawn_codex
-from .copilot import spawn_copilot
-from .grok import spawn_grok
-from .grok_api import spawn_grok_api
-from .gemini import spawn_gemini
-from .gemini_cli import spawn_gemini_cli
-from .mistral import spawn_mistral
-from .cursor import spawn_cursor
+
+# Lazily exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "spawn_claude": ".claude",
+    "spawn_claude_async": ".claude",
+    "spawn_codex": ".codex",
+    "spawn_codex_async": ".codex",
+    "spawn_copilot": ".copilot",
+    "spawn_copilot_async": ".copilot",
+    "spawn_grok": ".grok",
+    "spawn_gemini_cli": ".gemini_cli",
+    "spawn_gemini_cli_async": ".gemini_cli",
+    "spawn_cursor": ".cursor",
+    "spawn_grok_api": ".grok_api",
+    "spawn_grok_api_async": ".grok_api",
+    "spawn_grok_api_stream": ".grok_api",
+    "spawn_gemini": ".gemini",
+    "spawn_gemini_async": ".gemini",
+    "spawn_gemini_stream": ".gemini",
+    "spawn_mistral": ".mistral",
+    "spawn_mistral_async": ".mistral",
+    "spawn_mistral_batch": ".mistral",
+    "spawn_batch": ".batch",
+    "spawn_api_batch": ".batch",
+    "spawn_race": ".batch",
+    "spawn_api_race": ".batch",
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __all__ = [
     "AgentResult",
@@ -23,4 +59,18 @@ __all__ = [
     "spawn_gemini_cli",
     "spawn_mistral",
     "spawn_cursor",
+    "spawn_claude_async",
+    "spawn_codex_async",
+    "spawn_copilot_async",
+    "spawn_gemini_cli_async",
+    "spawn_grok_api_async",
+    "spawn_grok_api_stream",
+    "spawn_gemini_async",
+    "spawn_gemini_stream",
+    "spawn_mistral_async",
+    "spawn_batch",
+    "spawn_api_batch",
+    "spawn_race",
+    "spawn_api_race",
+    "spawn_mistral_batch",
 ]
@@ -0,0 +1,183 @@
+"""
+Concurrent fan-out for API providers
+
+The API providers are network-bound: a coordinator asking three models for a
+second opinion, or one model for N independent answers, spends nearly all of
+its time waiting on HTTP. Running the async provider variants on one event loop
+overlaps those waits, so a batch takes ~max(latency) instead of sum(latency),
+without a thread per request.
+
+Usage:
+    results = asyncio.run(spawn_batch([
+        ("grok-api", "Summarize X"),
+        ("gemini", "Summarize X"),
+        ("mistral", "Summarize X"),
+    ]))
+
+    # Per-job models ride in an optional third element
+    results = asyncio.run(spawn_batch([
+        ("grok-api", "Summarize X", "grok-4"),
+        ("gemini", "Summarize X", "flash"),
+    ]))
+
+    # Same provider, many prompts, from synchronous code
+    results = spawn_api_batch(prompts, provider="gemini", max_concurrency=4)
+
+    # Second opinion, fastest answer wins
+    result = spawn_api_race("Summarize X")
+"""
+
+import asyncio
+from typing import Optional
+
+from .types import AgentResult
+from .common import async_http_pool
+from .grok_api import spawn_grok_api_async
+from .gemini import spawn_gemini_async
+from .mistral import spawn_mistral_async
+
+# Provider name (as used in models.json / AgentResult.provider) -> async spawn
+ASYNC_SPAWNERS = {
+    "grok-api": spawn_grok_api_async,
+    "gemini": spawn_gemini_async,
+    "mistral": spawn_mistral_async,
+}
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RACE_PROVIDERS = ("grok-api", "gemini", "mistral")
+
+
+# Alternate spellings accepted for providers in jobs / race lists. Plain
+# "grok" is the Grok CLI provider (models.json), so it is not mapped here.
+PROVIDER_ALIASES = {
+    "grok_api": "grok-api",
+    "xai": "grok-api",
+    "x.ai": "grok-api",
+    "google": "gemini",
+}
+
+
+def _canonical_provider(provider: str) -> str:
+    # One lookup for exact names; aliases / other casing take the slow path
+    if provider in ASYNC_SPAWNERS:
+        return provider
+    key = provider.lower()
+    return PROVIDER_ALIASES.get(key, key)
+
+
+async def _spawn_one(provider: str, prompt: str, **kwargs) -> AgentResult:
+    spawn_fn = ASYNC_SPAWNERS.get(_canonical_provider(provider))
+    if spawn_fn is None:
+        return AgentResult(
+            success=False,
+            text="",
+            error=f"Unknown API provider: {provider}",
+            provider=provider,
+        )
+    return await spawn_fn(prompt, **kwargs)
+
+
+async def spawn_batch(
+    jobs: list[tuple],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    model: Optional[str] = None,
+    **kwargs,
+) -> list[AgentResult]:
+    """
+    Run ``(provider, prompt)`` or ``(provider, prompt, model)`` jobs
+    concurrently; results keep the job order.
+
+    Model names are provider-specific, so a job's own model takes precedence,
+    and the shared ``model`` is only accepted when every job uses the same
+    provider (ValueError otherwise). Jobs with neither use the provider's
+    default model.
+
+    At most ``max_concurrency`` requests are in flight at once. Extra keyword
+    arguments (system_prompt, temperature, timeout, ...) are passed to every
+    spawn. An unknown provider yields a failed AgentResult rather than raising,
+    matching how the spawn functions themselves report errors.
+    """
+    if model is not None and len({_canonical_provider(job[0]) for job in jobs}) > 1:
+        raise ValueError(
+            "spawn_batch: model= applies to every job, but the jobs use several "
+            "providers; give each job its own model as (provider, prompt, model)"
+        )
+
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run_one(provider: str, prompt: str, job_model: Optional[str] = None) -> AgentResult:
+        async with sem:
+            return await _spawn_one(provider, prompt, model=job_model or model, **kwargs)
+
+    return await asyncio.gather(*(run_one(*job) for job in jobs))
+
+
+def spawn_api_batch(
+    prompts: list[str],
+    *,
+    provider: str,
+    model: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    **kwargs,
+) -> list[AgentResult]:
+    """
+    Synchronous wrapper: run many prompts against one API provider concurrently.
+
+    Runs spawn_batch on a fresh event loop, so it can't be called from inside
+    a running loop; async callers should await spawn_batch directly. The
+    loop's connection pool is closed before returning.
+    """
+    jobs = [(provider, prompt) for prompt in prompts]
+
+    async def run():
+        async with async_http_pool():
+            return await spawn_batch(jobs, max_concurrency=max_concurrency, model=model, **kwargs)
+
+    return asyncio.run(run())
+
+
+async def spawn_race(
+    prompt: str,
+    *,
+    providers: tuple[str, ...] = DEFAULT_RACE_PROVIDERS,
+    **kwargs,
+) -> AgentResult:
+    """
+    Send one prompt to several API providers at once; the first success wins.
+
+    The remaining requests are cancelled as soon as one succeeds, so
+    wall-clock is the fastest provider's latency. If every provider fails,
+    the last failure is returned. Each provider uses its default model;
+    extra keyword arguments are passed to every spawn.
+    """
+    pending = {asyncio.create_task(_spawn_one(p, prompt, **kwargs)) for p in providers}
+    result = AgentResult(success=False, text="", error="No providers given")
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result.success:
+                    return result
+        return result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def spawn_api_race(
+    prompt: str,
+    *,
+    providers: tuple[str, ...] = DEFAULT_RACE_PROVIDERS,
+    **kwargs,
+) -> AgentResult:
+    """Synchronous wrapper for spawn_race (fresh event loop and connection
+    pool, closed before returning, like spawn_api_batch)."""
+    async def run():
+        async with async_http_pool():
+            return await spawn_race(prompt, providers=providers, **kwargs)
+
+    return asyncio.run(run())
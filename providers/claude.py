@@ -2,29 +2,30 @@
 Claude CLI Provider
 """
 
+import asyncio
+import dataclasses
 import json
 import subprocess
 import time
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+from .. import fastjson
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
-from ..proc import run_captured
-from ..context import inject_agents_context
+from ..proc import run_captured, run_captured_async
+from ..context import WORKSPACE_DIR, inject_agents_context
 from .types import AgentResult
 
 IS_WINDOWS = sys.platform == "win32"
 
-def get_workspace_dir() -> Path:
-    """Get the workspace root directory (parent of powerspawn/)."""
-    return Path(__file__).parent.parent.parent
+# Invariant part of the CLI command, built once
+_CLAUDE_BASE_CMD = ("claude", "-p", "--output-format", "json")
 
-def _parse_claude_response(response_text: str) -> AgentResult:
-    """Parse JSON output from Claude CLI."""
+def _parse_claude_response(response_text: Union[str, bytes]) -> AgentResult:
+    """Parse JSON output from Claude CLI (str, or the raw stdout bytes)."""
     try:
-        data = json.loads(response_text)
+        data = fastjson.loads(response_text)
         return AgentResult(
             success=data.get("type") == "result" and data.get("subtype") == "success",
             text=data.get("result", ""),
@@ -37,7 +38,7 @@ def _parse_claude_response(response_text: str) -> AgentResult:
             raw_response=data,
             provider="claude"
         )
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return AgentResult(
             success=False,
             text="",
@@ -45,24 +46,18 @@ def _parse_claude_response(response_text: str) -> AgentResult:
             provider="claude"
         )
 
-def spawn_claude(
+def _start_claude(
     prompt: str,
-    *,
-    model: str = None,
-    tools: Optional[list[str]] = None,
-    timeout: int = 300,
-    task_summary: Optional[str] = None,
-    dangerously_skip_permissions: bool = True,
-    working_dir: Optional[str] = None,
-) -> AgentResult:
-    """
-    Spawn a Claude CLI agent.
-    
-    Context Handling:
-        Claude CLI automatically loads CLAUDE.md from the project root.
+    model: Optional[str],
+    tools: Optional[list[str]],
+    task_summary: Optional[str],
+    dangerously_skip_permissions: bool,
+    working_dir: Optional[str],
+):
+    """Resolve, log and build the CLI run shared by the sync and async spawns.
+
+    Returns (spawn_id, resolved_model, cmd, cwd, prompt-with-context).
     """
-    start_time = time.time()
-    
     # Resolve model
     resolved_model = settings.get_model_alias("claude", model)
     
@@ -77,8 +72,7 @@ def spawn_claude(
     )
     
     # Build command
-    cmd = ["claude", "-p", "--output-format", "json"]
-    cmd.extend(["--model", resolved_model])
+    cmd = [*_CLAUDE_BASE_CMD, "--model", resolved_model]
     
     if tools:
         cmd.extend(["--tools", ",".join(tools)])
@@ -86,54 +80,110 @@ def spawn_claude(
     if dangerously_skip_permissions:
         cmd.append("--dangerously-skip-permissions")
 
-    cwd = working_dir or str(get_workspace_dir())
+    cwd = working_dir or WORKSPACE_DIR
     # AGENTS.md is the shared worker briefing; Claude's CLI only auto-loads
     # CLAUDE.md (coordinator instruction), so inject AGENTS.md explicitly.
     prompt = inject_agents_context(prompt, working_dir, provider="claude")
+    return spawn_id, resolved_model, cmd, cwd, prompt
 
-    try:
-        # Hardened run: prompt via stdin, output to temp files (no pipe-EOF
-        # drain hang), process-tree kill on timeout. See powerspawn/proc.py.
-        returncode, stdout_text, stderr_text, timed_out = run_captured(
-            cmd, cwd=cwd, timeout=timeout, stdin_text=prompt,
-        )
+def _finish_claude(spawn_id: str, resolved_model: str, start_time: float, timeout: int, run) -> AgentResult:
+    """Turn a run_captured(_async) result into a logged AgentResult."""
+    returncode, stdout_text, stderr_text, timed_out = run
+    duration = time.perf_counter() - start_time
 
-        duration = time.time() - start_time
-
-        if timed_out or (returncode != 0 and not stdout_text):
-            error_msg = (f"Timed out after {timeout}s; process tree killed"
-                         if timed_out else (stderr_text or f"Exit code {returncode}"))
-            log_spawn_complete(
-                spawn_id=spawn_id,
-                success=False,
-                result_text="",
-                duration_seconds=duration,
-                error=error_msg
-            )
-            return AgentResult(success=False, text="", spawn_id=spawn_id, error=error_msg, provider="claude")
-
-        agent_result = _parse_claude_response(stdout_text)
-        agent_result.spawn_id = spawn_id
-        agent_result.model = resolved_model
-        
-        log_spawn_complete(
-            spawn_id=spawn_id,
-            success=agent_result.success,
-            result_text=agent_result.text,
-            duration_seconds=duration,
-            cost_usd=agent_result.cost_usd,
-            error=agent_result.error
-        )
-        
-        return agent_result
-        
-    except Exception as e:
-        duration = time.time() - start_time
+    if timed_out or (returncode != 0 and not stdout_text):
+        error_msg = (f"Timed out after {timeout}s; process tree killed"
+                     if timed_out else (stderr_text or f"Exit code {returncode}"))
         log_spawn_complete(
             spawn_id=spawn_id,
             success=False,
             result_text="",
             duration_seconds=duration,
-            error=str(e)
+            error=error_msg
         )
-        return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="claude")
+        return AgentResult(success=False, text="", spawn_id=spawn_id, error=error_msg, provider="claude")
+
+    agent_result = dataclasses.replace(
+        _parse_claude_response(stdout_text), spawn_id=spawn_id, model=resolved_model
+    )
+    
+    log_spawn_complete(
+        spawn_id=spawn_id,
+        success=agent_result.success,
+        result_text=agent_result.text,
+        duration_seconds=duration,
+        cost_usd=agent_result.cost_usd,
+        error=agent_result.error
+    )
+    
+    return agent_result
+
+def _claude_error(spawn_id: str, start_time: float, e: Exception) -> AgentResult:
+    duration = time.perf_counter() - start_time
+    log_spawn_complete(
+        spawn_id=spawn_id,
+        success=False,
+        result_text="",
+        duration_seconds=duration,
+        error=str(e)
+    )
+    return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="claude")
+
+def spawn_claude(
+    prompt: str,
+    *,
+    model: str = None,
+    tools: Optional[list[str]] = None,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    dangerously_skip_permissions: bool = True,
+    working_dir: Optional[str] = None,
+) -> AgentResult:
+    """
+    Spawn a Claude CLI agent.
+    
+    Context Handling:
+        Claude CLI automatically loads CLAUDE.md from the project root.
+    """
+    start_time = time.perf_counter()
+    spawn_id, resolved_model, cmd, cwd, prompt = _start_claude(
+        prompt, model, tools, task_summary, dangerously_skip_permissions, working_dir
+    )
+
+    try:
+        # Hardened run: prompt via stdin, output to temp files (no pipe-EOF
+        # drain hang), process-tree kill on timeout. See powerspawn/proc.py.
+        run = run_captured(cmd, cwd=cwd, timeout=timeout, stdin_text=prompt, raw_stdout=True)
+        return _finish_claude(spawn_id, resolved_model, start_time, timeout, run)
+    except Exception as e:
+        return _claude_error(spawn_id, start_time, e)
+
+async def spawn_claude_async(
+    prompt: str,
+    *,
+    model: str = None,
+    tools: Optional[list[str]] = None,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    dangerously_skip_permissions: bool = True,
+    working_dir: Optional[str] = None,
+) -> AgentResult:
+    """
+    Async variant of spawn_claude: the CLI is awaited on the event loop
+    (proc.run_captured_async) instead of blocking a thread for the whole run.
+    """
+    start_time = time.perf_counter()
+    # _start_claude reads AGENTS.md and logs the start: keep that disk I/O
+    # off the event loop
+    spawn_id, resolved_model, cmd, cwd, prompt = await asyncio.to_thread(
+        _start_claude, prompt, model, tools, task_summary, dangerously_skip_permissions, working_dir
+    )
+
+    try:
+        run = await run_captured_async(cmd, cwd=cwd, timeout=timeout, stdin_text=prompt, raw_stdout=True)
+        return _finish_claude(spawn_id, resolved_model, start_time, timeout, run)
+    except asyncio.CancelledError:
+        _claude_error(spawn_id, start_time, Exception("Cancelled"))
+        raise
+    except Exception as e:
+        return _claude_error(spawn_id, start_time, e)
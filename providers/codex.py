@@ -2,64 +2,82 @@
 Codex CLI Provider
 """
 
+import asyncio
 import json
 import subprocess
 import threading
 import time
 import sys
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Optional, Iterator
+from typing import AsyncIterator, Optional, Iterator, Union
 
+from .. import fastjson
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
-from ..proc import kill_process_tree
+from ..context import WORKSPACE_DIR
+from ..proc import kill_process_tree, resolve_command
 from .types import AgentResult
 
 IS_WINDOWS = sys.platform == "win32"
 
-def get_workspace_dir() -> Path:
-    return Path(__file__).parent.parent.parent
-
-@dataclass
+@dataclass(slots=True)
 class CodexEvent:
     type: str
     data: dict = field(default_factory=dict)
+    # Pulled out of data once at construction: the spawn_codex reducer checks
+    # these on every event of the stream
+    item: dict = field(init=False, repr=False, compare=False)
+    item_type: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.item = self.data.get("item") or {}
+        self.item_type = self.item.get("type")
     
     @property
     def is_message(self) -> bool:
-        return self.type == "item.completed" and self.data.get("item", {}).get("type") == "agent_message"
+        return self.type == "item.completed" and self.item_type == "agent_message"
     
     @property
     def is_command(self) -> bool:
-        return self.data.get("item", {}).get("type") == "command_execution"
+        return self.item_type == "command_execution"
         
     @property
     def text(self) -> Optional[str]:
         if self.is_message:
-            return self.data.get("item", {}).get("text")
+            return self.item.get("text")
         return None
         
     @property
     def command_output(self) -> Optional[str]:
         if self.is_command:
-            return self.data.get("item", {}).get("aggregated_output")
+            return self.item.get("aggregated_output")
         return None
 
-def _parse_codex_event(line: str) -> Optional[CodexEvent]:
-    try:
-        data = json.loads(line)
-        return CodexEvent(type=data.get("type", "unknown"), data=data)
-    except json.JSONDecodeError:
+_OBJECT_START = ("{", b"{")
+
+def _parse_codex_event(line: Union[str, bytes]) -> Optional[CodexEvent]:
+    # Runs once per JSONL event (thousands per turn): orjson when available,
+    # straight from the pipe's bytes. Events are objects, so blank lines and
+    # the CLI's plain-text banner are dropped without raising a parse error.
+    if line[:1] not in _OBJECT_START and line.lstrip()[:1] not in _OBJECT_START:
         return None
+    try:
+        data = fastjson.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # Invalid UTF-8 inside an event (orjson reports it as a decode
+        # error): the text pipe used to turn the bad bytes into U+FFFD, so
+        # do the same instead of dropping the event, which may be the
+        # final agent_message or turn.completed
+        if not isinstance(line, bytes):
+            return None
+        try:
+            data = fastjson.loads(line.decode("utf-8", "replace"))
+        except json.JSONDecodeError:
+            return None
+    return CodexEvent(type=data.get("type", "unknown"), data=data)
 
-def _spawn_codex_stream(
-    prompt: str,
-    model: str,
-    bypass_sandbox: bool,
-    working_dir: Optional[str],
-    timeout: int
-) -> Iterator[CodexEvent]:
+def _codex_command(model: str, bypass_sandbox: bool, working_dir: Optional[str]):
+    """Build (cmd, cwd) for a `codex exec --json` run reading the prompt from stdin."""
     cmd = ["codex", "exec", "--json"]
     if model:
         cmd.extend(["--model", model])
@@ -69,33 +87,41 @@ def _spawn_codex_stream(
     else:
         cmd.extend(["--sandbox", "read-only"])
         
-    cwd = working_dir or str(get_workspace_dir())
+    cwd = working_dir or WORKSPACE_DIR
     cmd.extend(["-C", cwd])
     
     # Use "-" to read prompt from stdin
     cmd.append("-")
+    return cmd, cwd
+
+def _spawn_codex_stream(
+    prompt: str,
+    model: str,
+    bypass_sandbox: bool,
+    working_dir: Optional[str],
+    timeout: int
+) -> Iterator[CodexEvent]:
+    cmd, cwd = _codex_command(model, bypass_sandbox, working_dir)
     
     proc = None
     timer = None
     timed_out = {"v": False}
     try:
+        cmd, shell = resolve_command(cmd)
         proc = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
             cwd=cwd,
-            shell=IS_WINDOWS,
-            encoding='utf-8',
-            errors='replace',
+            shell=shell,
         )
 
         # Watchdog: the streaming read below (`for line in proc.stdout`) has no
         # timeout of its own, so a codex worker that stalls mid-stream would hang
         # forever. Fire a process-TREE kill after `timeout`s; killing the process
         # closes stdout, which ends the loop instead of blocking indefinitely.
-        # (shell=True means proc.pid is the cmd.exe wrapper — taskkill /T walks
+        # (with shell=True proc.pid is the cmd.exe wrapper — taskkill /T walks
         # the whole tree so the real codex child dies too.)
         def _on_timeout():
             timed_out["v"] = True
@@ -105,16 +131,16 @@ def _spawn_codex_stream(
         timer.start()
 
         if proc.stdin:
-            proc.stdin.write(prompt)
+            proc.stdin.write(prompt.encode("utf-8"))
             proc.stdin.close()
 
         if proc.stdout:
+            # Binary lines go straight to the parser: JSON allows the trailing
+            # newline, and blank or non-JSON lines parse to None
             for line in proc.stdout:
-                line = line.strip()
-                if line:
-                    event = _parse_codex_event(line)
-                    if event:
-                        yield event
+                event = _parse_codex_event(line)
+                if event:
+                    yield event
 
         proc.wait()
 
@@ -129,22 +155,68 @@ def _spawn_codex_stream(
         if proc and proc.poll() is None:
             kill_process_tree(proc.pid)
 
-def spawn_codex(
+# Event lines can carry whole command outputs; allow long ones
+_STREAM_LINE_LIMIT = 1 << 26
+
+async def _spawn_codex_stream_async(
     prompt: str,
-    *,
-    model: str = None,
-    bypass_sandbox: bool = True,
-    timeout: int = 300,
-    task_summary: Optional[str] = None,
-    working_dir: Optional[str] = None,
-) -> AgentResult:
-    """
-    Spawn a Codex CLI agent.
-    
-    Context Handling:
-        Codex CLI automatically loads AGENTS.md from the project root.
-    """
-    start_time = time.time()
+    model: str,
+    bypass_sandbox: bool,
+    working_dir: Optional[str],
+    timeout: int
+) -> AsyncIterator[CodexEvent]:
+    """Async _spawn_codex_stream: the pipe is read on the event loop, so a
+    Codex run doesn't pin a thread. Same events, same timeout handling; the
+    child gets its own session off Windows so the tree kill stays contained."""
+    cmd, cwd = _codex_command(model, bypass_sandbox, working_dir)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    proc = None
+    timed_out = False
+    try:
+        cmd, shell = resolve_command(cmd)
+        pipes = dict(stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                     stderr=subprocess.STDOUT, cwd=cwd, limit=_STREAM_LINE_LIMIT,
+                     start_new_session=not IS_WINDOWS)
+        if shell:
+            proc = await asyncio.create_subprocess_shell(subprocess.list2cmdline(cmd), **pipes)
+        else:
+            proc = await asyncio.create_subprocess_exec(*cmd, **pipes)
+
+        proc.stdin.write(prompt.encode("utf-8"))
+        await proc.stdin.drain()
+        proc.stdin.close()
+
+        while True:
+            try:
+                line = await asyncio.wait_for(proc.stdout.readline(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                timed_out = True
+                await asyncio.to_thread(kill_process_tree, proc.pid)
+                break
+            if not line:
+                break
+            event = _parse_codex_event(line)
+            if event:
+                yield event
+
+        try:
+            await asyncio.wait_for(proc.wait(), 15)
+        except asyncio.TimeoutError:
+            pass
+
+        if timed_out:
+            yield CodexEvent(type="error", data={"message": f"Timed out after {timeout}s; process tree killed"})
+
+    except Exception as e:
+        yield CodexEvent(type="error", data={"message": str(e)})
+    finally:
+        if proc and proc.returncode is None:
+            await asyncio.shield(asyncio.to_thread(kill_process_tree, proc.pid))
+
+def _start_codex(prompt: str, model: Optional[str], bypass_sandbox: bool, task_summary: Optional[str]):
+    """Resolve and log a Codex spawn; returns (spawn_id, resolved_model)."""
     resolved_model = settings.get_model_alias("codex", model)
     
     sandbox_mode = "bypass" if bypass_sandbox else "read-only"
@@ -156,54 +228,115 @@ def spawn_codex(
         task_summary=task_summary,
         agent_type="CLI"
     )
-    
-    events = list(_spawn_codex_stream(prompt, resolved_model, bypass_sandbox, working_dir, timeout))
-    
-    duration = time.time() - start_time
-    
-    final_text = ""
-    command_outputs = []
-    usage = {}
-    session_id = None
-    error = None
-    had_turn_completed = False
-    
-    for event in events:
+    return spawn_id, resolved_model
+
+class _CodexOutcome:
+    """Folds a Codex event stream into the run's result, one event at a time."""
+
+    def __init__(self):
+        self.final_text = ""
+        # Only the last command output is ever used, so don't keep the transcript
+        self.last_command_output = ""
+        self.usage = {}
+        self.session_id = None
+        self.error = None
+        self.had_turn_completed = False
+
+    def add(self, event: CodexEvent):
         if event.type == "thread.started":
-            session_id = event.data.get("thread_id")
+            self.session_id = event.data.get("thread_id")
         elif event.is_message:
-            final_text = event.text or ""
+            self.final_text = event.text or ""
         elif event.is_command:
             output = event.command_output
             if output:
-                command_outputs.append(output)
+                self.last_command_output = output
         elif event.type == "turn.completed":
-            usage = event.data.get("usage", {})
-            had_turn_completed = True
+            self.usage = event.data.get("usage", {})
+            self.had_turn_completed = True
         elif event.type == "error":
-            error = event.data.get("message")
+            self.error = event.data.get("message")
+
+    def finish(self, spawn_id: str, resolved_model: str, start_time: float) -> AgentResult:
+        duration = time.perf_counter() - start_time
+        final_text = self.final_text
+        
+        # Success logic: no error AND (has message OR executed commands)
+        success = self.error is None and (
+            final_text != "" or (self.had_turn_completed and self.last_command_output != "")
+        )
+        
+        if not final_text and self.last_command_output:
+            final_text = self.last_command_output[:5000]
             
-    # Success logic: no error AND (has message OR executed commands)
-    success = error is None and (final_text != "" or (had_turn_completed and len(command_outputs) > 0))
-    
-    if not final_text and command_outputs:
-        final_text = command_outputs[-1][:5000]
+        log_spawn_complete(
+            spawn_id=spawn_id,
+            success=success,
+            result_text=final_text,
+            duration_seconds=duration,
+            error=self.error
+        )
         
-    log_spawn_complete(
-        spawn_id=spawn_id,
-        success=success,
-        result_text=final_text,
-        duration_seconds=duration,
-        error=error
-    )
+        return AgentResult(
+            success=success,
+            text=final_text,
+            spawn_id=spawn_id,
+            session_id=self.session_id,
+            usage=self.usage,
+            error=self.error,
+            model=resolved_model,
+            provider="codex"
+        )
+
+def spawn_codex(
+    prompt: str,
+    *,
+    model: str = None,
+    bypass_sandbox: bool = True,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    working_dir: Optional[str] = None,
+) -> AgentResult:
+    """
+    Spawn a Codex CLI agent.
     
-    return AgentResult(
-        success=success,
-        text=final_text,
-        spawn_id=spawn_id,
-        session_id=session_id,
-        usage=usage,
-        error=error,
-        model=resolved_model,
-        provider="codex"
+    Context Handling:
+        Codex CLI automatically loads AGENTS.md from the project root.
+    """
+    start_time = time.perf_counter()
+    spawn_id, resolved_model = _start_codex(prompt, model, bypass_sandbox, task_summary)
+    
+    # Reduce events as they stream instead of materializing the whole run
+    outcome = _CodexOutcome()
+    for event in _spawn_codex_stream(prompt, resolved_model, bypass_sandbox, working_dir, timeout):
+        outcome.add(event)
+    return outcome.finish(spawn_id, resolved_model, start_time)
+
+async def spawn_codex_async(
+    prompt: str,
+    *,
+    model: str = None,
+    bypass_sandbox: bool = True,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    working_dir: Optional[str] = None,
+) -> AgentResult:
+    """
+    Async variant of spawn_codex: the JSONL stream is read on the event loop
+    instead of blocking a thread for the whole run.
+    """
+    start_time = time.perf_counter()
+    # Start logging may write IAC.md: off the event loop, like the run's I/O
+    spawn_id, resolved_model = await asyncio.to_thread(
+        _start_codex, prompt, model, bypass_sandbox, task_summary
     )
+
+    outcome = _CodexOutcome()
+    try:
+        async for event in _spawn_codex_stream_async(prompt, resolved_model, bypass_sandbox, working_dir, timeout):
+            outcome.add(event)
+    except asyncio.CancelledError:
+        outcome.error = "Cancelled"
+        outcome.finish(spawn_id, resolved_model, start_time)
+        raise
+    return outcome.finish(spawn_id, resolved_model, start_time)
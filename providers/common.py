@@ -0,0 +1,351 @@
+"""
+Shared helpers for the API providers
+"""
+
+import asyncio
+import atexit
+import contextlib
+import contextvars
+import functools
+import importlib.util
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+from ..config import settings
+from ..logger import log_spawn_complete
+from .types import AgentResult
+
+# One connection pool for every API provider: repeated calls to the same host
+# reuse TCP/TLS connections instead of each SDK client opening its own.
+HTTP_MAX_CONNECTIONS = 64
+# Keep idle connections long enough to span a coordinator's think time
+# between spawns (httpx defaults to 5s, which drops them almost immediately)
+HTTP_KEEPALIVE_EXPIRY = 90.0
+# Per-request timeouts are set by each SDK; this only bounds requests that don't
+HTTP_DEFAULT_TIMEOUT = 300.0
+HTTP_CONNECT_TIMEOUT = 10.0
+# HTTP/2 multiplexes concurrent spawns to one host over a single connection.
+# Needs the optional h2 package (pip install "httpx[http2]");
+# POWERSPAWN_HTTP2=0 forces HTTP/1.1 if an endpoint misbehaves.
+HTTP2_ENABLED = os.getenv("POWERSPAWN_HTTP2", "1") == "1"
+
+_http_client = None
+_http_client_lock = threading.Lock()
+# httpx.AsyncClient connections belong to the event loop that opened them.
+# Short-lived loops (spawn_api_batch / spawn_api_race) scope a pool with
+# async_http_pool() and close it on the way out; a loop without one (e.g.
+# the MCP server's) gets a pool of its own, dropped once that loop closes.
+_scoped_pool: "contextvars.ContextVar[Optional[AsyncHTTPPool]]" = contextvars.ContextVar(
+    "powerspawn_async_pool", default=None
+)
+_loop_pools: dict = {}
+_loop_pools_lock = threading.Lock()
+
+
+def _pool_kwargs() -> dict:
+    import httpx
+    return dict(
+        http2=HTTP2_ENABLED and importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(HTTP_DEFAULT_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def get_http_client():
+    """Return the process-wide httpx.Client shared by the API providers.
+
+    HTTP/2 is used when the optional ``h2`` package is installed and
+    HTTP2_ENABLED is set; otherwise HTTP/1.1 keep-alive.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+                client = httpx.Client(**_pool_kwargs())
+                atexit.register(client.close)
+                _http_client = client
+    return _http_client
+
+
+class AsyncHTTPPool:
+    """An httpx.AsyncClient and the async SDK clients built on top of it.
+
+    Used on one event loop only, and closed (aclose) before that loop ends.
+    """
+
+    def __init__(self):
+        import httpx
+        self.http = httpx.AsyncClient(**_pool_kwargs())
+        self._sdk_clients: dict = {}
+
+    def sdk_client(self, key: tuple, build: Callable[[Any], Any]):
+        """Return the SDK client cached under ``key``, building it with
+        ``build(self.http)`` the first time."""
+        client = self._sdk_clients.get(key)
+        if client is None:
+            client = self._sdk_clients[key] = build(self.http)
+        return client
+
+    async def aclose(self):
+        self._sdk_clients.clear()
+        await self.http.aclose()
+
+
+@contextlib.asynccontextmanager
+async def async_http_pool():
+    """Give the async spawns in this block (and the tasks they start) one
+    AsyncHTTPPool, and close it, sockets included, on exit."""
+    pool = AsyncHTTPPool()
+    token = _scoped_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _scoped_pool.reset(token)
+        await pool.aclose()
+
+
+def _current_pool() -> AsyncHTTPPool:
+    pool = _scoped_pool.get()
+    if pool is not None:
+        return pool
+    loop = asyncio.get_running_loop()
+    with _loop_pools_lock:
+        pool = _loop_pools.get(loop)
+        if pool is None:
+            # A loop that closed without scoping its pool can't aclose it any
+            # more; drop the reference so neither the pool nor the loop is
+            # kept alive
+            for stale in [l for l in _loop_pools if l.is_closed()]:
+                del _loop_pools[stale]
+            pool = _loop_pools[loop] = AsyncHTTPPool()
+    return pool
+
+
+def get_async_http_client():
+    """Return the httpx.AsyncClient for the current async_http_pool() scope,
+    or else for the running event loop.
+
+    Same limits as get_http_client. Must be called from a coroutine.
+    """
+    return _current_pool().http
+
+
+def get_async_sdk_client(key: tuple, build: Callable[[Any], Any]):
+    """Async SDK client cached on the current pool (see get_async_http_client).
+
+    ``build`` gets the pool's httpx.AsyncClient; ``key`` identifies the client
+    among the providers (e.g. provider, API key, options).
+    """
+    return _current_pool().sdk_client(key, build)
+
+
+class RateLimiter:
+    """Admit at most ``rpm`` request starts in any 60-second window.
+
+    Callers over the limit wait for a slot instead of hitting the provider
+    and getting a 429 (and the SDK's retry backoff). Thread-safe; the async
+    variant sleeps on the event loop instead of blocking.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        # Start times of admitted requests (may be in the future when queued)
+        self._starts: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next slot; return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= self.WINDOW:
+                self._starts.popleft()
+            start = now
+            if len(self._starts) >= self.rpm:
+                start = self._starts[-self.rpm] + self.WINDOW
+            self._starts.append(start)
+            return start - now
+
+    def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@functools.cache
+def rate_limiter(provider: str) -> Optional[RateLimiter]:
+    """Limiter for a provider from POWERSPAWN_RPM_<PROVIDER> (e.g.
+    POWERSPAWN_RPM_GROK_API=60); None when unset or 0 (no limit)."""
+    rpm = int(os.getenv(f"POWERSPAWN_RPM_{provider.upper().replace('-', '_')}", "0"))
+    return RateLimiter(rpm) if rpm > 0 else None
+
+
+def run_spawn(
+    spawn_id: str,
+    start_time: float,
+    resolved_model: str,
+    provider: str,
+    call: Callable[[], tuple[str, dict]],
+    structure: Optional[Callable[[str], Any]] = None,
+) -> AgentResult:
+    """Run an API provider call and turn it into a logged AgentResult.
+
+    ``call`` does the request and returns (text, usage), raising on failure.
+    ``structure``, if given, decodes the text into ``structured_output``;
+    a decode error fails the spawn. Completion logging and the
+    success/failure result shape live here, so every API provider reports
+    the same way. Waits for the provider's rate limiter first, if one is set.
+    """
+    try:
+        limiter = rate_limiter(provider)
+        if limiter is not None:
+            limiter.acquire()
+        output_text, usage = call()
+        structured = structure(output_text) if structure else None
+    except Exception as e:
+        return _failed(spawn_id, start_time, provider, e)
+    return _succeeded(spawn_id, start_time, resolved_model, provider, output_text, usage, structured)
+
+
+async def run_spawn_async(
+    spawn_id: str,
+    start_time: float,
+    resolved_model: str,
+    provider: str,
+    call: Callable[[], Awaitable[tuple[str, dict]]],
+    structure: Optional[Callable[[str], Any]] = None,
+) -> AgentResult:
+    """Async counterpart of run_spawn: ``call`` is a coroutine function."""
+    try:
+        limiter = rate_limiter(provider)
+        if limiter is not None:
+            await limiter.acquire_async()
+        output_text, usage = await call()
+        structured = structure(output_text) if structure else None
+    except asyncio.CancelledError:
+        # e.g. the losers of spawn_race: close out the IAC entry, then propagate
+        _failed(spawn_id, start_time, provider, "Cancelled")
+        raise
+    except Exception as e:
+        return _failed(spawn_id, start_time, provider, e)
+    return _succeeded(spawn_id, start_time, resolved_model, provider, output_text, usage, structured)
+
+
+def _succeeded(spawn_id, start_time, resolved_model, provider, output_text, usage,
+               structured=None) -> AgentResult:
+    duration = time.perf_counter() - start_time
+    log_spawn_complete(spawn_id, True, output_text, duration, 0.0)
+    return AgentResult(
+        success=True,
+        text=output_text,
+        spawn_id=spawn_id,
+        structured_output=structured,
+        duration_ms=int(duration * 1000),
+        usage=usage,
+        model=resolved_model,
+        provider=provider
+    )
+
+
+def _failed(spawn_id, start_time, provider, error) -> AgentResult:
+    duration = time.perf_counter() - start_time
+    log_spawn_complete(spawn_id, False, "", duration, 0.0, str(error))
+    return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(error), provider=provider)
+
+
+# Default spawn timeout; Gemini/Mistral clients are cached per timeout, so
+# warming with this value makes the first default call a cache hit.
+_PREWARM_TIMEOUT = 300
+
+# API origins, for opening a pooled connection ahead of the first spawn
+API_ORIGINS = {
+    "grok": "https://api.x.ai",
+    "gemini": "https://generativelanguage.googleapis.com",
+    "mistral": "https://api.mistral.ai",
+}
+
+
+def _prewarm_targets(providers: Optional[list[str]]) -> list[str]:
+    if providers is None:
+        return [p for p in API_ORIGINS if settings.get_api_key(p)]
+    return [p for p in providers if p in API_ORIGINS]
+
+
+def prewarm_api_clients(providers: Optional[list[str]] = None) -> Optional[threading.Thread]:
+    """Build API clients and open their connections in a background thread.
+
+    For each provider (default: all with a configured key; names as in
+    settings.get_api_key) this imports the SDK, builds the cached client,
+    and sends a HEAD to the API origin through the shared pool so DNS + TCP
+    + TLS are done before the first spawn reuses that connection.
+    Returns the started thread, or None when there is nothing to warm.
+    """
+    from . import gemini, grok_api, mistral
+
+    client_warmers = {
+        "grok": grok_api._get_client,
+        "gemini": lambda: gemini._get_client(timeout=_PREWARM_TIMEOUT),
+        "mistral": lambda: mistral._get_client(timeout=_PREWARM_TIMEOUT),
+    }
+    providers = _prewarm_targets(providers)
+    if not providers:
+        return None
+
+    def run():
+        for provider in providers:
+            try:
+                client_warmers[provider]()
+                # Any response (even 404) leaves a keep-alive connection pooled
+                get_http_client().head(API_ORIGINS[provider], timeout=HTTP_CONNECT_TIMEOUT)
+            except Exception:
+                # SDK missing, misconfigured or offline: the spawn itself will report it
+                pass
+
+    thread = threading.Thread(target=run, name="powerspawn-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+async def prewarm_api_clients_async(providers: Optional[list[str]] = None) -> None:
+    """Warm the event loop's async pool as well, for servers that spawn async.
+
+    Runs prewarm_api_clients first (SDK imports stay off the loop), then
+    builds the async Grok/Gemini/Mistral clients and opens their connections
+    via get_async_http_client.
+    """
+    thread = prewarm_api_clients(providers)
+    if thread is None:
+        return
+    await asyncio.to_thread(thread.join)
+
+    from . import gemini, grok_api, mistral
+
+    async_warmers = {
+        "grok": grok_api._get_async_client,
+        "gemini": lambda: gemini._get_async_client(timeout=_PREWARM_TIMEOUT),
+        "mistral": lambda: mistral._get_async_client(timeout=_PREWARM_TIMEOUT),
+    }
+    pool = get_async_http_client()
+
+    async def warm(provider: str):
+        try:
+            async_warmers[provider]()
+            await pool.head(API_ORIGINS[provider], timeout=HTTP_CONNECT_TIMEOUT)
+        except Exception:
+            pass
+
+    await asyncio.gather(*(warm(p) for p in _prewarm_targets(providers) if p in async_warmers))
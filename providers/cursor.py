@@ -10,11 +10,11 @@ import os
 import subprocess
 import time
 import sys
-from pathlib import Path
 from typing import Optional
 
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
+from ..context import WORKSPACE_DIR
 from ..proc import run_captured
 from .types import AgentResult
 
@@ -26,9 +26,6 @@ IS_WINDOWS = sys.platform == "win32"
 # this override should be removed once installs land cursor-agent on PATH.
 CURSOR_BIN = os.environ.get("CURSOR_AGENT_BIN", "cursor-agent")
 
-def get_workspace_dir() -> Path:
-    return Path(__file__).parent.parent.parent
-
 def spawn_cursor(
     prompt: str,
     *,
@@ -44,7 +41,7 @@ def spawn_cursor(
     Assumes `cursor-agent` is on PATH and CURSOR_API_KEY is set. Without
     `force`, the agent proposes changes but does not apply them to files.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     resolved_model = settings.get_model_alias("cursor", model)
 
     tools_list = ["all"]
@@ -66,7 +63,7 @@ def spawn_cursor(
     if force:
         cmd.append("--force")
 
-    cwd = working_dir or str(get_workspace_dir())
+    cwd = working_dir or WORKSPACE_DIR
 
     try:
         # Hardened run: output to temp files (no pipe-EOF drain hang),
@@ -75,7 +72,7 @@ def spawn_cursor(
             cmd, cwd=cwd, timeout=timeout,
         )
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         if timed_out:
             error_text = (error_text + f"\n[powerspawn] cursor timed out after "
@@ -108,6 +105,6 @@ def spawn_cursor(
         )
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
         return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="cursor")
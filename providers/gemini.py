@@ -2,35 +2,96 @@
 Gemini API Provider (Google)
 """
 
+import functools
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
+from ..llm_cache import cached_spawn
 from .types import AgentResult
+from .common import get_async_sdk_client, get_http_client, rate_limiter, run_spawn, run_spawn_async
 
-_genai_client = None
-_client_timeout = None
+@functools.cache
+def _genai_sdk():
+    """Import google.genai on first use; later calls are a cache hit."""
+    from google import genai
+    return genai
+
+@functools.cache
+def _genai_types():
+    from google.genai import types
+    return types
+
+def _http_options(timeout: Optional[int], **pool):
+    types = _genai_types()
+    # Google GenAI SDK expects timeout in milliseconds, not seconds
+    timeout_ms = timeout * 1000 if timeout else None
+    try:
+        return types.HttpOptions(timeout=timeout_ms, **pool)
+    except Exception:
+        # Older google-genai without httpx_client / httpx_async_client:
+        # SDK-owned pool
+        return types.HttpOptions(timeout=timeout_ms) if timeout else None
+
+# Cached per (api key, timeout): rotated keys / tenants and differing
+# timeouts each get their own client rather than rebuilding a single global
+@functools.lru_cache(maxsize=16)
+def _client_for(api_key: str, timeout: Optional[int]):
+    http_options = _http_options(timeout, httpx_client=get_http_client())
+    return _genai_sdk().Client(api_key=api_key, http_options=http_options)
+
+# Async clients live on the current async pool (get_async_sdk_client), so a
+# client (and its .aio surface) never outlives the loop it was built on
+def _async_client_for(api_key: str, timeout: Optional[int], http_client):
+    http_options = _http_options(timeout, httpx_async_client=http_client)
+    return _genai_sdk().Client(api_key=api_key, http_options=http_options)
+
+def _require_key() -> str:
+    api_key = settings.get_api_key("gemini")
+    if not api_key:
+        raise ValueError("Gemini API key not found.")
+    return api_key
 
 def _get_client(timeout: Optional[int] = None):
-    global _genai_client, _client_timeout
-    if _genai_client is None or _client_timeout != timeout:
-        from google import genai
-        api_key = settings.get_api_key("gemini")
-        if not api_key:
-            raise ValueError("Gemini API key not found.")
-        
-        http_options = None
-        if timeout:
-            from google.genai import types
-            # Google GenAI SDK expects timeout in milliseconds, not seconds
-            timeout_ms = timeout * 1000
-            http_options = types.HttpOptions(timeout=timeout_ms)
-        
-        _genai_client = genai.Client(api_key=api_key, http_options=http_options)
-        _client_timeout = timeout
-    return _genai_client
+    return _client_for(_require_key(), timeout)
+
+def _get_async_client(timeout: Optional[int] = None):
+    api_key = _require_key()
+    return get_async_sdk_client(
+        ("gemini", api_key, timeout),
+        functools.partial(_async_client_for, api_key, timeout),
+    )
 
+def _build_config(temperature: float, enable_search: bool, system_prompt: Optional[str] = None):
+    """Build the GenerateContentConfig shared by the sync and async paths.
+
+    The system prompt goes in as system_instruction rather than being glued
+    onto the user turn.
+    """
+    types = _genai_types()
+
+    tools = []
+    if enable_search:
+        tools.append(types.Tool(google_search=types.GoogleSearch()))
+
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        tools=tools if tools else None,
+        system_instruction=system_prompt or None,
+    )
+
+def _extract_usage(response) -> dict:
+    usage = {}
+    if hasattr(response, 'usage_metadata') and response.usage_metadata:
+         usage = {
+            "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
+            "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
+            "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
+        }
+    return usage
+
+@cached_spawn("gemini")
 def spawn_gemini(
     prompt: str,
     *,
@@ -44,7 +105,7 @@ def spawn_gemini(
     """
     Spawn a Gemini agent via Google GenAI SDK.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     resolved_model = settings.get_model_alias("gemini", model)
     
     spawn_id = log_spawn_start(
@@ -56,57 +117,105 @@ def spawn_gemini(
         agent_type="API"
     )
     
-    try:
+    def call():
         client = _get_client(timeout=timeout)
-        
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-            
-        from google.genai import types
-        
-        tools = []
-        if enable_search:
-            tools.append(types.Tool(google_search=types.GoogleSearch()))
-            
-        config = types.GenerateContentConfig(
-            temperature=temperature,
-            tools=tools if tools else None
-        )
+        config = _build_config(temperature, enable_search, system_prompt)
         
         # Use Chat to support multi-turn automatic tool calling
         chat = client.chats.create(model=resolved_model, config=config)
+        response = chat.send_message(prompt)
         
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-            
-        response = chat.send_message(full_prompt)
-        
-        duration = time.time() - start_time
         output_text = response.text if response.text else ""
-        
-        usage = {}
-        if hasattr(response, 'usage_metadata') and response.usage_metadata:
-             usage = {
-                "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
-            }
-            
-        log_spawn_complete(spawn_id, True, output_text, duration, 0.0)
-        
-        return AgentResult(
-            success=True,
-            text=output_text,
-            spawn_id=spawn_id,
-            duration_ms=int(duration * 1000),
-            usage=usage,
-            model=resolved_model,
-            provider="gemini"
-        )
-        
+        return output_text, _extract_usage(response)
+
+    return run_spawn(spawn_id, start_time, resolved_model, "gemini", call)
+
+def spawn_gemini_stream(
+    prompt: str,
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    enable_search: bool = True,
+) -> Iterator[str]:
+    """
+    Streaming variant of spawn_gemini: yields text chunks as they arrive.
+
+    Same contract as spawn_grok_api_stream: logged to IAC.md, and failures
+    are logged and then re-raised.
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("gemini", model)
+
+    spawn_id = log_spawn_start(
+        agent="Gemini",
+        model=resolved_model,
+        prompt=prompt,
+        tools=["api"] + (["search"] if enable_search else []),
+        task_summary=task_summary,
+        agent_type="API"
+    )
+
+    parts = []
+    try:
+        # Streams count against POWERSPAWN_RPM_* like every other request
+        limiter = rate_limiter("gemini")
+        if limiter is not None:
+            limiter.acquire()
+        client = _get_client(timeout=timeout)
+        config = _build_config(temperature, enable_search, system_prompt)
+        chat = client.chats.create(model=resolved_model, config=config)
+
+        for chunk in chat.send_message_stream(prompt):
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+    except GeneratorExit:
+        log_spawn_complete(spawn_id, False, "".join(parts), time.perf_counter() - start_time, 0.0,
+                           "Stream closed by consumer")
+        raise
     except Exception as e:
-        duration = time.time() - start_time
-        log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
-        return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="gemini")
+        log_spawn_complete(spawn_id, False, "".join(parts), time.perf_counter() - start_time, 0.0, str(e))
+        raise
+
+    log_spawn_complete(spawn_id, True, "".join(parts), time.perf_counter() - start_time, 0.0)
+
+@cached_spawn("gemini")
+async def spawn_gemini_async(
+    prompt: str,
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    enable_search: bool = True,
+) -> AgentResult:
+    """
+    Async variant of spawn_gemini (uses the SDK's `client.aio` surface).
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("gemini", model)
+    
+    spawn_id = log_spawn_start(
+        agent="Gemini",
+        model=resolved_model,
+        prompt=prompt,
+        tools=["api"] + (["search"] if enable_search else []),
+        task_summary=task_summary,
+        agent_type="API"
+    )
+    
+    async def call():
+        client = _get_async_client(timeout=timeout)
+        config = _build_config(temperature, enable_search, system_prompt)
+
+        chat = client.aio.chats.create(model=resolved_model, config=config)
+        response = await chat.send_message(prompt)
+        
+        output_text = response.text if response.text else ""
+        return output_text, _extract_usage(response)
+
+    return await run_spawn_async(spawn_id, start_time, resolved_model, "gemini", call)
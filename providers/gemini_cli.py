@@ -2,37 +2,26 @@
 Gemini CLI Provider
 """
 
+import asyncio
 import subprocess
 import time
 import sys
-from pathlib import Path
 from typing import Optional
 
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
-from ..proc import run_captured
+from ..context import WORKSPACE_DIR
+from ..proc import run_captured, run_captured_async
 from .types import AgentResult
 
 IS_WINDOWS = sys.platform == "win32"
 
-def get_workspace_dir() -> Path:
-    return Path(__file__).parent.parent.parent
+def _start_gemini_cli(prompt: str, model: Optional[str], task_summary: Optional[str],
+                      working_dir: Optional[str], yolo: bool):
+    """Resolve, log and build the CLI run shared by the sync and async spawns.
 
-def spawn_gemini_cli(
-    prompt: str,
-    *,
-    model: str = None,
-    timeout: int = 300,
-    task_summary: Optional[str] = None,
-    working_dir: Optional[str] = None,
-    yolo: bool = False,
-) -> AgentResult:
+    Returns (spawn_id, resolved_model, cmd, cwd).
     """
-    Spawn a Gemini CLI agent.
-    
-    Assumes a 'gemini' executable is available in PATH.
-    """
-    start_time = time.time()
     resolved_model = settings.get_model_alias("gemini-cli", model)
     
     tools_list = ["all"]
@@ -57,48 +46,97 @@ def spawn_gemini_cli(
     if yolo:
         cmd.append("--yolo")
         
-    cwd = working_dir or str(get_workspace_dir())
+    cwd = working_dir or WORKSPACE_DIR
+    return spawn_id, resolved_model, cmd, cwd
+
+def _finish_gemini_cli(spawn_id: str, resolved_model: str, start_time: float, timeout: int, run) -> AgentResult:
+    """Turn a run_captured(_async) result into a logged AgentResult."""
+    returncode, output_text, error_text, timed_out = run
+    duration = time.perf_counter() - start_time
+
+    if timed_out:
+        error_text = (error_text + f"\n[powerspawn] gemini timed out after "
+                      f"{timeout}s; process tree killed").strip()
+
+    success = (not timed_out) and returncode == 0 and output_text != ""
+
+    if not success and not output_text:
+        error_msg = error_text or f"Exit code {returncode}"
+        log_spawn_complete(spawn_id, False, "", duration, 0.0, error_msg)
+        return AgentResult(success=False, text="", spawn_id=spawn_id, error=error_msg, provider="gemini-cli")
+        
+    log_spawn_complete(
+        spawn_id=spawn_id,
+        success=success,
+        result_text=output_text,
+        duration_seconds=duration,
+        cost_usd=0.0,
+        error=error_text if not success else None
+    )
     
+    return AgentResult(
+        success=success,
+        text=output_text,
+        spawn_id=spawn_id,
+        duration_ms=int(duration * 1000),
+        error=error_text if not success else None,
+        model=resolved_model,
+        provider="gemini-cli"
+    )
+
+def _gemini_cli_error(spawn_id: str, start_time: float, e: Exception) -> AgentResult:
+    duration = time.perf_counter() - start_time
+    log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
+    return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="gemini-cli")
+
+def spawn_gemini_cli(
+    prompt: str,
+    *,
+    model: str = None,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    working_dir: Optional[str] = None,
+    yolo: bool = False,
+) -> AgentResult:
+    """
+    Spawn a Gemini CLI agent.
+    
+    Assumes a 'gemini' executable is available in PATH.
+    """
+    start_time = time.perf_counter()
+    spawn_id, resolved_model, cmd, cwd = _start_gemini_cli(prompt, model, task_summary, working_dir, yolo)
+
     try:
         # Hardened run: output to temp files (no pipe-EOF drain hang),
         # process-tree kill on timeout. See powerspawn/proc.py.
-        returncode, output_text, error_text, timed_out = run_captured(
-            cmd, cwd=cwd, timeout=timeout,
-        )
-
-        duration = time.time() - start_time
-
-        if timed_out:
-            error_text = (error_text + f"\n[powerspawn] gemini timed out after "
-                          f"{timeout}s; process tree killed").strip()
+        run = run_captured(cmd, cwd=cwd, timeout=timeout)
+        return _finish_gemini_cli(spawn_id, resolved_model, start_time, timeout, run)
+    except Exception as e:
+        return _gemini_cli_error(spawn_id, start_time, e)
 
-        success = (not timed_out) and returncode == 0 and output_text != ""
+async def spawn_gemini_cli_async(
+    prompt: str,
+    *,
+    model: str = None,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    working_dir: Optional[str] = None,
+    yolo: bool = False,
+) -> AgentResult:
+    """
+    Async variant of spawn_gemini_cli (CLI awaited via proc.run_captured_async).
+    """
+    start_time = time.perf_counter()
+    # Start logging may write IAC.md: off the event loop, like the run's I/O
+    spawn_id, resolved_model, cmd, cwd = await asyncio.to_thread(
+        _start_gemini_cli, prompt, model, task_summary, working_dir, yolo
+    )
 
-        if not success and not output_text:
-            error_msg = error_text or f"Exit code {returncode}"
-            log_spawn_complete(spawn_id, False, "", duration, 0.0, error_msg)
-            return AgentResult(success=False, text="", spawn_id=spawn_id, error=error_msg, provider="gemini-cli")
-            
-        log_spawn_complete(
-            spawn_id=spawn_id,
-            success=success,
-            result_text=output_text,
-            duration_seconds=duration,
-            cost_usd=0.0,
-            error=error_text if not success else None
-        )
-        
-        return AgentResult(
-            success=success,
-            text=output_text,
-            spawn_id=spawn_id,
-            duration_ms=int(duration * 1000),
-            error=error_text if not success else None,
-            model=resolved_model,
-            provider="gemini-cli"
-        )
-        
+    try:
+        run = await run_captured_async(cmd, cwd=cwd, timeout=timeout)
+        return _finish_gemini_cli(spawn_id, resolved_model, start_time, timeout, run)
+    except asyncio.CancelledError:
+        _gemini_cli_error(spawn_id, start_time, Exception("Cancelled"))
+        raise
     except Exception as e:
-        duration = time.time() - start_time
-        log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
-        return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="gemini-cli")
\ No newline at end of file
+        return _gemini_cli_error(spawn_id, start_time, e)
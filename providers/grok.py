@@ -21,13 +21,12 @@ import subprocess
 import sys
 import tempfile
 import time
-from pathlib import Path
 from typing import Optional
 
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
 from ..proc import run_captured
-from ..context import inject_agents_context
+from ..context import WORKSPACE_DIR, inject_agents_context
 from .types import AgentResult
 
 IS_WINDOWS = sys.platform == "win32"
@@ -37,9 +36,6 @@ IS_WINDOWS = sys.platform == "win32"
 GROK_BIN = os.environ.get("GROK_BIN", "grok")
 
 
-def get_workspace_dir() -> Path:
-    return Path(__file__).parent.parent.parent
-
 def spawn_grok(
     prompt: str,
     *,
@@ -61,7 +57,7 @@ def spawn_grok(
     `system_prompt` is appended to the agent's system prompt via --rules
     (not an override), so Grok Build's own agentic scaffolding stays intact.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     resolved_model = settings.get_model_alias("grok", model)
 
     tools_list = ["all"]
@@ -77,7 +73,7 @@ def spawn_grok(
         agent_type="CLI"
     )
 
-    cwd = working_dir or str(get_workspace_dir())
+    cwd = working_dir or WORKSPACE_DIR
     worker_prompt = inject_agents_context(prompt, working_dir, provider="grok")
 
     prompt_file = None
@@ -110,7 +106,7 @@ def spawn_grok(
         returncode, output_text, error_text, timed_out = run_captured(
             cmd, cwd=cwd, timeout=timeout,
         )
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         if timed_out:
             error_text = (
@@ -145,7 +141,7 @@ def spawn_grok(
         )
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
         return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="grok")
 
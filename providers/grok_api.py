@@ -6,28 +6,162 @@ This chat-completions path remains for environments without the Grok CLI,
 or for pure-text queries where an agentic run is overkill.
 """
 
+import functools
 import time
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
+from ..llm_cache import cached_spawn
 from .types import AgentResult
+from .common import get_http_client, get_async_sdk_client, rate_limiter, run_spawn, run_spawn_async
 
-_openai_client = None
+XAI_BASE_URL = "https://api.x.ai/v1"
+
+@functools.cache
+def _openai_sdk():
+    """Import the OpenAI SDK on first use; later calls are a cache hit."""
+    import openai
+    return openai
+
+# Clients are cached per (api key, base URL), so rotated keys or several
+# tenants in one process each keep their own client instead of thrashing a
+# single global; lru_cache bounds how many are kept alive.
+@functools.lru_cache(maxsize=16)
+def _client_for(api_key: str, base_url: str):
+    return _openai_sdk().OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=get_http_client(),
+    )
+
+# Async clients live on the current async pool (get_async_sdk_client), which
+# is closed with its loop, so they are built per pool rather than lru-cached
+def _async_client_for(api_key: str, base_url: str, http_client):
+    return _openai_sdk().AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=http_client,
+    )
+
+def _require_key() -> str:
+    api_key = settings.get_api_key("grok")
+    if not api_key:
+        raise ValueError("Grok API key not found.")
+    return api_key
 
 def _get_client():
-    global _openai_client
-    if _openai_client is None:
-        from openai import OpenAI
-        api_key = settings.get_api_key("grok")
-        if not api_key:
-            raise ValueError("Grok API key not found.")
-        _openai_client = OpenAI(
-            base_url="https://api.x.ai/v1",
-            api_key=api_key
-        )
-    return _openai_client
+    return _client_for(_require_key(), XAI_BASE_URL)
+
+def _get_async_client():
+    api_key = _require_key()
+    return get_async_sdk_client(
+        ("grok-api", api_key, XAI_BASE_URL),
+        functools.partial(_async_client_for, api_key, XAI_BASE_URL),
+    )
+
+@functools.lru_cache(maxsize=64)
+def _system_messages(system_prompt: Optional[str]) -> tuple:
+    """System message prefix, built once per distinct system prompt.
+
+    Coordinators tend to reuse one system prompt across many calls; keeping
+    the prefix identical also lets provider-side prompt caching kick in.
+    The dicts are shared between requests and must not be mutated.
+    """
+    if not system_prompt:
+        return ()
+    return ({"role": "system", "content": system_prompt},)
+
+def _build_request(
+    prompt: str,
+    resolved_model: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    timeout: int,
+    json_output: bool = False,
+) -> dict:
+    """Build chat-completions kwargs shared by the sync and async paths."""
+    messages = [*_system_messages(system_prompt), {"role": "user", "content": prompt}]
+
+    # X.AI deprecated search_parameters and tools-based search
+    # Web search is now automatic when Grok detects it's needed
+    # No special configuration required
+    request = {
+        "model": resolved_model,
+        "messages": messages,
+        "temperature": temperature,
+        "timeout": timeout,
+    }
+    if json_output:
+        request["response_format"] = {"type": "json_object"}
+    return request
+
+@functools.lru_cache(maxsize=32)
+def _struct_decoder(response_struct: type) -> Callable[[str], Any]:
+    """Typed JSON decoder for response_struct (msgspec, optional dependency).
+
+    msgspec decodes and validates in one pass, straight from bytes into the
+    Struct, without an intermediate dict. One Decoder is built per type.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError("response_struct requires msgspec (pip install msgspec)") from None
+    decoder = msgspec.json.Decoder(response_struct)
+    return lambda text: decoder.decode(text.encode("utf-8"))
+
+def _structure_for(response_struct: Optional[type]) -> Optional[Callable[[str], Any]]:
+    if response_struct is None:
+        return None
+    # Resolve the decoder inside run_spawn's error handling, so a missing
+    # msgspec surfaces as a failed result rather than an exception
+    return lambda text: _struct_decoder(response_struct)(text)
+
+def _usage_dict(usage) -> dict:
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
 
+def _extract_output(response) -> tuple[str, dict]:
+    """Return (text, usage) from a chat-completions response."""
+    output_text = response.choices[0].message.content if response.choices else ""
+    usage = _usage_dict(response.usage) if response.usage else {}
+    return output_text, usage
+
+def _stream_text(
+    client,
+    request_kwargs: dict,
+    usage: dict,
+    stop_predicate: Optional[Callable[[str], bool]] = None,
+) -> Iterator[str]:
+    """Yield content deltas of a streamed completion; fills `usage` from the last chunk.
+
+    If stop_predicate(text_so_far) returns True the stream is closed early,
+    which stops generation server-side (no usage is reported then).
+    """
+    stream = client.chat.completions.create(
+        **request_kwargs,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    # Deltas are only kept (and joined) when a predicate needs the text so far
+    parts = []
+    for chunk in stream:
+        if chunk.usage:
+            usage.update(_usage_dict(chunk.usage))
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+                if stop_predicate is not None:
+                    parts.append(delta)
+                    if stop_predicate("".join(parts)):
+                        stream.close()
+                        return
+
+@cached_spawn("grok-api")
 def spawn_grok_api(
     prompt: str,
     *,
@@ -37,11 +171,19 @@ def spawn_grok_api(
     timeout: int = 300,
     task_summary: Optional[str] = None,
     enable_search: bool = True,
+    stop_predicate: Optional[Callable[[str], bool]] = None,
+    response_struct: Optional[type] = None,
 ) -> AgentResult:
     """
     Spawn a Grok agent via X.ai API.
+
+    stop_predicate(text_so_far) -> bool, if given, ends generation early
+    once it returns True (e.g. when an answer marker has been produced).
+
+    response_struct (a msgspec.Struct type) requests JSON output and decodes
+    it into structured_output; invalid or non-matching JSON fails the spawn.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     resolved_model = settings.get_model_alias("grok-api", model)
 
     spawn_id = log_spawn_start(
@@ -53,51 +195,112 @@ def spawn_grok_api(
         agent_type="API"
     )
 
-    try:
+    def call():
         client = _get_client()
+        request_kwargs = _build_request(
+            prompt, resolved_model, system_prompt, temperature, timeout,
+            json_output=response_struct is not None,
+        )
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        # Streamed under the hood: tokens are read as they're generated
+        # rather than in one response at the end
+        usage = {}
+        output_text = "".join(_stream_text(client, request_kwargs, usage, stop_predicate))
+        return output_text, usage
 
-        request_kwargs = {
-            "model": resolved_model,
-            "messages": messages,
-            "temperature": temperature,
-            "timeout": timeout,
-        }
+    return run_spawn(spawn_id, start_time, resolved_model, "grok-api", call,
+                     structure=_structure_for(response_struct))
 
-        # X.AI deprecated search_parameters and tools-based search
-        # Web search is now automatic when Grok detects it's needed
-        # No special configuration required
+def spawn_grok_api_stream(
+    prompt: str,
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    enable_search: bool = True,
+    stop_predicate: Optional[Callable[[str], bool]] = None,
+) -> Iterator[str]:
+    """
+    Streaming variant of spawn_grok_api: yields text deltas as they arrive.
 
-        response = client.chat.completions.create(**request_kwargs)
-        duration = time.time() - start_time
+    The spawn is logged to IAC.md like spawn_grok_api. There's no AgentResult
+    to carry an error, so failures are logged and then re-raised.
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("grok-api", model)
 
-        output_text = response.choices[0].message.content if response.choices else ""
+    spawn_id = log_spawn_start(
+        agent="Grok",
+        model=resolved_model,
+        prompt=prompt,
+        tools=["api"] + (["search"] if enable_search else []),
+        task_summary=task_summary,
+        agent_type="API"
+    )
 
-        usage = {}
-        if response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
-
-        log_spawn_complete(spawn_id, True, output_text, duration, 0.0)
-
-        return AgentResult(
-            success=True,
-            text=output_text,
-            spawn_id=spawn_id,
-            duration_ms=int(duration * 1000),
-            usage=usage,
-            model=resolved_model,
-            provider="grok-api"
+    parts = []
+    try:
+        # Streams count against POWERSPAWN_RPM_* like every other request
+        limiter = rate_limiter("grok-api")
+        if limiter is not None:
+            limiter.acquire()
+        client = _get_client()
+        request_kwargs = _build_request(prompt, resolved_model, system_prompt, temperature, timeout)
+        for delta in _stream_text(client, request_kwargs, {}, stop_predicate):
+            parts.append(delta)
+            yield delta
+    except GeneratorExit:
+        # Consumer stopped early; don't leave the entry marked as running
+        log_spawn_complete(spawn_id, False, "".join(parts), time.perf_counter() - start_time, 0.0,
+                           "Stream closed by consumer")
+        raise
+    except Exception as e:
+        log_spawn_complete(spawn_id, False, "".join(parts), time.perf_counter() - start_time, 0.0, str(e))
+        raise
+
+    log_spawn_complete(spawn_id, True, "".join(parts), time.perf_counter() - start_time, 0.0)
+
+@cached_spawn("grok-api")
+async def spawn_grok_api_async(
+    prompt: str,
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    enable_search: bool = True,
+    response_struct: Optional[type] = None,
+) -> AgentResult:
+    """
+    Async variant of spawn_grok_api (AsyncOpenAI).
+
+    Lets many Grok requests overlap on one event loop instead of blocking a
+    thread each — see providers/batch.py for the fan-out helper.
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("grok-api", model)
+
+    spawn_id = log_spawn_start(
+        agent="Grok",
+        model=resolved_model,
+        prompt=prompt,
+        tools=["api"] + (["search"] if enable_search else []),
+        task_summary=task_summary,
+        agent_type="API"
+    )
+
+    async def call():
+        client = _get_async_client()
+        request_kwargs = _build_request(
+            prompt, resolved_model, system_prompt, temperature, timeout,
+            json_output=response_struct is not None,
         )
 
-    except Exception as e:
-        duration = time.time() - start_time
-        log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
-        return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="grok-api")
+        response = await client.chat.completions.create(**request_kwargs)
+        return _extract_output(response)
+
+    return await run_spawn_async(spawn_id, start_time, resolved_model, "grok-api", call,
+                                 structure=_structure_for(response_struct))
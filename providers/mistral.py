@@ -2,43 +2,102 @@
 Mistral API Provider
 """
 
+import functools
+import hashlib
+import threading
 import time
+from collections import OrderedDict
+from operator import attrgetter
 from typing import Optional, Any
 
+from .. import fastjson
 from ..logger import log_spawn_start, log_spawn_complete
 from ..config import settings
+from ..llm_cache import cached_spawn
 from .types import AgentResult
+from .common import get_http_client, get_async_sdk_client, run_spawn, run_spawn_async
 
-_mistral_client = None
-_client_timeout = None
+
+# Batch API (spawn_mistral_batch)
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = {"SUCCESS", "FAILED", "TIMEOUT_EXCEEDED", "CANCELLED"}
+# Per-request HTTP timeout for the upload/poll/download calls themselves
+_BATCH_HTTP_TIMEOUT = 300
+# sha256 of an uploaded batch file -> Mistral file id, so resubmitting the
+# same prompts doesn't upload them again. LRU-bounded: a long-running server
+# submits many distinct batches.
+_BATCH_FILE_IDS_MAX = 64
+_batch_file_ids: "OrderedDict[str, str]" = OrderedDict()
+_batch_file_ids_lock = threading.Lock()
+
+
+def _cached_batch_file_id(digest: str) -> Optional[str]:
+    with _batch_file_ids_lock:
+        file_id = _batch_file_ids.get(digest)
+        if file_id is not None:
+            _batch_file_ids.move_to_end(digest)
+        return file_id
+
+
+def _remember_batch_file_id(digest: str, file_id: str) -> None:
+    with _batch_file_ids_lock:
+        _batch_file_ids[digest] = file_id
+        _batch_file_ids.move_to_end(digest)
+        while len(_batch_file_ids) > _BATCH_FILE_IDS_MAX:
+            _batch_file_ids.popitem(last=False)
+
+@functools.cache
+def _mistral_cls():
+    """Import the Mistral SDK on first use; later calls are a cache hit."""
+    from mistralai import Mistral
+    return Mistral
+
+# Cached per (api key, timeout): rotated keys / tenants and differing
+# timeouts each get their own client rather than rebuilding a single global
+@functools.lru_cache(maxsize=16)
+def _client_for(api_key: str, timeout: Optional[int]):
+    # Convert timeout from seconds to milliseconds for Mistral
+    timeout_ms = timeout * 1000 if timeout else None
+    return _mistral_cls()(
+        api_key=api_key, timeout_ms=timeout_ms, client=get_http_client()
+    )
+
+# Async spawns: clients live on the current async pool (get_async_sdk_client),
+# which is closed with its loop, so they are built per pool, not lru-cached
+def _async_client_for(api_key: str, timeout: Optional[int], async_client):
+    timeout_ms = timeout * 1000 if timeout else None
+    return _mistral_cls()(
+        api_key=api_key, timeout_ms=timeout_ms, async_client=async_client
+    )
+
+def _require_key() -> str:
+    api_key = settings.get_api_key("mistral")
+    if not api_key:
+        raise ValueError("Mistral API key not found.")
+    return api_key
 
 def _get_client(timeout: Optional[int] = None):
-    global _mistral_client, _client_timeout
-    if _mistral_client is None or _client_timeout != timeout:
-        from mistralai import Mistral
-        api_key = settings.get_api_key("mistral")
-        if not api_key:
-            raise ValueError("Mistral API key not found.")
-        
-        # Convert timeout from seconds to milliseconds for Mistral
-        timeout_ms = timeout * 1000 if timeout else None
-        _mistral_client = Mistral(api_key=api_key, timeout_ms=timeout_ms)
-        _client_timeout = timeout
-    return _mistral_client
+    return _client_for(_require_key(), timeout)
+
+def _get_async_client(timeout: Optional[int] = None):
+    api_key = _require_key()
+    return get_async_sdk_client(
+        ("mistral", api_key, timeout),
+        functools.partial(_async_client_for, api_key, timeout),
+    )
 
 def extract_mistral_text(response: Any) -> str:
     """
     Pure function to extract text from Mistral response.
     Isolates complex parsing logic.
     """
-    output_text = ""
-    if not hasattr(response, 'outputs') or not response.outputs:
+    outputs = getattr(response, 'outputs', None)
+    if not outputs:
         return ""
         
-    for output in response.outputs:
-        # Check type safely
-        output_type = getattr(output, 'type', '')
-        if output_type != 'message.output':
+    # The first message output is the answer; tool outputs before it are skipped
+    for output in outputs:
+        if getattr(output, 'type', None) != 'message.output':
             continue
             
         content = getattr(output, 'content', None)
@@ -46,24 +105,49 @@ def extract_mistral_text(response: Any) -> str:
             continue
             
         if isinstance(content, str):
-            output_text = content
-        elif isinstance(content, list):
-            # Handle list of content blocks
-            text_parts = []
-            for block in content:
-                if hasattr(block, 'text'):
-                    text_parts.append(block.text)
-                elif hasattr(block, 'type') and getattr(block, 'type', '') == 'text':
-                    text_parts.append(getattr(block, 'text', ''))
-            output_text = "".join(text_parts)
-        else:
-            output_text = str(content)
-        
-        # Stop after finding the first message output
-        break
+            return content
+        if isinstance(content, list):
+            # List of content blocks: join the text ones
+            return "".join(
+                text for text in (getattr(block, 'text', None) for block in content)
+                if text is not None
+            )
+        return str(content)
         
-    return output_text
+    return ""
+
+_USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+_usage_values = attrgetter(*_USAGE_FIELDS)
+
+def _extract_usage(response: Any) -> dict:
+    usage = getattr(response, 'usage', None)
+    if not usage:
+        return {}
+    try:
+        # All three in one C-level call for the SDK's UsageInfo
+        values = _usage_values(usage)
+    except AttributeError:
+        values = tuple(getattr(usage, name, 0) for name in _USAGE_FIELDS)
+    return dict(zip(_USAGE_FIELDS, values))
 
+# Constant request/log payloads, shared by every spawn (never mutated)
+_SEARCH_TOOLS = [{"type": "web_search"}]
+_TOOL_LABELS = ["api"]
+_TOOL_LABELS_SEARCH = ["api", "search"]
+
+def _conversation_kwargs(resolved_model: str, system_prompt: Optional[str], temperature: float, enable_search: bool) -> dict:
+    """Inline agent definition for conversations.start, shared by the sync and
+    async paths. Passing model/instructions/tools directly starts the
+    conversation in one request instead of creating an agent first."""
+    return {
+        "model": resolved_model,
+        "instructions": system_prompt or "You are a helpful assistant.",
+        "tools": _SEARCH_TOOLS if enable_search else None,
+        "completion_args": {"temperature": temperature},
+        "store": False,
+    }
+
+@cached_spawn("mistral")
 def spawn_mistral(
     prompt: str,
     *,
@@ -77,65 +161,209 @@ def spawn_mistral(
     """
     Spawn a Mistral agent via Mistral AI Agents API.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     resolved_model = settings.get_model_alias("mistral", model)
     
     spawn_id = log_spawn_start(
         agent="Mistral",
         model=resolved_model,
         prompt=prompt,
-        tools=["api"] + (["search"] if enable_search else []),
+        tools=_TOOL_LABELS_SEARCH if enable_search else _TOOL_LABELS,
         task_summary=task_summary,
         agent_type="API"
     )
     
-    try:
+    def call():
         client = _get_client(timeout=timeout)
         
-        tools = []
-        if enable_search:
-            tools.append({"type": "web_search"})
-            
-        # Create ephemeral agent
-        agent = client.beta.agents.create(
-            model=resolved_model,
-            name="PowerSpawn Agent",
-            description="Agent",
-            instructions=system_prompt or "You are a helpful assistant.",
-            tools=tools if tools else None,
-            completion_args={"temperature": temperature}
-        )
-        
+        # Ephemeral agent, defined inline: one round trip
         response = client.beta.conversations.start(
-            agent_id=agent.id,
             inputs=prompt,
-            store=False
+            **_conversation_kwargs(resolved_model, system_prompt, temperature, enable_search)
         )
         
-        duration = time.time() - start_time
-        output_text = extract_mistral_text(response)
-        
-        usage = {}
-        if hasattr(response, 'usage') and response.usage:
-             usage = {
-                "prompt_tokens": getattr(response.usage, 'prompt_tokens', 0),
-                "completion_tokens": getattr(response.usage, 'completion_tokens', 0),
-                "total_tokens": getattr(response.usage, 'total_tokens', 0),
-            }
-            
-        log_spawn_complete(spawn_id, True, output_text, duration, 0.0)
+        return extract_mistral_text(response), _extract_usage(response)
+
+    return run_spawn(spawn_id, start_time, resolved_model, "mistral", call)
+
+@cached_spawn("mistral")
+async def spawn_mistral_async(
+    prompt: str,
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 300,
+    task_summary: Optional[str] = None,
+    enable_search: bool = True,
+) -> AgentResult:
+    """
+    Async variant of spawn_mistral (uses the SDK's `*_async` methods).
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("mistral", model)
+    
+    spawn_id = log_spawn_start(
+        agent="Mistral",
+        model=resolved_model,
+        prompt=prompt,
+        tools=_TOOL_LABELS_SEARCH if enable_search else _TOOL_LABELS,
+        task_summary=task_summary,
+        agent_type="API"
+    )
+    
+    async def call():
+        client = _get_async_client(timeout=timeout)
+
+        response = await client.beta.conversations.start_async(
+            inputs=prompt,
+            **_conversation_kwargs(resolved_model, system_prompt, temperature, enable_search)
+        )
         
-        return AgentResult(
-            success=True,
-            text=output_text,
-            spawn_id=spawn_id,
-            duration_ms=int(duration * 1000),
-            usage=usage,
+        return extract_mistral_text(response), _extract_usage(response)
+
+    return await run_spawn_async(spawn_id, start_time, resolved_model, "mistral", call)
+
+def _batch_input(prompts: list[str], system_prompt: Optional[str], temperature: float) -> bytes:
+    """Serialize prompts as batch JSONL; custom_id is the prompt's index."""
+    system = [{"role": "system", "content": system_prompt}] if system_prompt else []
+    lines = [
+        fastjson.dumps({
+            "custom_id": str(i),
+            "body": {
+                "messages": system + [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+            },
+        })
+        for i, prompt in enumerate(prompts)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def parse_batch_output(data: bytes) -> dict[int, tuple[str, dict, Optional[str]]]:
+    """
+    Parse batch output/error JSONL into {index: (text, usage, error)}.
+    Pure function; lines that can't be parsed are skipped.
+    """
+    results = {}
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = fastjson.loads(line)
+            index = int(record["custom_id"])
+        except (ValueError, KeyError, TypeError):
+            continue
+
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        error = record.get("error")
+        if not error and response.get("status_code", 200) >= 400:
+            error = body.get("message") or f"HTTP {response.get('status_code')}"
+        if error:
+            results[index] = ("", {}, str(error))
+            continue
+
+        choices = body.get("choices") or []
+        text = (choices[0].get("message") or {}).get("content") or "" if choices else ""
+        results[index] = (text, body.get("usage") or {}, None)
+    return results
+
+def spawn_mistral_batch(
+    prompts: list[str],
+    *,
+    model: str = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: int = 3600,
+    poll_interval: float = 10.0,
+    task_summary: Optional[str] = None,
+) -> list[AgentResult]:
+    """
+    Run prompts through Mistral's Batch API (cheaper, not rate-limited like
+    interactive calls) and block until the job finishes.
+
+    For workloads that aren't time-sensitive: jobs can take minutes. Uses
+    plain chat completions, so no web search. One IAC.md entry covers the
+    whole batch; results keep prompt order and share its spawn_id.
+    """
+    start_time = time.perf_counter()
+    resolved_model = settings.get_model_alias("mistral", model)
+
+    spawn_id = log_spawn_start(
+        agent="Mistral",
+        model=resolved_model,
+        prompt="\n\n---\n\n".join(prompts),
+        tools=["api", "batch"],
+        task_summary=task_summary or f"Batch of {len(prompts)} prompts",
+        agent_type="API"
+    )
+
+    def fail_all(error: str) -> list[AgentResult]:
+        duration = time.perf_counter() - start_time
+        log_spawn_complete(spawn_id, False, "", duration, 0.0, error)
+        return [
+            AgentResult(success=False, text="", spawn_id=spawn_id, error=error, provider="mistral")
+            for _ in prompts
+        ]
+
+    try:
+        client = _get_client(timeout=_BATCH_HTTP_TIMEOUT)
+
+        data = _batch_input(prompts, system_prompt, temperature)
+        digest = hashlib.sha256(data).hexdigest()
+        file_id = _cached_batch_file_id(digest)
+        if file_id is None:
+            uploaded = client.files.upload(
+                file={"file_name": f"powerspawn-{digest[:12]}.jsonl", "content": data},
+                purpose="batch",
+            )
+            file_id = uploaded.id
+            _remember_batch_file_id(digest, file_id)
+
+        job = client.batch.jobs.create(
+            input_files=[file_id],
             model=resolved_model,
-            provider="mistral"
+            endpoint=BATCH_ENDPOINT,
         )
-        
+
+        deadline = time.monotonic() + timeout
+        while job.status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                client.batch.jobs.cancel(job_id=job.id)
+                return fail_all(f"Batch job {job.id} timed out after {timeout}s; cancelled")
+            time.sleep(poll_interval)
+            job = client.batch.jobs.get(job_id=job.id)
+
+        parsed = {}
+        for output_file in (getattr(job, "error_file", None), job.output_file):
+            if output_file:
+                parsed.update(parse_batch_output(client.files.download(file_id=output_file).read()))
+
+        duration = time.perf_counter() - start_time
+        results = []
+        for i in range(len(prompts)):
+            text, usage, error = parsed.get(i, ("", {}, f"No result in batch job {job.id} ({job.status})"))
+            results.append(AgentResult(
+                success=error is None,
+                text=text,
+                spawn_id=spawn_id,
+                duration_ms=int(duration * 1000),
+                usage=usage,
+                error=error,
+                model=resolved_model,
+                provider="mistral"
+            ))
+
+        succeeded = sum(r.success for r in results)
+        log_spawn_complete(
+            spawn_id,
+            succeeded > 0,
+            f"{succeeded}/{len(results)} succeeded (job {job.id}, {job.status})",
+            duration,
+            0.0,
+            None if succeeded else f"Batch job {job.id} {job.status}",
+        )
+        return results
+
     except Exception as e:
-        duration = time.time() - start_time
-        log_spawn_complete(spawn_id, False, "", duration, 0.0, str(e))
-        return AgentResult(success=False, text="", spawn_id=spawn_id, error=str(e), provider="mistral")
+        return fail_all(str(e))
@@ -5,13 +5,18 @@ Agent Types and Common Definitions
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
-    """Unified result from any agent invocation (CLI or API)."""
+    """Unified result from any agent invocation (CLI or API).
+
+    Slotted (no per-instance __dict__): fields can be set as before, but not
+    new attributes. Not hashable (usage is a dict).
+    """
     success: bool
     text: str
     spawn_id: Optional[str] = None
-    structured_output: Optional[dict] = None
+    # Parsed JSON (dict) or, with response_struct, a msgspec.Struct instance
+    structured_output: Optional[Any] = None
     session_id: Optional[str] = None
     duration_ms: int = 0
     cost_usd: float = 0.0
@@ -20,3 +25,5 @@ class AgentResult:
     model: Optional[str] = None
     provider: Optional[str] = None
     raw_response: Optional[Any] = None
+    # Served from llm_cache instead of calling the provider
+    cached: bool = False
@@ -36,6 +36,8 @@ for _name in (
     "PowerSpawn.mcp_server",
     "PowerSpawn.proc",
     "PowerSpawn.context",
+    "PowerSpawn.fastjson",
+    "PowerSpawn.llm_cache",
     "PowerSpawn.providers",
     "PowerSpawn.providers.types",
     "PowerSpawn.providers.claude",
@@ -46,5 +48,7 @@ for _name in (
     "PowerSpawn.providers.grok",
     "PowerSpawn.providers.grok_api",
     "PowerSpawn.providers.mistral",
+    "PowerSpawn.providers.batch",
+    "PowerSpawn.providers.common",
 ):
     _alias_submodule(_name)
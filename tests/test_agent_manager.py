@@ -41,3 +41,186 @@ def test_wait_for_all():
     
     t1.join()
     t2.join()
+
+def test_wait_for_all_timeout():
+    mgr = AgentManager()
+
+    done = mgr.register_start("a1", "m1", "t1")
+    stuck = mgr.register_start("a2", "m2", "t2")
+    mgr.register_complete(done, {"result": "ok"})
+
+    start = time.monotonic()
+    res = mgr.wait_for_all(timeout=0.1)
+
+    assert time.monotonic() - start < 1.0
+    assert res["status"] == "timeout"
+    assert res["still_running"] == [stuck]
+
+def test_get_running_list():
+    mgr = AgentManager()
+    aid = mgr.register_start("codex", "m1", "t1")
+
+    running = mgr.get_running_list()
+
+    assert running == [{"id": aid, "sec": 0, "type": "codex"}]
+
+def test_completed_history_is_bounded():
+    mgr = AgentManager(max_completed=3)
+    ids = []
+    for i in range(5):
+        aid = mgr.register_start("a", "m", f"t{i}")
+        mgr.register_complete(aid, {"result": i})
+        ids.append(aid)
+
+    assert set(mgr._completed) == set(ids[-3:])
+    assert mgr.get_recent_completed_ids(limit=2) == ids[-2:]
+    assert mgr.get_result(ids[0]) is None
+
+def test_submit_spawn_runs_on_pool():
+    mgr = AgentManager()
+    aid = mgr.register_start("a", "m", "t")
+
+    def work():
+        mgr.register_complete(aid, {"result": threading.current_thread().name})
+
+    mgr.submit_spawn(aid, work).result(timeout=1.0)
+
+    assert mgr.get_result(aid)["result"].startswith("powerspawn-agent")
+    assert aid not in mgr._futures
+
+def test_running_arrays_stay_consistent_on_removal():
+    mgr = AgentManager()
+    ids = [mgr.register_start(f"type{i}", "m", "t") for i in range(4)]
+
+    # Remove from the middle and the front; the last slot is swapped in
+    mgr.register_complete(ids[1], {})
+    mgr.register_complete(ids[0], {})
+
+    listed = {entry["id"]: entry["type"] for entry in mgr.get_running_list()}
+    assert listed == {ids[2]: "type2", ids[3]: "type3"}
+    assert all(mgr._run_ids[i] == aid for aid, i in mgr._idx_of.items())
+
+def test_wait_for_all_async_mixes_tasks_and_threads():
+    import asyncio
+    mgr = AgentManager()
+
+    async def scenario():
+        api_id = mgr.register_start("api", "m", "t")
+        cli_id = mgr.register_start("cli", "m", "t")
+
+        async def api_work():
+            await asyncio.sleep(0.01)
+            mgr.register_complete(api_id, {"result": "api"})
+
+        def cli_work():
+            time.sleep(0.02)
+            mgr.register_complete(cli_id, {"result": "cli"})
+
+        mgr.submit_spawn_async(api_id, api_work())
+        mgr.submit_spawn(cli_id, cli_work)
+        return await mgr.wait_for_all_async(timeout=1.0)
+
+    res = asyncio.run(scenario())
+    assert res["status"] == "all_completed"
+    assert sorted(r["result"] for r in res["results"]) == ["api", "cli"]
+
+def test_async_spawns_are_capped(monkeypatch):
+    import asyncio
+    monkeypatch.setenv("POWERSPAWN_MAX_CONCURRENCY", "2")
+    mgr = AgentManager()
+    active = peak = 0
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def work(aid):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            active -= 1
+            mgr.register_complete(aid, {"result": aid})
+
+        for _ in range(5):
+            aid = mgr.register_start("api", "m", "t")
+            mgr.submit_spawn_async(aid, work(aid))
+        await asyncio.sleep(0.01)
+        queued = mgr.queued_async_count()
+        release.set()
+        res = await mgr.wait_for_all_async(timeout=1.0)
+        return queued, res
+
+    queued, res = asyncio.run(scenario())
+    assert queued == 3
+    assert peak == 2
+    assert res["status"] == "all_completed"
+    assert len(res["results"]) == 5
+    assert mgr.queued_async_count() == 0
+
+def test_agent_ids_are_unique_8_hex():
+    mgr = AgentManager()
+    ids = [mgr.register_start("a", "m", "t") for _ in range(500)]
+    assert len(set(ids)) == 500
+    assert all(len(aid) >= 8 and int(aid, 16) >= 0 for aid in ids)
+
+
+def test_agent_ids_do_not_wrap(monkeypatch):
+    from itertools import count
+    import PowerSpawn.agent_manager as am
+
+    monkeypatch.setattr(am, "_id_counter", count(0xFFFF))
+    last_short, first_long = am._next_agent_id(), am._next_agent_id()
+    monkeypatch.setattr(am, "_id_counter", count(0))
+    assert am._next_agent_id() not in (last_short, first_long)
+    assert len(last_short) == 8 and len(first_long) == 9
+
+
+def test_set_max_workers_swaps_pool_and_lets_old_spawns_finish():
+    mgr = AgentManager()
+    gate = threading.Event()
+    old_spawn = mgr.submit_spawn("old", gate.wait, 5)
+
+    mgr.set_max_workers(1)
+
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def work():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    for f in [mgr.submit_spawn(f"new{i}", work) for i in range(3)]:
+        f.result(timeout=5)
+    assert peak[0] == 1
+
+    gate.set()
+    assert old_spawn.result(timeout=5) is True
+
+
+def test_async_spawn_cancelled_before_start_is_closed():
+    import asyncio
+    import inspect
+    import warnings
+
+    mgr = AgentManager()
+
+    async def work():
+        return "never"
+
+    async def main():
+        coro = work()
+        task = mgr.submit_spawn_async("early", coro)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return coro
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        coro = asyncio.run(main())
+    assert inspect.getcoroutinestate(coro) == inspect.CORO_CLOSED
+    assert coro.cr_frame is None
@@ -0,0 +1,217 @@
+"""Test concurrent API fan-out."""
+import asyncio
+
+import pytest
+
+from PowerSpawn.providers import batch
+from PowerSpawn.providers.types import AgentResult
+
+
+def test_spawn_batch_preserves_order_and_overlaps(monkeypatch):
+    """Jobs run concurrently but results come back in job order."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_spawn(prompt, *, model=None, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return AgentResult(success=True, text=prompt.upper(), provider="fake")
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "fake", fake_spawn)
+
+    jobs = [("fake", f"p{i}") for i in range(6)]
+    results = asyncio.run(batch.spawn_batch(jobs, max_concurrency=3))
+
+    assert [r.text for r in results] == [f"P{i}" for i in range(6)]
+    assert in_flight["peak"] == 3
+
+
+def test_spawn_batch_unknown_provider():
+    """Unknown providers fail per-job instead of raising."""
+    results = asyncio.run(batch.spawn_batch([("nope", "hi")]))
+    assert results[0].success is False
+    assert "Unknown API provider" in results[0].error
+
+
+def test_spawn_api_batch_sync_wrapper(monkeypatch):
+    """spawn_api_batch runs one provider over many prompts from sync code."""
+    async def fake_spawn(prompt, *, model=None, **kwargs):
+        return AgentResult(success=True, text=f"{model}:{prompt}", provider="fake")
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "fake", fake_spawn)
+
+    results = batch.spawn_api_batch(["a", "b"], provider="fake", model="m")
+    assert [r.text for r in results] == ["m:a", "m:b"]
+
+
+def test_spawn_race_returns_first_success_and_cancels_rest(monkeypatch):
+    """The fastest successful provider wins; slower ones are cancelled."""
+    cancelled = []
+
+    def make_spawn(name, delay, success=True):
+        async def spawn(prompt, **kwargs):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return AgentResult(success=success, text=name, provider=name)
+        return spawn
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "fail_fast", make_spawn("fail_fast", 0.0, success=False))
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "ok", make_spawn("ok", 0.01))
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "slow", make_spawn("slow", 5.0))
+
+    result = batch.spawn_api_race("q", providers=("fail_fast", "ok", "slow"))
+
+    assert result.success and result.text == "ok"
+    assert cancelled == ["slow"]
+
+
+def test_spawn_batch_accepts_provider_aliases(monkeypatch):
+    """Alternate provider spellings resolve through the dispatch table."""
+    async def fake_spawn(prompt, **kwargs):
+        return AgentResult(success=True, text=prompt, provider="grok-api")
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "grok-api", fake_spawn)
+
+    results = asyncio.run(batch.spawn_batch([("XAI", "a"), ("grok_api", "b")]))
+    assert [r.success for r in results] == [True, True]
+
+
+def test_spawn_batch_does_not_map_grok_cli_to_api(monkeypatch):
+    """"grok" names the CLI provider; a batch job for it is rejected, not rerouted."""
+    async def fake_spawn(prompt, **kwargs):
+        return AgentResult(success=True, text=prompt, provider="grok-api")
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "grok-api", fake_spawn)
+
+    [result] = asyncio.run(batch.spawn_batch([("grok", "a")]))
+    assert not result.success
+    assert result.error == "Unknown API provider: grok"
+
+
+def test_sync_batch_and_race_close_their_pools(monkeypatch):
+    """spawn_api_batch / spawn_api_race leave no pool (or loop) behind."""
+    import gc
+    import weakref
+
+    from PowerSpawn.providers import common
+
+    clients = []
+    loops = []
+
+    async def fake_spawn(prompt, **kwargs):
+        client = common.get_async_http_client()
+        assert common.get_async_http_client() is client
+        clients.append(client)
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        return AgentResult(success=True, text=prompt, provider="fake")
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "fake", fake_spawn)
+    pools_before = dict(common._loop_pools)
+
+    for _ in range(20):
+        assert all(r.success for r in batch.spawn_api_batch(["a", "b"], provider="fake"))
+    assert batch.spawn_api_race("c", providers=("fake",)).success
+
+    # One pool per call, shared by its jobs, closed on the way out
+    assert len({id(c) for c in clients}) == 21
+    assert all(c.is_closed for c in clients)
+    assert common._loop_pools == pools_before
+    del clients
+    gc.collect()
+    assert all(ref() is None for ref in loops)
+
+
+def test_async_http_client_is_per_event_loop():
+    """Each event loop gets its own async pool; a loop reuses its own."""
+    from PowerSpawn.providers.common import get_async_http_client
+
+    async def grab_twice():
+        first = get_async_http_client()
+        assert get_async_http_client() is first
+        await first.aclose()
+        return first
+
+    assert asyncio.run(grab_twice()) is not asyncio.run(grab_twice())
+
+
+def test_rate_limiter_spaces_starts_beyond_the_window(monkeypatch):
+    """Past rpm starts, the next slot opens when the oldest leaves the window."""
+    from PowerSpawn.providers import common
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr(common.time, "monotonic", lambda: clock["now"])
+    limiter = common.RateLimiter(rpm=2)
+
+    assert limiter._reserve() == 0
+    clock["now"] = 110.0
+    assert limiter._reserve() == 0
+    # Third start must wait for the first (t=100) to age out at t=160
+    assert limiter._reserve() == 50.0
+    # Fourth waits for the second (t=110)
+    assert limiter._reserve() == 60.0
+    clock["now"] = 240.0
+    assert limiter._reserve() == 0
+
+
+def test_rate_limiter_is_configured_per_provider(monkeypatch):
+    from PowerSpawn.providers import common
+
+    common.rate_limiter.cache_clear()
+    monkeypatch.setenv("POWERSPAWN_RPM_GROK_API", "30")
+    try:
+        assert common.rate_limiter("grok-api").rpm == 30
+        assert common.rate_limiter("gemini") is None
+    finally:
+        common.rate_limiter.cache_clear()
+
+
+def test_async_prewarm_opens_async_pool_connections(monkeypatch):
+    """After the sync warm-up, the async clients are built and HEADs sent."""
+    import threading
+    from PowerSpawn.providers import common, grok_api
+
+    done = threading.Thread(target=lambda: None)
+    done.start()
+    built, heads = [], []
+
+    class FakePool:
+        async def head(self, url, timeout=None):
+            heads.append(url)
+
+    monkeypatch.setattr(common, "prewarm_api_clients", lambda providers=None: done)
+    monkeypatch.setattr(common, "get_async_http_client", lambda: FakePool())
+    monkeypatch.setattr(grok_api, "_get_async_client", lambda: built.append("grok"))
+
+    asyncio.run(common.prewarm_api_clients_async(["grok", "gemini"]))
+
+    assert built == ["grok"]
+    assert heads == [common.API_ORIGINS["grok"]]
+
+
+def test_spawn_batch_models_are_per_provider(monkeypatch):
+    """A job's own model wins; a shared model= needs a single provider."""
+    seen = []
+
+    def fake(name):
+        async def spawn(prompt, *, model=None, **kwargs):
+            seen.append((name, model))
+            return AgentResult(success=True, text=prompt, provider=name)
+        return spawn
+
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "grok-api", fake("grok-api"))
+    monkeypatch.setitem(batch.ASYNC_SPAWNERS, "gemini", fake("gemini"))
+
+    asyncio.run(batch.spawn_batch([("grok-api", "a", "grok-4"), ("gemini", "b")]))
+    assert seen == [("grok-api", "grok-4"), ("gemini", None)]
+
+    seen.clear()
+    asyncio.run(batch.spawn_batch([("xai", "a"), ("grok-api", "b", "mini")], model="grok-4"))
+    assert seen == [("grok-api", "grok-4"), ("grok-api", "mini")]
+
+    with pytest.raises(ValueError):
+        asyncio.run(batch.spawn_batch([("grok-api", "a"), ("gemini", "b")], model="grok-4"))
+    assert len(seen) == 2
@@ -0,0 +1,42 @@
+"""Test the async CLI spawns keep their start-up I/O off the event loop."""
+import asyncio
+import threading
+
+import pytest
+
+from PowerSpawn.providers import claude, copilot, gemini_cli
+
+CLAUDE_OUTPUT = b'{"type": "result", "subtype": "success", "result": "ok"}'
+
+
+@pytest.mark.parametrize("module, spawn, stdout", [
+    (claude, claude.spawn_claude_async, CLAUDE_OUTPUT),
+    (copilot, copilot.spawn_copilot_async, "ok"),
+    (gemini_cli, gemini_cli.spawn_gemini_cli_async, "ok"),
+])
+def test_async_spawn_starts_off_the_loop(monkeypatch, module, spawn, stdout):
+    threads = []
+
+    def log_start(**kwargs):
+        threads.append(threading.current_thread())
+        return "sid"
+
+    async def fake_run(cmd, **kwargs):
+        threads.append(threading.current_thread())
+        return 0, stdout, "", False
+
+    monkeypatch.setattr(module, "log_spawn_start", log_start)
+    monkeypatch.setattr(module, "log_spawn_complete", lambda **kwargs: None)
+    monkeypatch.setattr(module, "run_captured_async", fake_run)
+    if module is claude:
+        def inject(prompt, working_dir, provider=None):
+            threads.append(threading.current_thread())
+            return prompt
+        monkeypatch.setattr(claude, "inject_agents_context", inject)
+
+    result = asyncio.run(spawn("hi", timeout=30))
+
+    assert result.success and result.text == "ok"
+    *start, run = threads
+    assert run is threading.main_thread()
+    assert start and all(t is not threading.main_thread() for t in start)
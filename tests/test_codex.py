@@ -0,0 +1,58 @@
+"""Test the Codex CLI provider's event streams."""
+import asyncio
+import os
+import sys
+
+import pytest
+
+from PowerSpawn.providers import codex
+
+FAKE_CODEX = r"""
+import json, sys
+prompt = sys.stdin.read()
+print(json.dumps({"type": "thread.started", "thread_id": "t1"}))
+print(json.dumps({"type": "item.completed", "item": {"type": "command_execution", "aggregated_output": "x" * 100000}}))
+print(json.dumps({"type": "item.completed", "item": {"type": "agent_message", "text": "echo: " + prompt}}))
+print(json.dumps({"type": "turn.completed", "usage": {"output_tokens": 3}}))
+"""
+
+
+def _fake_command(script):
+    return lambda model, bypass_sandbox, working_dir: ([sys.executable, "-c", script], None)
+
+
+def test_spawn_codex_async_reduces_stream(monkeypatch):
+    monkeypatch.setattr(codex, "_codex_command", _fake_command(FAKE_CODEX))
+    monkeypatch.setattr(codex, "log_spawn_start", lambda **kwargs: "sid")
+    monkeypatch.setattr(codex, "log_spawn_complete", lambda **kwargs: None)
+
+    result = asyncio.run(codex.spawn_codex_async("hi", timeout=30))
+    assert result.success is True
+    assert result.text == "echo: hi"
+    assert result.session_id == "t1"
+    assert result.usage == {"output_tokens": 3}
+    assert result == codex.spawn_codex("hi", timeout=30)
+
+
+def test_codex_stream_async_timeout(monkeypatch):
+    monkeypatch.setattr(codex, "_codex_command", _fake_command("import time; time.sleep(30)"))
+
+    async def collect():
+        return [e async for e in codex._spawn_codex_stream_async("hi", "m", True, None, 0.5)]
+
+    events = asyncio.run(collect())
+    assert [e.type for e in events] == ["error"]
+    assert "Timed out" in events[0].data["message"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX sessions")
+def test_codex_stream_async_shell_child_gets_own_session(monkeypatch):
+    script = 'import json, os; print(json.dumps({"type": "sid", "sid": os.getsid(0)}))'
+    monkeypatch.setattr(codex, "_codex_command", _fake_command(script))
+    monkeypatch.setattr(codex, "resolve_command", lambda cmd: (cmd, True))
+
+    async def collect():
+        return [e async for e in codex._spawn_codex_stream_async("hi", "m", True, None, 30)]
+
+    [event] = asyncio.run(collect())
+    assert event.data["sid"] != os.getsid(0)
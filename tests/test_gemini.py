@@ -0,0 +1,77 @@
+"""Test Gemini API streaming."""
+from types import SimpleNamespace
+
+from PowerSpawn.providers import gemini
+
+
+class FakeChat:
+    def __init__(self, texts):
+        self.texts = texts
+        self.sent = None
+
+    def send_message_stream(self, message):
+        self.sent = message
+        return (SimpleNamespace(text=t) for t in self.texts)
+
+
+def test_spawn_gemini_stream_yields_chunks_and_logs(monkeypatch):
+    chat = FakeChat(["Hel", None, "lo"])
+    created = {}
+    client = SimpleNamespace(chats=SimpleNamespace(create=lambda **kwargs: created.update(kwargs) or chat))
+    completed = []
+
+    monkeypatch.setattr(gemini, "_get_client", lambda timeout=None: client)
+    monkeypatch.setattr(gemini, "_build_config", lambda *args: args)
+    monkeypatch.setattr(gemini, "log_spawn_start", lambda **kwargs: "sid")
+    monkeypatch.setattr(gemini, "log_spawn_complete", lambda *args: completed.append(args))
+
+    deltas = list(gemini.spawn_gemini_stream("hi", model="flash", system_prompt="be brief"))
+
+    assert deltas == ["Hel", "lo"]
+    # System prompt rides in the config, not the user turn
+    assert chat.sent == "hi"
+    assert created["config"][-1] == "be brief"
+    assert completed[0][:3] == ("sid", True, "Hello")
+
+
+def test_async_client_is_per_event_loop(monkeypatch):
+    import asyncio
+
+    built = []
+
+    class FakeClient:
+        def __init__(self, api_key, http_options):
+            built.append(http_options)
+
+    monkeypatch.setattr(gemini, "_genai_sdk", lambda: SimpleNamespace(Client=FakeClient))
+    monkeypatch.setattr(gemini, "_genai_types", lambda: SimpleNamespace(HttpOptions=lambda **kw: kw))
+    monkeypatch.setattr(gemini.settings, "get_api_key", lambda provider: "key")
+
+    async def two_lookups():
+        return gemini._get_async_client(timeout=30), gemini._get_async_client(timeout=30)
+
+    first, again = asyncio.run(two_lookups())
+    second, _ = asyncio.run(two_lookups())
+
+    # Reused within a loop, rebuilt for a new loop on that loop's pool
+    assert first is again
+    assert first is not second
+    assert len(built) == 2
+    assert built[0]["httpx_async_client"] is not built[1]["httpx_async_client"]
+    assert built[0]["timeout"] == 30000
+
+
+def test_spawn_gemini_stream_waits_for_rate_limiter(monkeypatch):
+    events = []
+    chat = FakeChat(["ok"])
+    client = SimpleNamespace(chats=SimpleNamespace(create=lambda **kwargs: chat))
+    limiter = SimpleNamespace(acquire=lambda: events.append("acquire"))
+
+    monkeypatch.setattr(gemini, "rate_limiter", lambda provider: events.append(provider) or limiter)
+    monkeypatch.setattr(gemini, "_get_client", lambda timeout=None: events.append("client") or client)
+    monkeypatch.setattr(gemini, "_build_config", lambda *args: args)
+    monkeypatch.setattr(gemini, "log_spawn_start", lambda **kwargs: "sid")
+    monkeypatch.setattr(gemini, "log_spawn_complete", lambda *args: None)
+
+    assert list(gemini.spawn_gemini_stream("hi")) == ["ok"]
+    assert events == ["gemini", "acquire", "client"]
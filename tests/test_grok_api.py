@@ -0,0 +1,81 @@
+"""Test Grok API streaming helpers."""
+from types import SimpleNamespace
+
+from PowerSpawn.providers.grok_api import _stream_text
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCompletions:
+    def __init__(self, chunks):
+        self.stream = FakeStream(chunks)
+        self.kwargs = None
+
+    def create(self, **kwargs):
+        self.kwargs = kwargs
+        return self.stream
+
+
+def test_stream_text_yields_deltas_and_usage():
+    """Deltas are yielded in order; usage comes from the final chunk."""
+    completions = FakeCompletions([
+        _chunk("Hel"),
+        _chunk(""),
+        _chunk("lo"),
+        _chunk(usage=SimpleNamespace(prompt_tokens=3, completion_tokens=2, total_tokens=5)),
+    ])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    usage = {}
+    parts = list(_stream_text(client, {"model": "grok"}, usage))
+
+    assert parts == ["Hel", "lo"]
+    assert usage == {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+    assert completions.kwargs["stream"] is True
+
+
+def test_stream_text_stop_predicate_closes_stream():
+    """A satisfied stop_predicate ends the stream early and closes it."""
+    completions = FakeCompletions([_chunk("ans"), _chunk("wer: 42"), _chunk(" and more")])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    parts = list(_stream_text(client, {}, {}, stop_predicate=lambda text: "42" in text))
+
+    assert "".join(parts) == "answer: 42"
+    assert completions.stream.closed
+
+
+def test_spawn_grok_api_stream_waits_for_rate_limiter(monkeypatch):
+    """The stream takes a rate-limiter slot before the request goes out."""
+    from PowerSpawn.providers import grok_api
+
+    events = []
+    completions = FakeCompletions([_chunk("ok")])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    limiter = SimpleNamespace(acquire=lambda: events.append("acquire"))
+
+    monkeypatch.setattr(grok_api, "rate_limiter", lambda provider: events.append(provider) or limiter)
+    monkeypatch.setattr(grok_api, "_get_client", lambda: events.append("client") or client)
+    monkeypatch.setattr(grok_api, "log_spawn_start", lambda **kwargs: "sid")
+    monkeypatch.setattr(grok_api, "log_spawn_complete", lambda *args: None)
+
+    assert list(grok_api.spawn_grok_api_stream("hi")) == ["ok"]
+    assert events == ["grok-api", "acquire", "client"]
@@ -35,3 +35,42 @@ def test_config_imports():
     """Test config module imports."""
     from PowerSpawn.config import settings
     assert settings is not None
+
+
+def test_api_sdks_are_imported_lazily():
+    """Importing the API providers must not import their SDKs."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys; import powerspawn.providers.batch; "
+        "print(','.join(m for m in ('openai', 'google.genai', 'mistralai', 'httpx') "
+        "if m in sys.modules))"
+    )
+    repo_parent = Path(__file__).resolve().parents[2]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=repo_parent,
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_providers_package_imports_no_provider_eagerly():
+    """Importing the providers package loads providers only on first use."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys; import powerspawn.providers as p; "
+        "loaded = lambda: sorted(m.rsplit('.', 1)[1] for m in sys.modules "
+        "if m.startswith('powerspawn.providers.') and m != 'powerspawn.providers.types'); "
+        "print(loaded()); p.spawn_claude; print(loaded())"
+    )
+    repo_parent = Path(__file__).resolve().parents[2]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=repo_parent,
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.split("\n")[:2] == ["[]", "['claude']"]
@@ -0,0 +1,110 @@
+"""Test the exact response cache for API spawns."""
+import asyncio
+
+import pytest
+
+from PowerSpawn import llm_cache
+from PowerSpawn.providers.types import AgentResult
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_cache, "CACHE_ENABLED", True)
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+    llm_cache.clear()
+    yield llm_cache
+    llm_cache.clear()
+
+
+def _counting_spawn(calls, success=True):
+    @llm_cache.cached_spawn("gemini")
+    def spawn(prompt, *, model=None, temperature=0.7, task_summary=None):
+        calls.append(prompt)
+        return AgentResult(success=success, text=f"answer to {prompt}", provider="gemini")
+    return spawn
+
+
+def test_deterministic_calls_hit_cache(cache):
+    calls = []
+    spawn = _counting_spawn(calls)
+
+    first = spawn("2+2?", temperature=0, task_summary="a")
+    second = spawn("2+2?", temperature=0, task_summary="b")
+
+    assert calls == ["2+2?"]
+    assert second.text == first.text and second.success
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+    # Survives a restart via the on-disk copy
+    cache._memory.clear()
+    assert spawn("2+2?", temperature=0).text == first.text
+    assert calls == ["2+2?"]
+
+
+def test_sampled_and_failed_calls_bypass_cache(cache):
+    calls = []
+    spawn = _counting_spawn(calls)
+    spawn("hi")
+    spawn("hi")
+    assert calls == ["hi", "hi"]
+
+    failing = _counting_spawn(calls, success=False)
+    failing("boom", temperature=0)
+    failing("boom", temperature=0)
+    assert calls.count("boom") == 2
+
+
+def test_async_spawns_are_cached(cache):
+    calls = []
+
+    @llm_cache.cached_spawn("mistral")
+    async def spawn(prompt, *, model=None, temperature=0.7):
+        calls.append(prompt)
+        return AgentResult(success=True, text=prompt[::-1], provider="mistral")
+
+    async def twice():
+        return [await spawn("abc", temperature=0) for _ in range(2)]
+
+    assert [r.text for r in asyncio.run(twice())] == ["cba", "cba"]
+    assert calls == ["abc"]
+
+
+def test_bypass_skips_lookup_and_marks_hits(cache):
+    calls = []
+    spawn = _counting_spawn(calls)
+
+    assert spawn("q", temperature=0).cached is False
+    assert spawn("q", temperature=0).cached is True
+    # Bypass: the spawn runs again (and never sees the cache option)
+    fresh = spawn("q", temperature=0, cache={"bypass": True})
+    assert fresh.cached is False
+    assert calls == ["q", "q"]
+
+
+def test_memory_is_lru_bounded(cache, monkeypatch):
+    monkeypatch.setattr(llm_cache, "CACHE_MAX_ENTRIES", 2)
+    for key in ("a", "b"):
+        cache.put(key, AgentResult(success=True, text=key))
+    assert cache.get("a").text == "a"  # "a" now most recently used
+
+    cache.put("c", AgentResult(success=True, text="c"))
+    assert list(cache._memory) == ["a", "c"]
+
+
+def test_put_evicts_expired_entries(cache):
+    cache.put("old", AgentResult(success=True, text="old"))
+    stamp, fields = cache._memory["old"]
+    cache._memory["old"] = (stamp - llm_cache.CACHE_TTL - 1, fields)
+
+    cache.put("new", AgentResult(success=True, text="new"))
+    assert list(cache._memory) == ["new"]
+
+
+@pytest.mark.parametrize("content", [b"{not json", b"[]", b"[1]", b'"text"', b'[1, {"bogus": 1}]', b"[1, 2]"])
+def test_unreadable_disk_entry_is_a_miss_and_removed(cache, tmp_path, content):
+    path = tmp_path / "bad.json"
+    path.write_bytes(content)
+
+    assert cache.get("bad") is None
+    assert not path.exists()
+    assert cache.stats["misses"] == 1
@@ -12,6 +12,8 @@ from logger import (
     log_spawn_complete,
     get_logger,
     AgentLogger,
+    configure_logger,
+    sanitize_for_table,
 )
 
 
@@ -28,6 +30,23 @@ def test_generate_spawn_id_unique():
     assert len(set(ids)) == 100  # All unique
 
 
+def test_generate_spawn_id_across_buffer_refills():
+    """IDs stay well-formed and unique when the random buffer refills."""
+    ids = [generate_spawn_id() for _ in range(1000)]
+    assert len(set(ids)) == 1000
+    assert all(len(i) == 8 and int(i, 16) >= 0 for i in ids)
+
+
+def test_sanitize_for_table_fast_path_matches_general():
+    """Clean single lines pass through; anything else is normalized."""
+    for text in ["Fix the bug", "a b", " lead", "trail ", "two  spaces",
+                 "line\nbreak", "tab\there", "nbsp\u00a0here", "x" * 70]:
+        collapsed = " ".join(text.split())
+        expected = collapsed if len(collapsed) <= 60 else collapsed[:57] + "..."
+        assert sanitize_for_table(text) == expected
+    assert sanitize_for_table("") == ""
+
+
 def test_log_spawn_start_creates_entry(tmp_path):
     """Test log_spawn_start creates IAC.md entry."""
     # Create a logger instance with temp directory
@@ -221,6 +240,137 @@ def test_max_entries_limit(tmp_path):
         assert "9" not in headers  # oldest 10 history entries trimmed
 
 
+def test_buffered_writes_coalesce_until_flush(tmp_path):
+    """Test flush_interval batches IAC.md writes until flush()."""
+    with patch('logger.get_output_dir', return_value=tmp_path):
+        logger = AgentLogger(flush_interval=60)
+
+        spawn_id = logger.log_spawn_start(
+            agent="Claude",
+            model="sonnet",
+            prompt="Buffered prompt",
+            tools=[],
+            task_summary="Buffered task"
+        )
+        logger.log_spawn_complete(
+            spawn_id=spawn_id,
+            success=True,
+            result_text="Buffered result",
+            duration_seconds=1.0,
+        )
+
+        iac_file = tmp_path / "IAC.md"
+        assert not iac_file.exists()
+
+        logger.flush()
+        content = iac_file.read_text(encoding='utf-8')
+        assert "Buffered task" in content
+        assert "Buffered result" in content
+        assert "No active agents" in content
+
+
+def test_background_writer_flushes_after_interval(tmp_path):
+    """Test the buffered-mode writer thread writes IAC.md on its own."""
+    import time
+
+    with patch('logger.get_output_dir', return_value=tmp_path):
+        logger = AgentLogger(flush_interval=0.05)
+        logger.log_spawn_start(
+            agent="Claude",
+            model="sonnet",
+            prompt="Background prompt",
+            tools=[],
+            task_summary="Background task"
+        )
+
+        iac_file = tmp_path / "IAC.md"
+
+        def written():
+            return iac_file.exists() and "Background task" in iac_file.read_text(encoding='utf-8')
+
+        deadline = time.monotonic() + 2.0
+        while not written() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert written()
+
+
+def test_entries_from_another_writer_are_kept(tmp_path):
+    """Two loggers on one IAC.md (e.g. the server and a CLI run) keep each other's rows."""
+    with patch('logger.get_output_dir', return_value=tmp_path):
+        server = AgentLogger(flush_interval=0)
+        script = AgentLogger(flush_interval=0)
+
+        server_id = server.log_spawn_start(
+            agent="Claude", model="sonnet", prompt="p", tools=[], task_summary="Server task"
+        )
+        script.log_spawn_start(
+            agent="Codex", model="gpt", prompt="p", tools=[], task_summary="Script task"
+        )
+        server.log_spawn_complete(server_id, True, "Server result", 1.0)
+
+        content = (tmp_path / "IAC.md").read_text(encoding='utf-8')
+        assert "Script task" in content
+        assert "Server task" in content
+        assert "Server result" in content
+
+
+def test_buffered_changes_are_replayed_over_outside_edits(tmp_path):
+    """A buffered flush re-reads a changed IAC.md and reapplies its own events."""
+    with patch('logger.get_output_dir', return_value=tmp_path):
+        server = AgentLogger(flush_interval=60)
+        script = AgentLogger(flush_interval=0)
+
+        server_id = server.log_spawn_start(
+            agent="Claude", model="sonnet", prompt="p", tools=[], task_summary="Server task"
+        )
+        server.flush()
+        server.log_spawn_complete(server_id, True, "Server result", 1.0)
+        script.log_spawn_start(
+            agent="Codex", model="gpt", prompt="p", tools=[], task_summary="Script task"
+        )
+        server.flush()
+
+        content = (tmp_path / "IAC.md").read_text(encoding='utf-8')
+        assert content.index("Script task") < content.index("Server task")
+        assert "Server result" in content
+        assert "⏳ **Running** | `#" + server_id not in content
+
+
+def test_configure_logger_swaps_in_buffered_logger(tmp_path):
+    """Test configure_logger flushes the old global logger and buffers after."""
+    import logger as logger_module
+
+    with patch('logger.get_output_dir', return_value=tmp_path):
+        logger_module._logger = AgentLogger(flush_interval=60)
+        log_spawn_start(
+            agent="Claude",
+            model="sonnet",
+            prompt="Before",
+            tools=[],
+            task_summary="Before swap"
+        )
+
+        buffered = configure_logger(flush_interval=60)
+        assert get_logger() is buffered
+
+        iac_file = tmp_path / "IAC.md"
+        assert "Before swap" in iac_file.read_text(encoding='utf-8')
+
+        log_spawn_start(
+            agent="Claude",
+            model="sonnet",
+            prompt="After",
+            tools=[],
+            task_summary="After swap"
+        )
+        assert "After swap" not in iac_file.read_text(encoding='utf-8')
+
+        buffered.flush()
+        content = iac_file.read_text(encoding='utf-8')
+        assert "Before swap" in content
+        assert "After swap" in content
+    logger_module._logger = None
 
 
 def test_global_logger_functions(tmp_path):
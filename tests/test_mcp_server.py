@@ -77,6 +77,10 @@ def test_agent_result_dataclass():
     assert result.error is None
     assert result.raw_response is None
 
+    # Callers may still update fields on a result
+    result.text = "Edited"
+    assert result.text == "Edited"
+
 
 def test_codex_event_dataclass():
     """Test CodexEvent dataclass structure."""
@@ -124,3 +128,83 @@ def test_config_models_exist():
         assert len(copilot_models) > 0
     except ImportError:
         pytest.skip("Config not accessible")
+
+
+def test_list_tools_is_built_once():
+    """The tool definitions are cached across list_tools calls."""
+    import asyncio
+    try:
+        from PowerSpawn.mcp_server import list_tools
+    except ImportError as e:
+        pytest.skip(f"MCP SDK not installed: {e}")
+    first = asyncio.run(list_tools())
+    assert asyncio.run(list_tools()) is first
+    assert "spawn_mistral" in {tool.name for tool in first}
+
+
+def test_tool_responses_are_compact_json():
+    """Handler replies are single-line JSON that round-trips."""
+    import asyncio
+    import json
+    try:
+        from PowerSpawn.mcp_server import call_tool
+    except ImportError as e:
+        pytest.skip(f"MCP SDK not installed: {e}")
+    content = asyncio.run(call_tool("result", {"agent_id": "missing"}))
+    text = content[0].text
+    assert "\n" not in text
+    assert json.loads(text)["status"] == "not_found"
+
+
+def test_call_tool_dispatch_tables_cover_listed_tools():
+    """Every listed tool has a dispatch entry; unknown names are reported."""
+    import asyncio
+    import json
+    try:
+        from PowerSpawn.mcp_server import MANAGEMENT_TOOLS, SPAWN_TOOLS, call_tool, list_tools
+    except ImportError as e:
+        pytest.skip(f"MCP SDK not installed: {e}")
+    listed = {tool.name for tool in asyncio.run(list_tools())}
+    assert listed == set(SPAWN_TOOLS) | set(MANAGEMENT_TOOLS)
+
+    content = asyncio.run(call_tool("nope", {}))
+    assert json.loads(content[0].text) == {"error": "Unknown tool: nope"}
+
+
+def test_large_replies_are_serialized_off_loop(monkeypatch):
+    """Big agent results are encoded on a worker thread, small ones inline."""
+    import asyncio
+    import threading
+    try:
+        from PowerSpawn import mcp_server
+    except ImportError as e:
+        pytest.skip(f"MCP SDK not installed: {e}")
+    threads = []
+    real_reply = mcp_server._reply
+
+    def recording_reply(payload):
+        threads.append(threading.current_thread() is threading.main_thread())
+        return real_reply(payload)
+
+    monkeypatch.setattr(mcp_server, "_reply", recording_reply)
+    monkeypatch.setattr(mcp_server, "_OFFLOAD_REPLY_CHARS", 10)
+
+    small, big = {"result": "ok"}, {"result": "x" * 20}
+    asyncio.run(mcp_server._reply_results(small, [small]))
+    asyncio.run(mcp_server._reply_results(big, [big]))
+    assert threads == [True, False]
+
+
+def test_spawn_kwargs_are_filtered_by_signature():
+    """Only arguments the spawn function accepts reach it; cache survives."""
+    try:
+        from PowerSpawn import mcp_server
+    except ImportError as e:
+        pytest.skip(f"MCP SDK not installed: {e}")
+    from PowerSpawn.providers import spawn_claude, spawn_mistral_async
+
+    args = {"prompt": "hi", "model": "sonnet", "cache": {"bypass": True}, "_meta": {}}
+    assert mcp_server._spawn_kwargs(args, spawn_claude) == {"prompt": "hi", "model": "sonnet"}
+    assert mcp_server._spawn_kwargs(args, spawn_mistral_async) == {
+        "prompt": "hi", "model": "sonnet", "cache": {"bypass": True}
+    }
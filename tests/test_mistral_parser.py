@@ -37,3 +37,78 @@ def test_extract_no_message():
         MockOutput("tool.execution", "result")
     ])
     assert extract_mistral_text(response) == ""
+
+def test_parse_batch_output():
+    """Test batch JSONL output parsing (successes, errors, junk lines)."""
+    from PowerSpawn.providers.mistral import parse_batch_output
+
+    data = (
+        b'{"custom_id": "1", "response": {"status_code": 200, "body": '
+        b'{"choices": [{"message": {"content": "second"}}], "usage": {"total_tokens": 7}}}}\n'
+        b'{"custom_id": "0", "response": {"status_code": 200, "body": '
+        b'{"choices": [{"message": {"content": "first"}}]}}}\n'
+        b'{"custom_id": "2", "response": {"status_code": 429, "body": {"message": "rate limited"}}}\n'
+        b'not json\n'
+    )
+    parsed = parse_batch_output(data)
+
+    assert parsed[0] == ("first", {}, None)
+    assert parsed[1] == ("second", {"total_tokens": 7}, None)
+    assert parsed[2] == ("", {}, "rate limited")
+    assert len(parsed) == 3
+
+
+def test_spawn_mistral_starts_conversation_in_one_call(monkeypatch):
+    """The ephemeral agent is defined inline: no separate agents.create."""
+    from types import SimpleNamespace
+    from PowerSpawn.providers import common, mistral
+
+    calls = []
+
+    def start(**kwargs):
+        calls.append(kwargs)
+        return MockResponse([MockOutput("message.output", "Hi")])
+
+    client = SimpleNamespace(beta=SimpleNamespace(conversations=SimpleNamespace(start=start)))
+    monkeypatch.setattr(mistral, "_get_client", lambda timeout=None: client)
+    monkeypatch.setattr(mistral, "log_spawn_start", lambda **kwargs: "sid")
+    monkeypatch.setattr(common, "log_spawn_complete", lambda *args: None)
+
+    result = mistral.spawn_mistral.__wrapped__("hello", system_prompt="be brief", enable_search=False)
+    assert result.success is True
+    assert result.text == "Hi"
+    assert len(calls) == 1
+    assert calls[0]["inputs"] == "hello"
+    assert calls[0]["instructions"] == "be brief"
+    assert calls[0]["store"] is False
+    assert "agent_id" not in calls[0]
+
+
+def test_extract_usage_defaults_missing_counts():
+    """Usage objects missing a count report 0 for it."""
+    from types import SimpleNamespace
+    from PowerSpawn.providers.mistral import _extract_usage
+
+    full = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=3, completion_tokens=4, total_tokens=7))
+    assert _extract_usage(full) == {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": 7}
+    partial = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=3))
+    assert _extract_usage(partial) == {"prompt_tokens": 3, "completion_tokens": 0, "total_tokens": 0}
+    assert _extract_usage(SimpleNamespace(usage=None)) == {}
+
+
+def test_batch_file_ids_are_lru_bounded(monkeypatch):
+    """The uploaded-batch-file map keeps only the most recently used entries."""
+    from collections import OrderedDict
+
+    from PowerSpawn.providers import mistral
+
+    monkeypatch.setattr(mistral, "_batch_file_ids", OrderedDict())
+    monkeypatch.setattr(mistral, "_BATCH_FILE_IDS_MAX", 2)
+
+    mistral._remember_batch_file_id("a", "file-a")
+    mistral._remember_batch_file_id("b", "file-b")
+    assert mistral._cached_batch_file_id("a") == "file-a"
+    mistral._remember_batch_file_id("c", "file-c")
+
+    assert mistral._cached_batch_file_id("b") is None
+    assert list(mistral._batch_file_ids) == ["a", "c"]
@@ -14,6 +14,15 @@ def test_parse_valid_claude_json():
     assert result.cost_usd == 0.01
 
 
+def test_parse_claude_raw_bytes():
+    """Test parsing the raw stdout bytes the CLI run hands back."""
+    raw = '{"type": "result", "subtype": "success", "result": "héllo ✓"}'.encode("utf-8")
+    result = _parse_claude_response(raw)
+    assert result.success is True
+    assert result.text == "héllo ✓"
+    assert _parse_claude_response(b"\xff\xfe{").success is False
+
+
 def test_parse_claude_error():
     """Test parsing Claude error response."""
     json_str = '{"type": "result", "subtype": "error", "result": "Something went wrong"}'
@@ -53,3 +62,31 @@ def test_parse_codex_invalid_json():
     """Test parsing invalid Codex JSON returns None."""
     event = _parse_codex_event("not json {")
     assert event is None
+
+
+def test_parse_codex_event_raw_line():
+    """Test parsing an unstripped binary line straight from the pipe."""
+    event = _parse_codex_event(b'{"type": "turn.completed", "usage": {}}\r\n')
+    assert event is not None
+    assert event.type == "turn.completed"
+    assert _parse_codex_event(b"\n") is None
+    assert _parse_codex_event(b"Reading prompt from stdin...\n") is None
+
+
+def test_parse_codex_event_replaces_invalid_utf8():
+    """A bad byte inside an event becomes U+FFFD instead of losing the event."""
+    line = b'{"type": "item.completed", "item": {"type": "agent_message", "text": "caf\xe9 ok"}}\n'
+    event = _parse_codex_event(line)
+    assert event is not None
+    assert event.type == "item.completed"
+    assert event.text == "caf\ufffd ok"
+    assert _parse_codex_event(b'{"type": \xff') is None
+
+
+def test_parse_codex_event_skips_non_objects():
+    """Lines that can't be an event object come back as None."""
+    assert _parse_codex_event("") is None
+    assert _parse_codex_event("[1, 2]") is None
+    assert _parse_codex_event(b"  \t\n") is None
+    event = _parse_codex_event('  {"type": "turn.completed"}')
+    assert event is not None and event.type == "turn.completed"
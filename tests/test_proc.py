@@ -0,0 +1,64 @@
+"""
+Tests for the hardened subprocess runner (proc.py)
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from PowerSpawn.proc import run_captured, run_captured_async
+
+
+def test_run_captured_async_matches_sync():
+    cmd = [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"]
+    expected = run_captured(cmd, timeout=30, stdin_text="hello", shell=False)
+    result = asyncio.run(run_captured_async(cmd, timeout=30, stdin_text="hello", shell=False))
+    assert result == expected
+    assert result[0] == 0
+    assert result[1].strip() == "HELLO"
+    assert result[3] is False
+
+
+def test_run_captured_async_timeout_kills_child():
+    cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+    returncode, _, _, timed_out = asyncio.run(
+        run_captured_async(cmd, timeout=0.5, shell=False)
+    )
+    assert timed_out is True
+    assert returncode != 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX sessions")
+def test_run_captured_async_shell_child_gets_own_session():
+    cmd = subprocess.list2cmdline([sys.executable, "-c", "import os; print(os.getsid(0))"])
+    returncode, stdout, _, _ = asyncio.run(run_captured_async(cmd, timeout=30, shell=True))
+    assert returncode == 0
+    assert int(stdout) != os.getsid(0)
+
+
+def test_run_captured_raw_stdout_is_bytes():
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.buffer.write('  \u00e9  '.encode())"]
+    returncode, stdout, _, _ = run_captured(cmd, timeout=30, shell=False, raw_stdout=True)
+    assert returncode == 0
+    assert stdout == "\u00e9".encode()
+
+
+def test_resolve_command_execs_windows_exe_directly(monkeypatch):
+    from PowerSpawn import proc
+    monkeypatch.setattr(proc, "IS_WINDOWS", True)
+    paths = {"codex": r"C:\bin\codex.EXE", "copilot": r"C:\npm\copilot.cmd"}
+    monkeypatch.setattr(proc, "_which", paths.get)
+
+    assert proc.resolve_command(["codex", "exec"]) == ([r"C:\bin\codex.EXE", "exec"], False)
+    assert proc.resolve_command(["copilot", "-s"]) == (["copilot", "-s"], True)
+    assert proc.resolve_command(["missing"]) == (["missing"], True)
+    assert proc.resolve_command(["codex"], shell=True) == (["codex"], True)
+
+
+def test_resolve_command_posix_unchanged(monkeypatch):
+    from PowerSpawn import proc
+    monkeypatch.setattr(proc, "IS_WINDOWS", False)
+    assert proc.resolve_command(["claude", "-p"]) == (["claude", "-p"], False)